@@ -18,18 +18,30 @@ Usage:
     python main.py
 """
 
-import time
+import asyncio
+from datetime import timedelta
 
 from telemetryflow import TelemetryFlowBuilder
 from telemetryflow.application.commands import SpanKind
 
 
-def main() -> None:
+async def main() -> None:
     """Main function demonstrating SDK usage with TFO v2 API."""
     # Create the client using the builder pattern
-    # with_auto_configuration() loads settings from environment variables
+    # with_auto_configuration() loads settings from environment variables;
+    # get_or_create() reuses one client per endpoint and API key in the process
     # TFO v2 API is enabled by default
-    client = TelemetryFlowBuilder().with_auto_configuration().build()
+    client = (
+        TelemetryFlowBuilder()
+        .with_auto_configuration()
+        .with_batch_settings(
+            timeout=timedelta(seconds=1),
+            max_size=256,
+            max_queue_size=4096,
+            export_timeout=timedelta(seconds=10),
+        )
+        .get_or_create()
+    )
 
     # Initialize the SDK - this connects to the TelemetryFlow backend
     client.initialize()
@@ -117,7 +129,7 @@ def main() -> None:
         print(f"Started span: {span_id}")
 
         # Simulate some work
-        time.sleep(0.1)
+        await asyncio.sleep(0.1)
 
         # Add events to the span
         client.add_span_event(span_id, "checkpoint_1", {"progress": 50})
@@ -132,7 +144,7 @@ def main() -> None:
 
         with client.span("process_request", SpanKind.SERVER) as request_span:
             print(f"Processing request (span: {request_span})")
-            time.sleep(0.05)
+            await asyncio.sleep(0.05)
 
             # Add TFO v2 API context to span events
             client.add_span_event(
@@ -144,13 +156,13 @@ def main() -> None:
             # Nested span for database operation
             with client.span("database_query", SpanKind.CLIENT) as db_span:
                 print(f"Executing database query (span: {db_span})")
-                time.sleep(0.03)
+                await asyncio.sleep(0.03)
                 client.add_span_event(db_span, "query_executed", {"rows_returned": 10})
 
             # Nested span for cache operation
             with client.span("cache_lookup", SpanKind.CLIENT) as cache_span:
                 print(f"Looking up cache (span: {cache_span})")
-                time.sleep(0.01)
+                await asyncio.sleep(0.01)
                 client.add_span_event(cache_span, "cache_hit", {"key": "user:123"})
 
             client.add_span_event(request_span, "processing_complete")
@@ -166,11 +178,12 @@ def main() -> None:
         raise
 
     finally:
-        # Always shutdown the client to flush pending data
+        # Always shutdown the client to flush pending data. ashutdown runs the
+        # final export in a worker thread instead of blocking the event loop.
         print("\n--- Shutting Down ---")
-        client.shutdown()
+        await client.ashutdown()
         print("TelemetryFlow SDK shut down successfully!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -11,8 +11,11 @@ Usage:
     python main.py
 """
 
+import asyncio
+import functools
 import time
-from concurrent import futures
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
 from typing import Any
 
 from telemetryflow import TelemetryFlowBuilder
@@ -21,64 +24,91 @@ from telemetryflow.client import TelemetryFlowClient
 
 try:
     import grpc
-    from grpc import ServicerContext
+    import grpc.aio
 except ImportError:
     print("grpcio is required for this example. Install it with: pip install grpcio")
     exit(1)
 
 
-# Global client instance
-client: TelemetryFlowClient | None = None
+@functools.lru_cache(maxsize=256)
+def span_name(method: str) -> str:
+    """Return the server span name for a gRPC method, built once per method."""
+    return f"gRPC {method}"
 
 
-class TelemetryInterceptor(grpc.ServerInterceptor):
-    """gRPC server interceptor for TelemetryFlow instrumentation."""
+@functools.lru_cache(maxsize=256)
+def method_attributes(method: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Return the span and metric attributes for a gRPC method.
+
+    The dicts are built once per method and shared between calls. They must
+    not be mutated; the SDK copies attributes when it converts them.
+    """
+    return {"rpc.system": "grpc", "rpc.method": method}, {"method": method}
+
+
+class TelemetryInterceptor(grpc.aio.ServerInterceptor):
+    """Async gRPC server interceptor for TelemetryFlow instrumentation."""
 
     def __init__(self, telemetry_client: TelemetryFlowClient) -> None:
         """Initialize the interceptor."""
         self._client = telemetry_client
 
-    def intercept_service(
+    async def intercept_service(
         self,
-        continuation: Any,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
         handler_call_details: grpc.HandlerCallDetails,
-    ) -> Any:
-        """Intercept gRPC calls for instrumentation."""
+    ) -> grpc.RpcMethodHandler:
+        """Wrap unary-unary handlers so the span covers the whole RPC."""
+        handler = await continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        telemetry_client = self._client
         method = handler_call_details.method
+        behavior = handler.unary_unary
 
-        # Start span for the call
-        span_id = self._client.start_span(
-            f"gRPC {method}",
-            SpanKind.SERVER,
-            {
-                "rpc.system": "grpc",
-                "rpc.method": method,
-            },
-        )
+        async def instrumented(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            return await instrument_call(telemetry_client, method, behavior, request, context)
 
-        # Increment call counter
-        self._client.increment_counter(
-            "grpc.calls.total",
-            attributes={"method": method},
+        return grpc.unary_unary_rpc_method_handler(
+            instrumented,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
         )
 
-        start_time = time.time()
-
-        # Store span info for the handler
-        handler_call_details._telemetry_span_id = span_id  # type: ignore
-        handler_call_details._telemetry_start_time = start_time  # type: ignore
-
-        try:
-            return continuation(handler_call_details)
-        finally:
-            duration = time.time() - start_time
-            self._client.record_histogram(
-                "grpc.call.duration",
-                duration,
-                unit="s",
-                attributes={"method": method},
-            )
-            self._client.end_span(span_id)
+
+async def instrument_call(
+    telemetry_client: TelemetryFlowClient,
+    method: str,
+    behavior: Callable[[Any, Any], Awaitable[Any]],
+    request: Any,
+    context: Any,
+) -> Any:
+    """Run one RPC inside a server span and record its call metrics."""
+    span_attrs, method_attrs = method_attributes(method)
+    telemetry_client.increment_counter("grpc.calls.total", attributes=method_attrs)
+
+    span_id = telemetry_client.start_span(span_name(method), SpanKind.SERVER, span_attrs)
+    start_ns = time.perf_counter_ns()
+    error: Exception | None = None
+    try:
+        # grpc.aio runs every call in its own task, so the current span set
+        # here is only seen by this RPC
+        with telemetry_client.use_span(span_id):
+            return await behavior(request, context)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        telemetry_client.finish_request(
+            span_id,
+            (time.perf_counter_ns() - start_ns) / 1e9,
+            attributes=method_attrs,
+            duration_metric="grpc.call.duration",
+            error_metric="grpc.errors.total",
+            error=error,
+        )
 
 
 class GreeterServicer:
@@ -88,30 +118,26 @@ class GreeterServicer:
         """Initialize the servicer."""
         self._client = telemetry_client
 
-    def say_hello(self, name: str, _context: ServicerContext) -> str:
+    async def say_hello(self, name: str, _context: grpc.aio.ServicerContext) -> str:
         """Handle SayHello RPC."""
-        with self._client.span("grpc.handler.say_hello", SpanKind.INTERNAL) as span_id:
+        with self._client.span("grpc.handler.say_hello", SpanKind.INTERNAL):
             self._client.log_info(
                 f"SayHello called with name: {name}",
                 {"name": name},
             )
 
             # Simulate some work
-            time.sleep(0.05)
+            await asyncio.sleep(0.05)
 
             response = f"Hello, {name}!"
 
-            self._client.add_span_event(
-                span_id,
-                "response_prepared",
-                {"response_length": len(response)},
-            )
+            self._client.add_event("response_prepared", {"response_length": len(response)})
 
             return response
 
-    def say_goodbye(self, name: str, _context: ServicerContext) -> str:
+    async def say_goodbye(self, name: str, _context: grpc.aio.ServicerContext) -> str:
         """Handle SayGoodbye RPC."""
-        with self._client.span("grpc.handler.say_goodbye", SpanKind.INTERNAL) as span_id:
+        with self._client.span("grpc.handler.say_goodbye", SpanKind.INTERNAL):
             self._client.log_info(
                 f"SayGoodbye called with name: {name}",
                 {"name": name},
@@ -119,25 +145,52 @@ class GreeterServicer:
 
             # Simulate database lookup
             with self._client.span("database.user_lookup", SpanKind.CLIENT):
-                time.sleep(0.03)
+                await asyncio.sleep(0.03)
 
             response = f"Goodbye, {name}! See you soon!"
 
-            self._client.add_span_event(
-                span_id,
-                "response_prepared",
-                {"response_length": len(response)},
-            )
+            self._client.add_event("response_prepared", {"response_length": len(response)})
 
             return response
 
 
-def main() -> None:
-    """Main function to run the gRPC server example."""
-    global client
+def greeter_handler(servicer: GreeterServicer) -> grpc.GenericRpcHandler:
+    """
+    Build a generic RPC handler for the Greeter service.
+
+    Messages are plain UTF-8 strings, so no generated protobuf stubs are needed.
+    The server encodes str responses itself, so only requests need a
+    deserializer.
+    """
+    return grpc.method_handlers_generic_handler(
+        "greeter.Greeter",
+        {
+            "SayHello": grpc.unary_unary_rpc_method_handler(
+                servicer.say_hello,
+                request_deserializer=bytes.decode,
+            ),
+            "SayGoodbye": grpc.unary_unary_rpc_method_handler(
+                servicer.say_goodbye,
+                request_deserializer=bytes.decode,
+            ),
+        },
+    )
 
+
+async def main() -> None:
+    """Main function to run the gRPC server example."""
     # Initialize TelemetryFlow client
-    client = TelemetryFlowBuilder().with_auto_configuration().build()
+    client = (
+        TelemetryFlowBuilder()
+        .with_auto_configuration()
+        .with_batch_settings(
+            timeout=timedelta(seconds=1),
+            max_size=256,
+            max_queue_size=4096,
+            export_timeout=timedelta(seconds=10),
+        )
+        .get_or_create()
+    )
     client.initialize()
 
     print("TelemetryFlow SDK initialized!")
@@ -145,91 +198,36 @@ def main() -> None:
 
     # Create the gRPC server with telemetry interceptor
     interceptor = TelemetryInterceptor(client)
-    _server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10),
-        interceptors=[interceptor],
-    )
-
-    # Create servicer
-    servicer = GreeterServicer(client)
-
-    # Since we don't have protobuf definitions, we'll simulate the server
-    print("\ngRPC Server Example")
-    print("=" * 50)
-    print("\nThis example demonstrates gRPC instrumentation patterns.")
-    print("In a real application, you would:")
-    print("1. Define your proto files")
-    print("2. Generate Python stubs")
-    print("3. Implement your servicers")
-    print("4. Add the TelemetryInterceptor to your server")
-    print()
-
-    # Simulate some gRPC calls
-    print("Simulating gRPC calls...\n")
-
-    # Simulate SayHello calls
-    for name in ["Alice", "Bob", "Charlie"]:
-        span_id = client.start_span(
-            "gRPC /greeter.Greeter/SayHello",
-            SpanKind.SERVER,
-            {"rpc.system": "grpc", "rpc.method": "/greeter.Greeter/SayHello"},
+    server = grpc.aio.server(interceptors=[interceptor])
+    server.add_generic_rpc_handlers((greeter_handler(GreeterServicer(client)),))
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    print(f"gRPC server listening on localhost:{port}")
+
+    # Call the server through a real channel; all telemetry for these calls
+    # comes from the TelemetryInterceptor
+    print("\nCalling the Greeter service...\n")
+    async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+        say_hello = channel.unary_unary(
+            "/greeter.Greeter/SayHello",
+            request_serializer=str.encode,
+            response_deserializer=bytes.decode,
         )
-
-        client.increment_counter(
-            "grpc.calls.total",
-            attributes={"method": "/greeter.Greeter/SayHello"},
+        say_goodbye = channel.unary_unary(
+            "/greeter.Greeter/SayGoodbye",
+            request_serializer=str.encode,
+            response_deserializer=bytes.decode,
         )
 
-        start_time = time.time()
-
-        try:
-            # Simulate handler
-            response = servicer.say_hello(name, None)  # type: ignore
+        for name in ["Alice", "Bob", "Charlie"]:
+            response = await say_hello(name)
             print(f"SayHello({name}) -> {response}")
+            await asyncio.sleep(0.1)
 
-            duration = time.time() - start_time
-            client.record_histogram(
-                "grpc.call.duration",
-                duration,
-                unit="s",
-                attributes={"method": "/greeter.Greeter/SayHello"},
-            )
-        finally:
-            client.end_span(span_id)
-
-        time.sleep(0.1)
-
-    # Simulate SayGoodbye calls
-    for name in ["Alice", "Bob"]:
-        span_id = client.start_span(
-            "gRPC /greeter.Greeter/SayGoodbye",
-            SpanKind.SERVER,
-            {"rpc.system": "grpc", "rpc.method": "/greeter.Greeter/SayGoodbye"},
-        )
-
-        client.increment_counter(
-            "grpc.calls.total",
-            attributes={"method": "/greeter.Greeter/SayGoodbye"},
-        )
-
-        start_time = time.time()
-
-        try:
-            # Simulate handler
-            response = servicer.say_goodbye(name, None)  # type: ignore
+        for name in ["Alice", "Bob"]:
+            response = await say_goodbye(name)
             print(f"SayGoodbye({name}) -> {response}")
-
-            duration = time.time() - start_time
-            client.record_histogram(
-                "grpc.call.duration",
-                duration,
-                unit="s",
-                attributes={"method": "/greeter.Greeter/SayGoodbye"},
-            )
-        finally:
-            client.end_span(span_id)
-
-        time.sleep(0.1)
+            await asyncio.sleep(0.1)
 
     # Print final status
     print("\n--- Final Status ---")
@@ -238,10 +236,10 @@ def main() -> None:
     print(f"Logs sent: {status['logs_sent']}")
     print(f"Spans sent: {status['spans_sent']}")
 
-    # Shutdown
-    client.shutdown()
+    # Stop the server while pending telemetry is exported in a worker thread
+    await asyncio.gather(server.stop(grace=None), client.ashutdown())
     print("\nTelemetryFlow SDK shut down!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -13,10 +13,20 @@ Then make requests to:
     curl http://localhost:8080/
     curl http://localhost:8080/api/users
     curl http://localhost:8080/api/orders
+
+Install orjson (pip install orjson) for faster JSON responses; the example
+falls back to the standard library json module without it.
 """
 
+import asyncio
+import contextlib
+import functools
 import json
+import random
 import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import timedelta
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any
 
@@ -24,30 +34,98 @@ from telemetryflow import TelemetryFlowBuilder
 from telemetryflow.application.commands import SpanKind
 from telemetryflow.client import TelemetryFlowClient
 
-# Global client instance
-client: TelemetryFlowClient | None = None
+# Use orjson when it is installed: it serializes straight to bytes and is
+# several times faster than json.dumps for small payloads
+dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    dumps = orjson.dumps
+except ImportError:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes with the standard library."""
+        return json.dumps(obj).encode()
+
+
+# Global client instance, assigned by main() before the server accepts
+# requests. It is declared without a value so handlers need no None checks.
+client: TelemetryFlowClient
+
+# Mock data served by the API endpoints
+USERS = [
+    {"id": 1, "name": "Alice", "email": "alice@example.com"},
+    {"id": 2, "name": "Bob", "email": "bob@example.com"},
+]
+ORDERS = [
+    {"id": 101, "user_id": 1, "total": 99.99, "status": "shipped"},
+    {"id": 102, "user_id": 2, "total": 149.99, "status": "pending"},
+]
+
+# Response bodies that never change are encoded once at import time, so
+# serving them is a plain write instead of a serialization per request
+USERS_JSON = dumps({"users": USERS})
+ORDERS_JSON = dumps({"orders": ORDERS})
+# Probe endpoints hit by liveness/readiness checks several times a second.
+# They are counted but get no span or duration histogram.
+EXCLUDED_PATHS = frozenset({"/health", "/status"})
+
+STATIC_RESPONSES: dict[str, bytes] = {
+    "/": dumps({"message": "Welcome to TelemetryFlow HTTP Server!"}),
+    "/health": dumps({"status": "healthy"}),
+}
+
+
+@dataclass
+class _RequestState:
+    """Per-request state shared between a handler and its instrumentation."""
+
+    status_code: int = 200
+    error: Exception | None = None
+
+
+# Span names and metric attributes only depend on the route and status, so
+# they are built once and shared between requests. Shared dicts must not be
+# mutated; the SDK copies attributes when it converts them. The caches are
+# bounded because the request path is client-controlled.
+@functools.lru_cache(maxsize=256)
+def span_name(method: str, path: str) -> str:
+    """Return the server span name for a route."""
+    return f"HTTP {method} {path}"
+
+
+@functools.lru_cache(maxsize=256)
+def route_attributes(method: str, path: str) -> dict[str, Any]:
+    """Return the metric attributes for a route."""
+    return {"method": method, "path": path}
+
+
+@functools.lru_cache(maxsize=1024)
+def response_attributes(method: str, path: str, status_code: int) -> dict[str, Any]:
+    """Return the metric attributes for a route and response status."""
+    return {"method": method, "path": path, "status_code": status_code}
 
 
 class InstrumentedHandler(BaseHTTPRequestHandler):
     """HTTP handler with automatic telemetry instrumentation."""
 
-    def _get_headers(self) -> dict[str, str]:
-        """Extract headers as a dictionary."""
-        return {k.lower(): v for k, v in self.headers.items()}
-
     def _send_json_response(self, data: dict[str, Any], status: int = 200) -> None:
         """Send a JSON response."""
+        self._send_json_bytes(dumps(data), status)
+
+    def _send_json_bytes(self, body: bytes, status: int = 200) -> None:
+        """Send an already encoded JSON response."""
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
-
-    def _instrument_request(self, method: str) -> tuple[str, float]:
-        """Start instrumentation for a request."""
-        assert client is not None
+        self.wfile.write(body)
 
+    @contextlib.contextmanager
+    def _instrument(self, method: str) -> Iterator[_RequestState]:
+        """Instrument a request from start to finish in a single span."""
+        state = _RequestState()
         span_id = client.start_span(
-            f"HTTP {method} {self.path}",
+            span_name(method, self.path),
             SpanKind.SERVER,
             {
                 "http.method": method,
@@ -58,151 +136,130 @@ class InstrumentedHandler(BaseHTTPRequestHandler):
         )
 
         client.increment_counter(
-            "http.requests.total",
-            attributes={"method": method, "path": self.path},
-        )
-
-        return span_id, time.time()
-
-    def _finish_request(
-        self,
-        span_id: str,
-        start_time: float,
-        method: str,
-        status_code: int,
-        error: Exception | None = None,
-    ) -> None:
-        """Finish instrumentation for a request."""
-        assert client is not None
-
-        duration = time.time() - start_time
-
-        # Record duration histogram
-        client.record_histogram(
-            "http.request.duration",
-            duration,
-            unit="s",
-            attributes={
-                "method": method,
-                "path": self.path,
-                "status_code": status_code,
-            },
+            "http.requests.total", attributes=route_attributes(method, self.path)
         )
 
-        # Record errors
-        if status_code >= 400:
-            client.increment_counter(
-                "http.errors.total",
-                attributes={
-                    "method": method,
-                    "path": self.path,
-                    "status_code": status_code,
-                },
+        start_ns = time.perf_counter_ns()
+        try:
+            with client.use_span(span_id):
+                yield state
+        finally:
+            duration_ns = time.perf_counter_ns() - start_ns
+            status_code = state.status_code
+            client.finish_request(
+                span_id,
+                duration_ns / 1e9,
+                status_code=status_code,
+                attributes=response_attributes(method, self.path, status_code),
+                span_attributes={"http.status_code": status_code},
+                error=state.error,
             )
 
-        # Add response event and end span
-        client.add_span_event(
-            span_id,
-            "response_sent",
-            {"http.status_code": status_code, "duration_ms": duration * 1000},
-        )
-        client.end_span(span_id, error)
-
     def do_GET(self) -> None:  # noqa: N802
         """Handle GET requests."""
-        assert client is not None
-
-        span_id, start_time = self._instrument_request("GET")
-        status_code = 200
-        error: Exception | None = None
-
-        try:
-            if self.path == "/":
-                self._send_json_response({"message": "Welcome to TelemetryFlow HTTP Server!"})
-            elif self.path == "/api/users":
-                self._handle_users(span_id)
-            elif self.path == "/api/orders":
-                self._handle_orders(span_id)
-            elif self.path == "/health":
-                self._send_json_response({"status": "healthy"})
-            elif self.path == "/status":
-                self._send_json_response(client.get_status())
-            elif self.path == "/error":
-                # Simulate an error
-                status_code = 500
-                error = ValueError("Simulated error")
-                self._send_json_response({"error": "Internal server error"}, 500)
-                client.log_error("Simulated error occurred", {"path": self.path})
-            else:
-                status_code = 404
-                self._send_json_response({"error": "Not found"}, 404)
-
-        except Exception as e:
-            status_code = 500
-            error = e
-            self._send_json_response({"error": str(e)}, 500)
-            client.log_error(f"Request failed: {e}", {"path": self.path})
-
-        finally:
-            self._finish_request(span_id, start_time, "GET", status_code, error)
-
-    def _handle_users(self, parent_span_id: str) -> None:
+        if self.path in EXCLUDED_PATHS:
+            client.increment_counter(
+                "http.requests.total", attributes=route_attributes("GET", self.path)
+            )
+            self._serve_probe()
+            return
+
+        with self._instrument("GET") as request:
+            try:
+                static_body = STATIC_RESPONSES.get(self.path)
+                if static_body is not None:
+                    self._send_json_bytes(static_body)
+                elif self.path == "/api/users":
+                    self._handle_users()
+                elif self.path == "/api/orders":
+                    self._handle_orders()
+                elif self.path == "/error":
+                    # Simulate an error
+                    request.status_code = 500
+                    request.error = ValueError("Simulated error")
+                    self._send_json_response({"error": "Internal server error"}, 500)
+                    client.log_error("Simulated error occurred", {"path": self.path})
+                else:
+                    request.status_code = 404
+                    self._send_json_response({"error": "Not found"}, 404)
+
+            except Exception as e:
+                request.status_code = 500
+                request.error = e
+                self._send_json_response({"error": str(e)}, 500)
+                client.log_error(f"Request failed: {e}", {"path": self.path})
+
+    def _serve_probe(self) -> None:
+        """Serve an excluded probe endpoint without tracing it."""
+        if self.path == "/status":
+            self._send_json_response(client.get_status())
+        else:
+            self._send_json_bytes(STATIC_RESPONSES[self.path])
+
+    def _handle_users(self) -> None:
         """Handle /api/users endpoint with nested spans."""
-        assert client is not None
-
         # Database query span
-        with client.span("database.query.users", SpanKind.CLIENT) as db_span:
+        with client.span("database.query.users", SpanKind.CLIENT):
             # Simulate database query
             time.sleep(0.05)
-            client.add_span_event(db_span, "query_executed", {"table": "users"})
-
-            users = [
-                {"id": 1, "name": "Alice", "email": "alice@example.com"},
-                {"id": 2, "name": "Bob", "email": "bob@example.com"},
-            ]
-
-        client.add_span_event(parent_span_id, "users_fetched", {"count": len(users)})
-        self._send_json_response({"users": users})
+            client.add_event("query_executed", {"table": "users"})
 
-    def _handle_orders(self, parent_span_id: str) -> None:
-        """Handle /api/orders endpoint with nested spans."""
-        assert client is not None
+        client.add_event("users_fetched", {"count": len(USERS)})
+        self._send_json_bytes(USERS_JSON)
 
-        # Cache lookup span
-        with client.span("cache.lookup.orders", SpanKind.CLIENT) as cache_span:
-            time.sleep(0.01)
-            cache_hit = True
-            client.add_span_event(cache_span, "cache_checked", {"hit": cache_hit})
+    def _handle_orders(self) -> None:
+        """Handle /api/orders endpoint with a linked span on cache miss."""
+        # Cache lookups are cheap and frequent, so record them as an event on
+        # the request span rather than as a span of their own
+        time.sleep(0.01)
+        cache_hit = random.random() < 0.8
+        client.add_event("cache_checked", {"cache": "orders", "hit": cache_hit})
 
         if not cache_hit:
-            # Database query span (only if cache miss)
-            with client.span("database.query.orders", SpanKind.CLIENT) as db_span:
+            # Database query span (only on cache miss). It starts a new trace
+            # linked to the request span instead of nesting under it, so it is
+            # sampled as its own trace.
+            request_span_id = client.current_span_id()
+            with client.span(
+                "database.query.orders",
+                SpanKind.CLIENT,
+                links=[request_span_id] if request_span_id else None,
+                new_trace=True,
+            ):
                 time.sleep(0.08)
-                client.add_span_event(db_span, "query_executed", {"table": "orders"})
+                client.add_event("query_executed", {"table": "orders"})
 
-        orders = [
-            {"id": 101, "user_id": 1, "total": 99.99, "status": "shipped"},
-            {"id": 102, "user_id": 2, "total": 149.99, "status": "pending"},
-        ]
-
-        client.add_span_event(
-            parent_span_id,
-            "orders_fetched",
-            {"count": len(orders), "cached": cache_hit},
-        )
-        self._send_json_response({"orders": orders})
+        client.add_event("orders_fetched", {"count": len(ORDERS), "cached": cache_hit})
+        self._send_json_bytes(ORDERS_JSON)
 
     def log_message(self, format: str, *args: Any) -> None:
         """Override to suppress default logging."""
         pass
 
 
+async def shutdown(httpd: HTTPServer, telemetry_client: TelemetryFlowClient) -> None:
+    """Close the server socket while pending telemetry is exported."""
+    await asyncio.gather(asyncio.to_thread(httpd.server_close), telemetry_client.ashutdown())
+
+
 def main() -> None:
     """Start the HTTP server with telemetry."""
     global client
 
     # Initialize TelemetryFlow client
-    client = TelemetryFlowBuilder().with_auto_configuration().build()
+    client = (
+        TelemetryFlowBuilder()
+        .with_auto_configuration()
+        # Record one in twenty traces
+        .with_sampling_ratio(0.05)
+        .with_batch_settings(
+            timeout=timedelta(seconds=1),
+            max_size=256,
+            max_queue_size=4096,
+            export_timeout=timedelta(seconds=10),
+        )
+        .get_or_create()
+    )
     client.initialize()
 
     print("TelemetryFlow SDK initialized!")
@@ -220,9 +277,9 @@ def main() -> None:
     print("\nAvailable endpoints:")
     print("  GET /           - Welcome message")
     print("  GET /api/users  - List users (with DB span)")
-    print("  GET /api/orders - List orders (with cache span)")
-    print("  GET /health     - Health check")
-    print("  GET /status     - SDK status")
+    print("  GET /api/orders - List orders (cache event, linked DB span on miss)")
+    print("  GET /health     - Health check (counted, not traced)")
+    print("  GET /status     - SDK status (counted, not traced)")
     print("  GET /error      - Simulate error")
     print("\nPress Ctrl+C to stop")
 
@@ -232,9 +289,9 @@ def main() -> None:
         print("\n\nShutting down...")
     finally:
         client.log_info("HTTP server stopping")
-        httpd.shutdown()
-        client.flush()
-        client.shutdown()
+        # serve_forever has returned, so nothing is left to stop; the final
+        # flush overlaps with closing the socket
+        asyncio.run(shutdown(httpd, client))
         print("Server stopped.")
 
 
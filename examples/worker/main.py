@@ -12,14 +12,41 @@ Usage:
 
 import random
 import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from queue import Empty, Queue
 from threading import Event, Thread
+from typing import Any
 
 from telemetryflow import TelemetryFlowBuilder
+from telemetryflow.application import ClassPool
 from telemetryflow.application.commands import SpanKind
 from telemetryflow.client import TelemetryFlowClient
+from telemetryflow.runtime import MpmcRing
+
+
+@dataclass(frozen=True, slots=True)
+class EmailPayload:
+    """Payload of an email job."""
+
+    to: str = "unknown"
+    subject: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationPayload:
+    """Payload of a notification job."""
+
+    channel: str = "default"
+    user_id: str = "unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class ReportPayload:
+    """Payload of a report job."""
+
+    format: str = "pdf"
+    report_type: str = "summary"
 
 
 @dataclass
@@ -28,127 +55,162 @@ class Job:
 
     id: str
     type: str
-    payload: dict
+    # The payload class of the job type, read through slot attributes
+    # instead of dict lookups; a plain dict for untyped jobs
+    payload: Any
     created_at: datetime
 
 
+# Jobs are recycled once processed instead of allocated per submission
+job_pool: ClassPool[Job] = ClassPool(Job, capacity=16)
+
+SAMPLE_JOBS: list[tuple[str, str, Any]] = [
+    ("job-001", "email", EmailPayload(to="user@example.com", subject="Welcome!")),
+    ("job-002", "notification", NotificationPayload(channel="mobile", user_id="user-123")),
+    ("job-003", "report", ReportPayload(format="pdf", report_type="sales")),
+    ("job-004", "email", EmailPayload(to="admin@example.com", subject="Alert")),
+    ("job-005", "generic", {"data": "test"}),
+    ("job-006", "error", {}),  # This will fail
+    ("job-007", "notification", NotificationPayload(channel="email", user_id="user-456")),
+]
+
+
 class Worker:
     """Background worker that processes jobs with telemetry."""
 
-    def __init__(self, client: TelemetryFlowClient, worker_id: str) -> None:
+    def __init__(
+        self, client: TelemetryFlowClient, worker_id: str, job_queue: MpmcRing[Job]
+    ) -> None:
         """Initialize the worker."""
         self.client = client
         self.worker_id = worker_id
-        self.job_queue: Queue[Job] = Queue()
-        self.stop_event = Event()
+        self.job_queue = job_queue
+        self.jobs_done = 0  # written by the worker thread only
         self.jobs_processed = 0
         self.jobs_failed = 0
+        # Attribute dicts that only depend on the job type, built once and
+        # shared by every job of that type. They must be treated as
+        # immutable; the SDK copies attributes when it converts them.
+        self.attributes = {"worker_id": worker_id}
+        self._attr_cache: dict[str, dict[str, str]] = {}
+        self._span_attr_cache: dict[str, dict[str, str]] = {}
+        # Job type -> processor; unknown types fall back to the generic one
+        self._dispatch: dict[str, Callable[[Job, str], None]] = {
+            "email": self._process_email_job,
+            "notification": self._process_notification_job,
+            "report": self._process_report_job,
+            "error": self._raise_error,
+        }
+
+    def _attrs(self, job_type: str) -> dict[str, str]:
+        """Return the shared metric and log attributes for a job type."""
+        attrs = self._attr_cache.get(job_type)
+        if attrs is None:
+            attrs = {"job_type": job_type, "worker_id": self.worker_id}
+            self._attr_cache[job_type] = attrs
+        return attrs
+
+    def _span_attrs(self, job: Job) -> dict[str, str]:
+        """Return the span attributes for a job: the shared base plus its ID."""
+        base = self._span_attr_cache.get(job.type)
+        if base is None:
+            base = {"job.type": job.type, "worker.id": self.worker_id}
+            self._span_attr_cache[job.type] = base
+        return {"job.id": job.id, **base}
 
     def process_job(self, job: Job) -> None:
         """Process a single job with full instrumentation."""
-        # Start a span for the job
-        with self.client.span(
-            f"job.process.{job.type}",
-            SpanKind.CONSUMER,
-            {
-                "job.id": job.id,
-                "job.type": job.type,
-                "worker.id": self.worker_id,
-            },
-        ) as span_id:
-            start_time = time.time()
+        # Start a span for the job. Metrics, logs and span events recorded
+        # while processing are buffered and dispatched as one batch per type.
+        with (
+            self.client.span(
+                f"job.process.{job.type}",
+                SpanKind.CONSUMER,
+                self._span_attrs(job),
+            ) as span_id,
+            self.client.batch(),
+        ):
+            start_ns = time.perf_counter_ns()
+            attrs = self._attrs(job.type)
 
             try:
-                self.client.log_info(
-                    f"Processing job {job.id}",
-                    {"job_type": job.type, "worker": self.worker_id},
-                )
+                self.client.log_info(f"Processing job {job.id}", attrs)
 
                 # Increment job counter
                 self.client.increment_counter(
                     "worker.jobs.started",
-                    attributes={"job_type": job.type, "worker_id": self.worker_id},
+                    attributes=attrs,
                 )
 
                 # Process based on job type
-                if job.type == "email":
-                    self._process_email_job(job, span_id)
-                elif job.type == "notification":
-                    self._process_notification_job(job, span_id)
-                elif job.type == "report":
-                    self._process_report_job(job, span_id)
-                elif job.type == "error":
-                    raise ValueError("Simulated job failure")
-                else:
-                    self._process_generic_job(job, span_id)
+                handler = self._dispatch.get(job.type, self._process_generic_job)
+                handler(job, span_id)
 
                 # Record success
-                duration = time.time() - start_time
+                duration_ns = time.perf_counter_ns() - start_ns
+                duration_s = duration_ns / 1_000_000_000
                 self.client.increment_counter(
                     "worker.jobs.completed",
-                    attributes={"job_type": job.type, "worker_id": self.worker_id},
+                    attributes=attrs,
                 )
                 self.client.record_histogram(
                     "worker.job.duration",
-                    duration,
+                    duration_s,
                     unit="s",
-                    attributes={"job_type": job.type, "worker_id": self.worker_id},
+                    attributes=attrs,
                 )
                 self.client.add_span_event(
-                    span_id, "job_completed", {"duration_ms": duration * 1000}
+                    span_id, "job_completed", {"duration_ms": duration_ns / 1_000_000}
                 )
 
                 self.jobs_processed += 1
                 self.client.log_info(
                     f"Job {job.id} completed",
-                    {"duration_s": duration, "job_type": job.type},
+                    {"duration_s": duration_s, "job_type": job.type},
                 )
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration_s = (time.perf_counter_ns() - start_ns) / 1_000_000_000
                 self.jobs_failed += 1
 
                 self.client.increment_counter(
                     "worker.jobs.failed",
-                    attributes={"job_type": job.type, "worker_id": self.worker_id},
+                    attributes=attrs,
                 )
                 self.client.log_error(
                     f"Job {job.id} failed: {e}",
-                    {"job_type": job.type, "duration_s": duration},
+                    {"job_type": job.type, "duration_s": duration_s},
                 )
                 self.client.add_span_event(span_id, "job_failed", {"error": str(e)})
                 raise
 
     def _process_email_job(self, job: Job, _parent_span_id: str) -> None:
         """Process an email job."""
+        payload: EmailPayload = job.payload
         with self.client.span("email.send", SpanKind.CLIENT) as span_id:
             # Simulate email sending
             time.sleep(random.uniform(0.1, 0.3))
             self.client.add_span_event(
                 span_id,
                 "email_sent",
-                {
-                    "recipient": job.payload.get("to", "unknown"),
-                    "subject": job.payload.get("subject", ""),
-                },
+                {"recipient": payload.to, "subject": payload.subject},
             )
 
     def _process_notification_job(self, job: Job, _parent_span_id: str) -> None:
         """Process a notification job."""
+        payload: NotificationPayload = job.payload
         with self.client.span("notification.push", SpanKind.CLIENT) as span_id:
             # Simulate push notification
             time.sleep(random.uniform(0.05, 0.15))
             self.client.add_span_event(
                 span_id,
                 "notification_sent",
-                {
-                    "channel": job.payload.get("channel", "default"),
-                    "user_id": job.payload.get("user_id", "unknown"),
-                },
+                {"channel": payload.channel, "user_id": payload.user_id},
             )
 
     def _process_report_job(self, job: Job, _parent_span_id: str) -> None:
         """Process a report generation job."""
+        payload: ReportPayload = job.payload
         # Database query
         with self.client.span("database.query", SpanKind.CLIENT) as span_id:
             time.sleep(random.uniform(0.2, 0.5))
@@ -160,7 +222,7 @@ class Worker:
             self.client.add_span_event(
                 span_id,
                 "report_generated",
-                {"format": job.payload.get("format", "pdf"), "pages": 15},
+                {"format": payload.format, "pages": 15},
             )
 
         # Upload to storage
@@ -168,6 +230,10 @@ class Worker:
             time.sleep(random.uniform(0.1, 0.2))
             self.client.add_span_event(span_id, "file_uploaded", {"size_kb": 2048})
 
+    def _raise_error(self, _job: Job, _parent_span_id: str) -> None:
+        """Process an error job by failing."""
+        raise ValueError("Simulated job failure")
+
     def _process_generic_job(self, job: Job, parent_span_id: str) -> None:
         """Process a generic job."""
         time.sleep(random.uniform(0.1, 0.3))
@@ -183,44 +249,101 @@ class Worker:
         self.client.record_gauge(
             "worker.active",
             1.0,
-            attributes={"worker_id": self.worker_id},
+            attributes=self.attributes,
         )
 
-        while not self.stop_event.is_set():
+        # get() returns None once the pool closes the queue
+        while (job := self.job_queue.get()) is not None:
             try:
-                job = self.job_queue.get(timeout=1.0)
-                try:
-                    self.process_job(job)
-                except Exception:
-                    pass  # Error already logged
-                finally:
-                    self.job_queue.task_done()
-            except Empty:
-                # No job available, continue waiting
-                pass
+                self.process_job(job)
+            except Exception:
+                pass  # Error already logged
+            finally:
+                job_pool.release(job)
+                self.jobs_done += 1
 
         self.client.record_gauge(
             "worker.active",
             0.0,
-            attributes={"worker_id": self.worker_id},
+            attributes=self.attributes,
         )
         self.client.log_info(
             f"Worker {self.worker_id} stopped",
             {"jobs_processed": self.jobs_processed, "jobs_failed": self.jobs_failed},
         )
 
-    def submit_job(self, job: Job) -> None:
-        """Submit a job to the queue."""
+
+class WorkerPool:
+    """Worker threads draining one shared job queue."""
+
+    def __init__(self, client: TelemetryFlowClient, n_workers: int = 4) -> None:
+        """Initialize the pool and its workers."""
+        self.client = client
+        # Any number of threads submit and process, so jobs go through a
+        # multi-producer/multi-consumer ring with per-slot locks
+        self.job_queue: MpmcRing[Job] = MpmcRing(1024)
+        self.workers = [
+            Worker(client, f"worker-{n}", self.job_queue) for n in range(1, n_workers + 1)
+        ]
+        self.stop_event = Event()
+        self.jobs_submitted = 0  # written by the producer only
+        self._pool_attrs = {"worker_pool.size": str(n_workers)}
+        self._threads: list[Thread] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted jobs that have not finished yet."""
+        return self.jobs_submitted - sum(worker.jobs_done for worker in self.workers)
+
+    @property
+    def jobs_processed(self) -> int:
+        """Number of jobs completed by all workers."""
+        return sum(worker.jobs_processed for worker in self.workers)
+
+    @property
+    def jobs_failed(self) -> int:
+        """Number of jobs failed by all workers."""
+        return sum(worker.jobs_failed for worker in self.workers)
+
+    def start(self) -> None:
+        """Start the worker threads and the gauge sampler."""
+        self._threads = [Thread(target=worker.run, daemon=True) for worker in self.workers]
+        for thread in self._threads:
+            thread.start()
+        Thread(target=self._sample_gauges, daemon=True).start()
+
+    def submit(self, job: Job) -> None:
+        """Submit a job to the shared queue."""
+        self.jobs_submitted += 1
         self.job_queue.put(job)
-        self.client.record_gauge(
-            "worker.queue.size",
-            float(self.job_queue.qsize()),
-            attributes={"worker_id": self.worker_id},
-        )
 
-    def stop(self) -> None:
-        """Stop the worker."""
+    def submit_batch(self, jobs: Iterable[Job]) -> None:
+        """Submit several jobs with one reservation of queue positions."""
+        batch = list(jobs)
+        self.jobs_submitted += len(batch)
+        self.job_queue.put_many(batch)
+
+    def _sample_gauges(self) -> None:
+        """Record the queue size and activity gauges once per second until stopped."""
+        while not self.stop_event.wait(1.0):
+            self.client.record_gauge(
+                "worker.queue.size",
+                float(len(self.job_queue)),
+                attributes=self._pool_attrs,
+            )
+            for worker in self.workers:
+                self.client.record_gauge(
+                    "worker.active",
+                    1.0,
+                    attributes=worker.attributes,
+                )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the workers once the queued jobs are taken and wait for them."""
         self.stop_event.set()
+        self.job_queue.close()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
 
 
 def main() -> None:
@@ -232,69 +355,35 @@ def main() -> None:
     print("TelemetryFlow SDK initialized!")
     print(f"Service: {client.config.service_name}")
 
-    # Create worker
-    worker = Worker(client, "worker-1")
-
-    # Start worker thread
-    worker_thread = Thread(target=worker.run, daemon=True)
-    worker_thread.start()
-
-    print("\nWorker started. Submitting sample jobs...")
-
-    # Submit sample jobs
-    sample_jobs = [
-        Job(
-            "job-001",
-            "email",
-            {"to": "user@example.com", "subject": "Welcome!"},
-            datetime.now(),
-        ),
-        Job(
-            "job-002",
-            "notification",
-            {"channel": "mobile", "user_id": "user-123"},
-            datetime.now(),
-        ),
-        Job(
-            "job-003",
-            "report",
-            {"format": "pdf", "report_type": "sales"},
-            datetime.now(),
-        ),
-        Job(
-            "job-004",
-            "email",
-            {"to": "admin@example.com", "subject": "Alert"},
-            datetime.now(),
-        ),
-        Job("job-005", "generic", {"data": "test"}, datetime.now()),
-        Job("job-006", "error", {}, datetime.now()),  # This will fail
-        Job(
-            "job-007",
-            "notification",
-            {"channel": "email", "user_id": "user-456"},
-            datetime.now(),
-        ),
-    ]
-
-    for job in sample_jobs:
-        worker.submit_job(job)
-        print(f"Submitted job: {job.id} ({job.type})")
-        time.sleep(0.5)
+    # Create and start the worker pool
+    pool = WorkerPool(client, n_workers=4)
+    pool.start()
+
+    print(f"\n{len(pool.workers)} workers started. Submitting sample jobs...")
+
+    # Submit the sample jobs as one batch. A job belongs to the workers once
+    # submitted, so they are announced first.
+    job_pool.prefill()
+    for job_id, job_type, _ in SAMPLE_JOBS:
+        print(f"Submitting job: {job_id} ({job_type})")
+    pool.submit_batch(
+        job_pool.acquire(id=job_id, type=job_type, payload=payload, created_at=datetime.now())
+        for job_id, job_type, payload in SAMPLE_JOBS
+    )
 
     # Wait for jobs to complete
     print("\nWaiting for jobs to complete...")
-    worker.job_queue.join()
+    while pool.pending:
+        time.sleep(0.1)
 
-    # Stop worker
-    print("\nStopping worker...")
-    worker.stop()
-    worker_thread.join(timeout=5.0)
+    # Stop workers
+    print("\nStopping workers...")
+    pool.stop()
 
     # Print final status
     print("\n--- Final Status ---")
-    print(f"Jobs processed: {worker.jobs_processed}")
-    print(f"Jobs failed: {worker.jobs_failed}")
+    print(f"Jobs processed: {pool.jobs_processed}")
+    print(f"Jobs failed: {pool.jobs_failed}")
 
     status = client.get_status()
     print(f"Metrics sent: {status['metrics_sent']}")
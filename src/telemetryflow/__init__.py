@@ -12,14 +12,30 @@ Features:
     - Full OpenTelemetry compatibility
 """
 
-from typing import Any
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from telemetryflow.builder import TelemetryFlowBuilder
-from telemetryflow.client import TelemetryFlowClient
-from telemetryflow.domain.config import Protocol, SignalType, TelemetryConfig
-from telemetryflow.domain.credentials import Credentials
 from telemetryflow.version import __version__
 
+if TYPE_CHECKING:
+    from telemetryflow.builder import TelemetryFlowBuilder
+    from telemetryflow.client import TelemetryFlowClient
+    from telemetryflow.domain.config import Protocol, SignalType, TelemetryConfig
+    from telemetryflow.domain.credentials import Credentials
+
+# Public names loaded on first access (PEP 562), so `import telemetryflow`
+# does not pull in the client and OpenTelemetry until they are used
+_LAZY_EXPORTS: dict[str, str] = {
+    "TelemetryFlowBuilder": "telemetryflow.builder",
+    "TelemetryFlowClient": "telemetryflow.client",
+    "TelemetryConfig": "telemetryflow.domain.config",
+    "Protocol": "telemetryflow.domain.config",
+    "SignalType": "telemetryflow.domain.config",
+    "Credentials": "telemetryflow.domain.credentials",
+}
+
 __all__ = [
     # Main classes
     "TelemetryFlowClient",
@@ -39,14 +55,33 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name and cache it in the module namespace."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including names not loaded yet."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
+
 # Convenience constructors
 def new_client(config: TelemetryConfig) -> TelemetryFlowClient:
     """Create a new TelemetryFlow client with the given configuration."""
+    from telemetryflow.client import TelemetryFlowClient
+
     return TelemetryFlowClient(config)
 
 
 def new_from_env() -> TelemetryFlowClient:
     """Create a new TelemetryFlow client from environment variables."""
+    from telemetryflow.builder import TelemetryFlowBuilder
+
     return TelemetryFlowBuilder().with_auto_configuration().build()
 
 
@@ -57,6 +92,8 @@ def new_simple(
     service_name: str,
 ) -> TelemetryFlowClient:
     """Create a new TelemetryFlow client with minimal configuration."""
+    from telemetryflow.builder import TelemetryFlowBuilder
+
     return (
         TelemetryFlowBuilder()
         .with_api_key(api_key_id, api_key_secret)
@@ -1,15 +1,19 @@
 """Application layer for TelemetryFlow SDK - CQRS commands and queries."""
 
+from telemetryflow.application._pool import ClassPool
 from telemetryflow.application.commands import (
     AddSpanEventCommand,
+    AddSpanEventsBatchCommand,
     Command,
     CommandBus,
     CommandHandler,
     EmitBatchLogsCommand,
     EmitLogCommand,
     EndSpanCommand,
+    FinishRequestCommand,
     FlushTelemetryCommand,
     InitializeSDKCommand,
+    RecordBatchMetricsCommand,
     RecordCounterCommand,
     RecordGaugeCommand,
     RecordHistogramCommand,
@@ -47,11 +51,15 @@ __all__ = [
     "RecordCounterCommand",
     "RecordGaugeCommand",
     "RecordHistogramCommand",
+    "RecordBatchMetricsCommand",
     "EmitLogCommand",
     "EmitBatchLogsCommand",
     "StartSpanCommand",
     "EndSpanCommand",
     "AddSpanEventCommand",
+    "AddSpanEventsBatchCommand",
+    "FinishRequestCommand",
+    "ClassPool",
     # Queries
     "Query",
     "QueryHandler",
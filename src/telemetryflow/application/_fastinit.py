@@ -0,0 +1,65 @@
+"""Generated positional initializers for dataclass commands."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import MISSING, fields
+from typing import Any
+
+
+def positional_initializer[T](cls: type[T], *names: str) -> Callable[..., T]:
+    """
+    Generate an initializer that sets the given fields from positional arguments.
+
+    The dataclass ``__init__`` accepts every field by keyword and checks each
+    one for a default. For a fixed call shape the work is known up front, so
+    this compiles a function that assigns ``names`` in order, fills every
+    other field straight from its default or default factory, and runs
+    ``__post_init__`` validation when the class has it (skipped under ``-O``).
+
+    Args:
+        cls: The dataclass type
+        *names: Fields passed positionally, in call order
+
+    Returns:
+        A function ``init(instance, *values)`` that initializes an instance,
+        fresh from ``cls.__new__`` or a pool, and returns it
+
+    Raises:
+        ValueError: If a name is not a field of cls
+        TypeError: If a field left out of names has no default
+
+    Example:
+        >>> init_counter = positional_initializer(
+        ...     RecordCounterCommand, "name", "value", "attributes"
+        ... )
+        >>> command = init_counter(pool.take(), "requests.total", 1, {})
+    """
+    cls_fields = fields(cls)  # type: ignore[arg-type]
+    unknown = set(names) - {f.name for f in cls_fields}
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no fields {sorted(unknown)}")
+
+    namespace: dict[str, Any] = {}
+    body: list[str] = []
+    for f in cls_fields:
+        if f.name in names:
+            body.append(f"    self.{f.name} = {f.name}")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            body.append(f"    self.{f.name} = _factory_{f.name}()")
+        elif f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            body.append(f"    self.{f.name} = _default_{f.name}")
+        else:
+            raise TypeError(f"{cls.__name__}.{f.name} has no default")
+    if __debug__ and hasattr(cls, "__post_init__"):
+        body.append("    self.__post_init__()")
+    body.append("    return self")
+
+    # The source only contains field names, which are valid identifiers
+    source = "\n".join([f"def init(self, {', '.join(names)}):", *body])
+    exec(source, namespace)
+    init: Callable[..., T] = namespace["init"]
+    init.__qualname__ = f"{cls.__name__}.positional_init"
+    return init
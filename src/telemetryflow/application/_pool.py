@@ -0,0 +1,109 @@
+"""Bounded object pools for short-lived dataclass instances."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import fields
+from typing import Any
+
+
+class ClassPool[T]:
+    """
+    Bounded free list of reusable dataclass instances.
+
+    ``acquire()`` reinitializes a pooled instance in place by running the
+    dataclass ``__init__`` on it (defaults and ``__post_init__`` validation
+    included), and falls back to constructing a new instance when the pool
+    is empty. ``release()`` clears the instance and returns it to the pool.
+
+    deque.append and deque.pop are atomic, so the pool can be shared between
+    threads without a lock. An instance must not be used after it has been
+    released.
+
+    Example:
+        >>> pool = ClassPool(RecordCounterCommand, capacity=64)
+        >>> command = pool.acquire(name="requests.total", value=1)
+        >>> try:
+        ...     handler.handle(command)
+        ... finally:
+        ...     pool.release(command)
+    """
+
+    def __init__(self, cls: type[T], capacity: int = 64) -> None:
+        """
+        Create an empty pool.
+
+        Args:
+            cls: The dataclass type to pool
+            capacity: Maximum number of idle instances kept for reuse
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._cls = cls
+        self._fields = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+        self._capacity = capacity
+        self._free: deque[T] = deque(maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of idle instances kept for reuse."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Return the number of idle instances."""
+        return len(self._free)
+
+    def prefill(self) -> None:
+        """Fill the pool up to its capacity with blank instances."""
+        cls = self._cls
+        for _ in range(self._capacity - len(self._free)):
+            self._free.append(cls.__new__(cls))
+
+    def acquire(self, **fields: Any) -> T:
+        """
+        Return an instance initialized with the given fields.
+
+        Args:
+            **fields: Constructor arguments for the dataclass
+
+        Returns:
+            A pooled or newly constructed instance
+        """
+        try:
+            instance = self._free.pop()
+        except IndexError:
+            return self._cls(**fields)
+        self._cls.__init__(instance, **fields)
+        return instance
+
+    def take(self) -> T:
+        """
+        Return an idle instance without initializing it.
+
+        The caller must initialize every field before use, typically with a
+        positional initializer.
+
+        Returns:
+            A pooled instance, or a blank one from ``__new__`` when the pool
+            is empty
+        """
+        try:
+            return self._free.pop()
+        except IndexError:
+            cls = self._cls
+            return cls.__new__(cls)
+
+    def release(self, instance: T) -> None:
+        """
+        Return an instance to the pool.
+
+        Its fields are cleared so the pool does not keep attribute dicts or
+        exceptions alive. When the pool is full the oldest idle instance is
+        discarded.
+
+        Args:
+            instance: An instance previously returned by acquire()
+        """
+        for name in self._fields:
+            delattr(instance, name)
+        self._free.append(instance)
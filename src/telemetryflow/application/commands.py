@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Protocol
 
 from telemetryflow.domain.config import TelemetryConfig
 
+# Shared read-only default for attribute fields, so commands recorded
+# without attributes do not each allocate an empty dict
+EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
 
 class SeverityLevel(str, Enum):
     """Log severity levels."""
@@ -31,11 +38,21 @@ class SpanKind(str, Enum):
     CONSUMER = "consumer"
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
-    """Base class for all commands."""
+    """
+    Base class for all commands.
+
+    Subclasses use ``__slots__`` and validate their fields in
+    ``__post_init__``; validation is skipped when Python runs with ``-O``.
+    """
+
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    @property
+    def timestamp(self) -> datetime:
+        """Return the creation time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000, UTC)
 
     @property
     def command_type(self) -> str:
@@ -72,107 +89,131 @@ class CommandBus:
 # Lifecycle Commands
 
 
-@dataclass
+@dataclass(slots=True)
 class InitializeSDKCommand(Command):
     """Command to initialize the SDK."""
 
     config: TelemetryConfig = field(default=None)  # type: ignore[assignment]
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if self.config is None:
             raise ValueError("config is required for InitializeSDKCommand")
 
 
-@dataclass
+@dataclass(slots=True)
 class ShutdownSDKCommand(Command):
     """Command to shut down the SDK gracefully."""
 
     timeout_seconds: float = 30.0
 
 
-@dataclass
+@dataclass(slots=True)
 class FlushTelemetryCommand(Command):
     """Command to force flush all pending telemetry data."""
 
-    pass
+    timeout_seconds: float = 30.0
 
 
 # Metric Commands
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordMetricCommand(Command):
     """Command to record a generic metric."""
 
     name: str = ""
     value: float = 0.0
     unit: str = ""
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.name:
             raise ValueError("name is required for RecordMetricCommand")
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordCounterCommand(Command):
     """Command to increment a counter metric."""
 
     name: str = ""
     value: int = 1
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.name:
             raise ValueError("name is required for RecordCounterCommand")
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordGaugeCommand(Command):
     """Command to record a gauge metric."""
 
     name: str = ""
     value: float = 0.0
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.name:
             raise ValueError("name is required for RecordGaugeCommand")
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordHistogramCommand(Command):
     """Command to record a histogram metric."""
 
     name: str = ""
     value: float = 0.0
     unit: str = ""
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.name:
             raise ValueError("name is required for RecordHistogramCommand")
 
 
+MetricCommand = (
+    RecordMetricCommand | RecordCounterCommand | RecordGaugeCommand | RecordHistogramCommand
+)
+
+
+@dataclass(slots=True)
+class RecordBatchMetricsCommand(Command):
+    """Command to record multiple metric values."""
+
+    metrics: list[MetricCommand] = field(default_factory=list)
+
+
 # Log Commands
 
 
-@dataclass
+@dataclass(slots=True)
 class EmitLogCommand(Command):
     """Command to emit a log entry."""
 
     message: str = ""
     severity: SeverityLevel = SeverityLevel.INFO
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
     trace_id: str | None = None
     span_id: str | None = None
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.message:
             raise ValueError("message is required for EmitLogCommand")
 
 
-@dataclass
+@dataclass(slots=True)
 class EmitBatchLogsCommand(Command):
     """Command to emit multiple log entries."""
 
@@ -182,21 +223,26 @@ class EmitBatchLogsCommand(Command):
 # Trace Commands
 
 
-@dataclass
+@dataclass(slots=True)
 class StartSpanCommand(Command):
     """Command to start a new trace span."""
 
     name: str = ""
     kind: SpanKind = SpanKind.INTERNAL
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
     parent_span_id: str | None = None
+    links: list[str] = field(default_factory=list)
+    # Start a new trace, ignoring any span current in the OpenTelemetry context
+    new_trace: bool = False
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.name:
             raise ValueError("name is required for StartSpanCommand")
 
 
-@dataclass
+@dataclass(slots=True)
 class EndSpanCommand(Command):
     """Command to end a trace span."""
 
@@ -204,20 +250,64 @@ class EndSpanCommand(Command):
     error: Exception | None = None
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.span_id:
             raise ValueError("span_id is required for EndSpanCommand")
 
 
-@dataclass
+@dataclass(slots=True)
 class AddSpanEventCommand(Command):
     """Command to add an event to a span."""
 
     span_id: str = ""
     name: str = ""
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.span_id:
             raise ValueError("span_id is required for AddSpanEventCommand")
         if not self.name:
             raise ValueError("name is required for AddSpanEventCommand")
+
+
+@dataclass(slots=True)
+class AddSpanEventsBatchCommand(Command):
+    """Command to add multiple events to active spans."""
+
+    events: list[AddSpanEventCommand] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class FinishRequestCommand(Command):
+    """
+    Command to record the outcome of a request and end its span.
+
+    Records the request duration, counts the request as an error when it
+    failed (status code >= 400 or an error is set), applies the span
+    attributes and ends the span in a single dispatch.
+    """
+
+    span_id: str = ""
+    duration: float = 0.0
+    status_code: int = 0
+    attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
+    span_attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES
+    duration_metric: str = "http.request.duration"
+    error_metric: str | None = "http.errors.total"
+    error: Exception | None = None
+
+    def __post_init__(self) -> None:
+        if not __debug__:
+            return
+        if not self.span_id:
+            raise ValueError("span_id is required for FinishRequestCommand")
+        if not self.duration_metric:
+            raise ValueError("duration_metric is required for FinishRequestCommand")
+
+    @property
+    def failed(self) -> bool:
+        """Whether the request counts as an error."""
+        return self.error is not None or self.status_code >= 400
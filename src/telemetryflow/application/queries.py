@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
@@ -16,11 +17,21 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
-@dataclass
+@dataclass(slots=True)
 class Query:
-    """Base class for all queries."""
+    """
+    Base class for all queries.
 
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    Subclasses use ``__slots__`` and validate their fields in
+    ``__post_init__``; validation is skipped when Python runs with ``-O``.
+    """
+
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the creation time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000, UTC)
 
     @property
     def query_type(self) -> str:
@@ -57,7 +68,7 @@ class QueryBus:
 # Query Result Types
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricQueryResult:
     """Result of a metric query."""
 
@@ -68,7 +79,7 @@ class MetricQueryResult:
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedMetricResult:
     """Result of an aggregated metric query."""
 
@@ -83,7 +94,7 @@ class AggregatedMetricResult:
     end_time: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """A single log entry."""
 
@@ -95,7 +106,7 @@ class LogEntry:
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogsQueryResult:
     """Result of a logs query."""
 
@@ -104,7 +115,7 @@ class LogsQueryResult:
     has_more: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SpanInfo:
     """Information about a trace span."""
 
@@ -120,7 +131,7 @@ class SpanInfo:
     events: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceQueryResult:
     """Result of a trace query."""
 
@@ -129,7 +140,7 @@ class TraceQueryResult:
     duration_ms: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthQueryResult:
     """Result of a health query."""
 
@@ -139,7 +150,7 @@ class HealthQueryResult:
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-@dataclass
+@dataclass(slots=True)
 class SDKStatusResult:
     """Result of an SDK status query."""
 
@@ -158,7 +169,7 @@ class SDKStatusResult:
 # Queries
 
 
-@dataclass
+@dataclass(slots=True)
 class GetMetricQuery(Query):
     """Query to get a specific metric."""
 
@@ -166,11 +177,13 @@ class GetMetricQuery(Query):
     attributes: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.name:
             raise ValueError("name is required for GetMetricQuery")
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateMetricsQuery(Query):
     """Query to get aggregated metrics."""
 
@@ -180,11 +193,13 @@ class AggregateMetricsQuery(Query):
     attributes: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.name:
             raise ValueError("name is required for AggregateMetricsQuery")
 
 
-@dataclass
+@dataclass(slots=True)
 class GetLogsQuery(Query):
     """Query to get logs."""
 
@@ -196,18 +211,20 @@ class GetLogsQuery(Query):
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GetTraceQuery(Query):
     """Query to get a specific trace."""
 
     trace_id: str = ""
 
     def __post_init__(self) -> None:
+        if not __debug__:
+            return
         if not self.trace_id:
             raise ValueError("trace_id is required for GetTraceQuery")
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchTracesQuery(Query):
     """Query to search traces."""
 
@@ -221,14 +238,14 @@ class SearchTracesQuery(Query):
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class GetHealthQuery(Query):
     """Query to get health status."""
 
     include_components: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class GetSDKStatusQuery(Query):
     """Query to get SDK status."""
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+from dataclasses import asdict, dataclass
 
 from telemetryflow.version import __version__, platform_info, python_version
 
@@ -29,16 +30,31 @@ ASCII_BANNER = r"""
 
 """
 
+_ASCII_STRIPPED = ASCII_BANNER.strip()
+
 COMPACT_BANNER = r"""
 ╔═══════════════════════════════════════════════════════════════╗
 ║           TelemetryFlow Python SDK                            ║
 ╚═══════════════════════════════════════════════════════════════╝
 """
 
+# Filled from the BannerConfig fields by generate_compact()
+_COMPACT_TEMPLATE = """\
+╔═══════════════════════════════════════════════════════════════╗
+║  {product_name:^57}  ║
+║  Version: {version:<48}  ║
+║  {website:<57}  ║
+╚═══════════════════════════════════════════════════════════════╝"""
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BannerConfig:
-    """Configuration for banner display."""
+    """
+    Configuration for banner display.
+
+    Instances are immutable and hashable so rendered banners can be cached
+    per configuration.
+    """
 
     product_name: str = "TelemetryFlow Python SDK"
     version: str = __version__
@@ -48,6 +64,7 @@ class BannerConfig:
     show_platform: bool = True
 
 
+@functools.lru_cache(maxsize=8)
 def generate(config: BannerConfig | None = None) -> str:
     """
     Generate a full banner with ASCII art.
@@ -62,7 +79,7 @@ def generate(config: BannerConfig | None = None) -> str:
         config = BannerConfig()
 
     lines = [
-        ASCII_BANNER.strip(),
+        _ASCII_STRIPPED,
         "",
         f"  {config.product_name} v{config.version}",
         f"  {config.website}",
@@ -79,6 +96,7 @@ def generate(config: BannerConfig | None = None) -> str:
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=8)
 def generate_compact(config: BannerConfig | None = None) -> str:
     """
     Generate a compact banner.
@@ -92,15 +110,10 @@ def generate_compact(config: BannerConfig | None = None) -> str:
     if config is None:
         config = BannerConfig()
 
-    return f"""
-╔═══════════════════════════════════════════════════════════════╗
-║  {config.product_name:^57}  ║
-║  Version: {config.version:<48}  ║
-║  {config.website:<57}  ║
-╚═══════════════════════════════════════════════════════════════╝
-""".strip()
+    return _COMPACT_TEMPLATE.format_map(asdict(config))
 
 
+@functools.lru_cache(maxsize=8)
 def generate_minimal(config: BannerConfig | None = None) -> str:
     """
     Generate a minimal single-line banner.
@@ -2,19 +2,102 @@
 
 from __future__ import annotations
 
-import contextlib
 import os
+from collections.abc import Callable, Iterator, Mapping
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from telemetryflow.client import TelemetryFlowClient
 from telemetryflow.domain.config import Protocol, TelemetryConfig
-from telemetryflow.domain.credentials import Credentials, CredentialsError
+from telemetryflow.domain.credentials import KEY_ID_PREFIX, KEY_SECRET_PREFIX, Credentials
 
 if TYPE_CHECKING:
     pass
 
 
+# Spellings accepted without lowercasing a copy of the value first
+_TRUE = frozenset({"true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"})
+_PROTOCOLS = {
+    "grpc": Protocol.GRPC,
+    "Grpc": Protocol.GRPC,
+    "GRPC": Protocol.GRPC,
+    "http": Protocol.HTTP,
+    "Http": Protocol.HTTP,
+    "HTTP": Protocol.HTTP,
+}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value; any other spelling is false."""
+    return value in _TRUE
+
+
+def _parse_protocol(value: str) -> Protocol:
+    """Parse the protocol name; anything but "http" selects gRPC."""
+    return _PROTOCOLS.get(value, Protocol.GRPC)
+
+
+def _parse_seconds(value: str) -> timedelta:
+    """Parse a whole number of seconds."""
+    return timedelta(seconds=int(value))
+
+
+def _parse_milliseconds(value: str) -> timedelta:
+    """Parse a whole number of milliseconds."""
+    return timedelta(milliseconds=int(value))
+
+
+def _parse_rate_limit(value: str) -> int:
+    """Parse a rate limit; 0 or less means unlimited and is rejected."""
+    rate_limit = int(value)
+    if rate_limit <= 0:
+        raise ValueError("rate limit is unlimited")
+    return rate_limit
+
+
+def _compile_auto_spec(
+    spec: tuple[tuple[str, str, Callable[[str], Any], Any], ...],
+) -> Callable[[TelemetryFlowBuilder, Mapping[str, str]], None]:
+    """
+    Generate a straight-line function that applies an auto-configuration spec.
+
+    Each row becomes its own lookup, parse and assignment, so applying the
+    spec runs no loop, tuple unpacking or setattr() calls.
+
+    Args:
+        spec: Rows of (attribute, variable, parser, default)
+
+    Returns:
+        A function ``configure(builder, env)``
+    """
+    namespace: dict[str, Any] = {}
+    body: list[str] = []
+    for i, (attr, key, parse, default) in enumerate(spec):
+        namespace[f"_parse_{i}"] = parse
+        namespace[f"_default_{i}"] = default
+        body.append(f"    v = env.get({key!r})")
+        if default is None:
+            body.append("    if v is not None:")
+        else:
+            body.append("    if v is None:")
+            body.append(f"        self.{attr} = _default_{i}")
+            body.append("    else:")
+        body.append("        try:")
+        body.append(f"            self.{attr} = _parse_{i}(v)")
+        body.append("        except ValueError:")
+        body.append("            pass")
+
+    # The source only contains attribute names and repr() of variable names
+    source = "\n".join(["def configure(self, env):", *body])
+    exec(source, namespace)
+    configure: Callable[[TelemetryFlowBuilder, Mapping[str, str]], None] = namespace["configure"]
+    return configure
+
+
+# Compiled from TelemetryFlowBuilder._AUTO_SPEC on first use
+_auto_configure: Callable[[TelemetryFlowBuilder, Mapping[str, str]], None] | None = None
+
+
 class BuilderError(Exception):
     """Exception raised for builder configuration errors."""
 
@@ -84,12 +167,69 @@ class TelemetryFlowBuilder:
     # Environment variable names - Rate Limiting
     ENV_RATE_LIMIT = "TELEMETRYFLOW_RATE_LIMIT"
 
+    # Settings loaded by with_auto_configuration: (attribute, variable,
+    # parser, default). The default is used as-is when the variable is
+    # unset; None keeps the attribute's current value, as does a ValueError
+    # from the parser. Compiled once by _compile_auto_spec.
+    _AUTO_SPEC: ClassVar[tuple[tuple[str, str, Callable[[str], Any], Any], ...]] = (
+        ("_insecure", ENV_INSECURE, _parse_bool, False),
+        ("_protocol", ENV_PROTOCOL, _parse_protocol, Protocol.GRPC),
+        ("_compression", ENV_COMPRESSION, _parse_bool, False),
+        ("_timeout", ENV_TIMEOUT, _parse_seconds, timedelta(seconds=10)),
+        ("_retry_enabled", ENV_RETRY_ENABLED, _parse_bool, True),
+        ("_max_retries", ENV_MAX_RETRIES, int, 3),
+        ("_retry_backoff", ENV_RETRY_BACKOFF, _parse_milliseconds, timedelta(milliseconds=500)),
+        ("_batch_timeout", ENV_BATCH_TIMEOUT, _parse_milliseconds, timedelta(milliseconds=5000)),
+        ("_batch_max_size", ENV_BATCH_MAX_SIZE, int, 512),
+        ("_enable_traces", ENV_ENABLE_TRACES, _parse_bool, True),
+        ("_enable_metrics", ENV_ENABLE_METRICS, _parse_bool, True),
+        ("_enable_logs", ENV_ENABLE_LOGS, _parse_bool, True),
+        ("_exemplars_enabled", ENV_ENABLE_EXEMPLARS, _parse_bool, True),
+        ("_rate_limit", ENV_RATE_LIMIT, _parse_rate_limit, None),
+    )
+
     # Default values
     DEFAULT_ENDPOINT = "api.telemetryflow.id:4317"
     DEFAULT_SERVICE_VERSION = "1.0.0"
     DEFAULT_SERVICE_NAMESPACE = "telemetryflow"
     DEFAULT_ENVIRONMENT = "production"
 
+    # timedelta is immutable, so every builder shares these
+    _DEFAULT_TIMEOUT = timedelta(seconds=30)
+    _DEFAULT_RETRY_BACKOFF = timedelta(seconds=5)
+    _DEFAULT_BATCH_TIMEOUT = timedelta(seconds=10)
+    _DEFAULT_BATCH_EXPORT_TIMEOUT = timedelta(seconds=30)
+
+    __slots__ = (
+        "_api_key_id",
+        "_api_key_secret",
+        "_endpoint",
+        "_service_name",
+        "_service_version",
+        "_service_namespace",
+        "_environment",
+        "_protocol",
+        "_insecure",
+        "_timeout",
+        "_enable_metrics",
+        "_enable_logs",
+        "_enable_traces",
+        "_exemplars_enabled",
+        "_collector_id",
+        "_custom_attributes",
+        "_compression",
+        "_retry_enabled",
+        "_max_retries",
+        "_retry_backoff",
+        "_batch_timeout",
+        "_batch_max_size",
+        "_batch_max_queue_size",
+        "_batch_export_timeout",
+        "_rate_limit",
+        "_exporter_pool_size",
+        "_sampling_ratio",
+    )
+
     def __init__(self) -> None:
         """Initialize the builder with default values."""
         self._api_key_id: str | None = None
@@ -101,21 +241,44 @@ class TelemetryFlowBuilder:
         self._environment: str = self.DEFAULT_ENVIRONMENT
         self._protocol: Protocol = Protocol.GRPC
         self._insecure: bool = False
-        self._timeout: timedelta = timedelta(seconds=30)
+        self._timeout: timedelta = self._DEFAULT_TIMEOUT
         self._enable_metrics: bool = True
         self._enable_logs: bool = True
         self._enable_traces: bool = True
         self._exemplars_enabled: bool = True
         self._collector_id: str | None = None
-        self._custom_attributes: dict[str, str] = {}
+        self._custom_attributes: dict[str, str] | None = None  # created on first use
         self._compression: bool = True
         self._retry_enabled: bool = True
         self._max_retries: int = 3
-        self._retry_backoff: timedelta = timedelta(seconds=5)
-        self._batch_timeout: timedelta = timedelta(seconds=10)
+        self._retry_backoff: timedelta = self._DEFAULT_RETRY_BACKOFF
+        self._batch_timeout: timedelta = self._DEFAULT_BATCH_TIMEOUT
         self._batch_max_size: int = 512
+        self._batch_max_queue_size: int = 2048
+        self._batch_export_timeout: timedelta = self._DEFAULT_BATCH_EXPORT_TIMEOUT
         self._rate_limit: int = 1000
-        self._errors: list[str] = []
+        self._exporter_pool_size: int = 10
+        self._sampling_ratio: float = 1.0
+
+    @classmethod
+    def _from_kwargs(cls, **settings: Any) -> TelemetryFlowBuilder:
+        """
+        Create a builder with settings assigned directly, bypassing the setters.
+
+        Args:
+            **settings: Values keyed by attribute name without the leading
+                underscore, e.g. ``service_name="api"``
+
+        Returns:
+            A new builder
+
+        Raises:
+            AttributeError: If a name is not a builder setting
+        """
+        builder = cls()
+        for name, value in settings.items():
+            setattr(builder, f"_{name}", value)
+        return builder
 
     # API Key Configuration
 
@@ -134,17 +297,22 @@ class TelemetryFlowBuilder:
         self._api_key_secret = key_secret
         return self
 
-    def with_api_key_from_env(self) -> TelemetryFlowBuilder:
+    def with_api_key_from_env(self, env: Mapping[str, str] | None = None) -> TelemetryFlowBuilder:
         """
         Load API key from environment variables.
 
         Uses TELEMETRYFLOW_API_KEY_ID and TELEMETRYFLOW_API_KEY_SECRET.
 
+        Args:
+            env: Mapping to read instead of os.environ
+
         Returns:
             Self for method chaining
         """
-        self._api_key_id = os.environ.get(self.ENV_API_KEY_ID)
-        self._api_key_secret = os.environ.get(self.ENV_API_KEY_SECRET)
+        if env is None:
+            env = os.environ
+        self._api_key_id = env.get(self.ENV_API_KEY_ID)
+        self._api_key_secret = env.get(self.ENV_API_KEY_SECRET)
         return self
 
     # Endpoint Configuration
@@ -162,16 +330,21 @@ class TelemetryFlowBuilder:
         self._endpoint = endpoint
         return self
 
-    def with_endpoint_from_env(self) -> TelemetryFlowBuilder:
+    def with_endpoint_from_env(self, env: Mapping[str, str] | None = None) -> TelemetryFlowBuilder:
         """
         Load endpoint from environment variable.
 
         Uses TELEMETRYFLOW_ENDPOINT, falls back to default if not set.
 
+        Args:
+            env: Mapping to read instead of os.environ
+
         Returns:
             Self for method chaining
         """
-        self._endpoint = os.environ.get(self.ENV_ENDPOINT, self.DEFAULT_ENDPOINT)
+        if env is None:
+            env = os.environ
+        self._endpoint = env.get(self.ENV_ENDPOINT, self.DEFAULT_ENDPOINT)
         return self
 
     # Service Configuration
@@ -192,19 +365,22 @@ class TelemetryFlowBuilder:
             self._service_version = version
         return self
 
-    def with_service_from_env(self) -> TelemetryFlowBuilder:
+    def with_service_from_env(self, env: Mapping[str, str] | None = None) -> TelemetryFlowBuilder:
         """
         Load service configuration from environment variables.
 
         Uses TELEMETRYFLOW_SERVICE_NAME and TELEMETRYFLOW_SERVICE_VERSION.
 
+        Args:
+            env: Mapping to read instead of os.environ
+
         Returns:
             Self for method chaining
         """
-        self._service_name = os.environ.get(self.ENV_SERVICE_NAME)
-        self._service_version = os.environ.get(
-            self.ENV_SERVICE_VERSION, self.DEFAULT_SERVICE_VERSION
-        )
+        if env is None:
+            env = os.environ
+        self._service_name = env.get(self.ENV_SERVICE_NAME)
+        self._service_version = env.get(self.ENV_SERVICE_VERSION, self.DEFAULT_SERVICE_VERSION)
         return self
 
     def with_service_namespace(self, namespace: str) -> TelemetryFlowBuilder:
@@ -220,14 +396,21 @@ class TelemetryFlowBuilder:
         self._service_namespace = namespace
         return self
 
-    def with_service_namespace_from_env(self) -> TelemetryFlowBuilder:
+    def with_service_namespace_from_env(
+        self, env: Mapping[str, str] | None = None
+    ) -> TelemetryFlowBuilder:
         """
         Load service namespace from environment variable.
 
+        Args:
+            env: Mapping to read instead of os.environ
+
         Returns:
             Self for method chaining
         """
-        self._service_namespace = os.environ.get(
+        if env is None:
+            env = os.environ
+        self._service_namespace = env.get(
             self.ENV_SERVICE_NAMESPACE, self.DEFAULT_SERVICE_NAMESPACE
         )
         return self
@@ -247,19 +430,26 @@ class TelemetryFlowBuilder:
         self._environment = environment
         return self
 
-    def with_environment_from_env(self) -> TelemetryFlowBuilder:
+    def with_environment_from_env(
+        self, env: Mapping[str, str] | None = None
+    ) -> TelemetryFlowBuilder:
         """
         Load environment from environment variables.
 
         Checks TELEMETRYFLOW_ENVIRONMENT, ENV, and ENVIRONMENT in order.
 
+        Args:
+            env: Mapping to read instead of os.environ
+
         Returns:
             Self for method chaining
         """
+        if env is None:
+            env = os.environ
         self._environment = (
-            os.environ.get(self.ENV_ENVIRONMENT)
-            or os.environ.get("ENV")
-            or os.environ.get("ENVIRONMENT")
+            env.get(self.ENV_ENVIRONMENT)
+            or env.get("ENV")
+            or env.get("ENVIRONMENT")
             or self.DEFAULT_ENVIRONMENT
         )
         return self
@@ -286,7 +476,8 @@ class TelemetryFlowBuilder:
         Returns:
             Self for method chaining
         """
-        return self.with_protocol(Protocol.GRPC)
+        self._protocol = Protocol.GRPC
+        return self
 
     def with_http(self) -> TelemetryFlowBuilder:
         """
@@ -295,7 +486,8 @@ class TelemetryFlowBuilder:
         Returns:
             Self for method chaining
         """
-        return self.with_protocol(Protocol.HTTP)
+        self._protocol = Protocol.HTTP
+        return self
 
     def with_insecure(self, insecure: bool = True) -> TelemetryFlowBuilder:
         """
@@ -338,7 +530,10 @@ class TelemetryFlowBuilder:
         Returns:
             Self for method chaining
         """
-        return self.with_signals(metrics=True, logs=False, traces=False)
+        self._enable_metrics = True
+        self._enable_logs = False
+        self._enable_traces = False
+        return self
 
     def with_logs_only(self) -> TelemetryFlowBuilder:
         """
@@ -347,7 +542,10 @@ class TelemetryFlowBuilder:
         Returns:
             Self for method chaining
         """
-        return self.with_signals(metrics=False, logs=True, traces=False)
+        self._enable_metrics = False
+        self._enable_logs = True
+        self._enable_traces = False
+        return self
 
     def with_traces_only(self) -> TelemetryFlowBuilder:
         """
@@ -356,7 +554,10 @@ class TelemetryFlowBuilder:
         Returns:
             Self for method chaining
         """
-        return self.with_signals(metrics=False, logs=False, traces=True)
+        self._enable_metrics = False
+        self._enable_logs = False
+        self._enable_traces = True
+        return self
 
     def with_exemplars(self, enabled: bool = True) -> TelemetryFlowBuilder:
         """
@@ -399,14 +600,21 @@ class TelemetryFlowBuilder:
         self._collector_id = collector_id
         return self
 
-    def with_collector_id_from_env(self) -> TelemetryFlowBuilder:
+    def with_collector_id_from_env(
+        self, env: Mapping[str, str] | None = None
+    ) -> TelemetryFlowBuilder:
         """
         Load collector ID from environment variable.
 
+        Args:
+            env: Mapping to read instead of os.environ
+
         Returns:
             Self for method chaining
         """
-        self._collector_id = os.environ.get(self.ENV_COLLECTOR_ID)
+        if env is None:
+            env = os.environ
+        self._collector_id = env.get(self.ENV_COLLECTOR_ID)
         return self
 
     def with_custom_attribute(self, key: str, value: str) -> TelemetryFlowBuilder:
@@ -420,6 +628,8 @@ class TelemetryFlowBuilder:
         Returns:
             Self for method chaining
         """
+        if self._custom_attributes is None:
+            self._custom_attributes = {}
         self._custom_attributes[key] = value
         return self
 
@@ -433,6 +643,8 @@ class TelemetryFlowBuilder:
         Returns:
             Self for method chaining
         """
+        if self._custom_attributes is None:
+            self._custom_attributes = {}
         self._custom_attributes.update(attributes)
         return self
 
@@ -473,14 +685,24 @@ class TelemetryFlowBuilder:
         return self
 
     def with_batch_settings(
-        self, timeout: timedelta | None = None, max_size: int | None = None
+        self,
+        timeout: timedelta | None = None,
+        max_size: int | None = None,
+        max_queue_size: int | None = None,
+        export_timeout: timedelta | None = None,
     ) -> TelemetryFlowBuilder:
         """
         Configure batch export settings.
 
+        The span processor starts an export as soon as ``max_size`` spans are
+        queued, so a small batch size with a large queue absorbs bursts without
+        waiting for the scheduled delay.
+
         Args:
             timeout: Batch export timeout
             max_size: Maximum batch size
+            max_queue_size: Maximum number of spans buffered before dropping
+            export_timeout: Maximum time allowed for a single export
 
         Returns:
             Self for method chaining
@@ -489,6 +711,10 @@ class TelemetryFlowBuilder:
             self._batch_timeout = timeout
         if max_size:
             self._batch_max_size = max_size
+        if max_queue_size:
+            self._batch_max_queue_size = max_queue_size
+        if export_timeout:
+            self._batch_export_timeout = export_timeout
         return self
 
     def with_rate_limit(self, rate_limit: int) -> TelemetryFlowBuilder:
@@ -504,89 +730,74 @@ class TelemetryFlowBuilder:
         self._rate_limit = rate_limit
         return self
 
-    # Auto Configuration
-
-    def with_auto_configuration(self) -> TelemetryFlowBuilder:
+    def with_sampling_ratio(self, ratio: float) -> TelemetryFlowBuilder:
         """
-        Load all configuration from environment variables.
+        Set the fraction of new traces to record.
 
-        This is a convenience method that loads all supported TELEMETRYFLOW_*
-        environment variables for TFO-Collector v1.1.2 compatibility.
+        Sampling is head-based and parent-based: the decision is taken when
+        a root span starts and inherited by its children. Unsampled spans
+        are not exported.
+
+        Args:
+            ratio: Value between 0.0 (record nothing) and 1.0 (record all)
 
         Returns:
             Self for method chaining
         """
-        # Core settings
-        self.with_api_key_from_env()
-        self.with_endpoint_from_env()
-        self.with_service_from_env()
-        self.with_service_namespace_from_env()
-        self.with_environment_from_env()
-        self.with_collector_id_from_env()
-
-        # Insecure mode
-        insecure_str = os.environ.get(self.ENV_INSECURE, "false")
-        self._insecure = insecure_str.lower() == "true"
-
-        # Protocol settings
-        protocol_str = os.environ.get(self.ENV_PROTOCOL, "grpc")
-        if protocol_str.lower() == "http":
-            self._protocol = Protocol.HTTP
-        else:
-            self._protocol = Protocol.GRPC
-
-        # Compression
-        compression_str = os.environ.get(self.ENV_COMPRESSION, "false")
-        self._compression = compression_str.lower() == "true"
-
-        # Timeout (in seconds)
-        timeout_str = os.environ.get(self.ENV_TIMEOUT, "10")
-        with contextlib.suppress(ValueError):
-            self._timeout = timedelta(seconds=int(timeout_str))
+        self._sampling_ratio = ratio
+        return self
 
-        # Retry settings
-        retry_enabled_str = os.environ.get(self.ENV_RETRY_ENABLED, "true")
-        self._retry_enabled = retry_enabled_str.lower() == "true"
+    def with_exporter_pool_size(self, pool_size: int) -> TelemetryFlowBuilder:
+        """
+        Set the connection pool size of the HTTP exporters.
 
-        max_retries_str = os.environ.get(self.ENV_MAX_RETRIES, "3")
-        with contextlib.suppress(ValueError):
-            self._max_retries = int(max_retries_str)
+        gRPC exporters multiplex requests over a single HTTP/2 channel and
+        are not affected by this setting.
 
-        retry_backoff_str = os.environ.get(self.ENV_RETRY_BACKOFF, "500")
-        with contextlib.suppress(ValueError):
-            self._retry_backoff = timedelta(milliseconds=int(retry_backoff_str))
+        Args:
+            pool_size: Maximum number of pooled connections per exporter
 
-        # Batch settings
-        batch_timeout_str = os.environ.get(self.ENV_BATCH_TIMEOUT, "5000")
-        with contextlib.suppress(ValueError):
-            self._batch_timeout = timedelta(milliseconds=int(batch_timeout_str))
+        Returns:
+            Self for method chaining
+        """
+        self._exporter_pool_size = pool_size
+        return self
 
-        batch_max_size_str = os.environ.get(self.ENV_BATCH_MAX_SIZE, "512")
-        with contextlib.suppress(ValueError):
-            self._batch_max_size = int(batch_max_size_str)
+    # Auto Configuration
 
-        # Signal settings
-        enable_traces_str = os.environ.get(self.ENV_ENABLE_TRACES, "true")
-        self._enable_traces = enable_traces_str.lower() == "true"
+    def with_auto_configuration(self, env: Mapping[str, str] | None = None) -> TelemetryFlowBuilder:
+        """
+        Load all configuration from environment variables.
 
-        enable_metrics_str = os.environ.get(self.ENV_ENABLE_METRICS, "true")
-        self._enable_metrics = enable_metrics_str.lower() == "true"
+        This is a convenience method that loads all supported TELEMETRYFLOW_*
+        environment variables for TFO-Collector v1.1.2 compatibility.
 
-        enable_logs_str = os.environ.get(self.ENV_ENABLE_LOGS, "true")
-        self._enable_logs = enable_logs_str.lower() == "true"
+        Each supported variable is looked up by name. A miss on os.environ
+        costs about a microsecond, since it encodes the key and raises
+        KeyError internally. Callers that build several clients can pass one
+        ``dict(os.environ)`` snapshot, where a miss is a plain dict probe.
 
-        enable_exemplars_str = os.environ.get(self.ENV_ENABLE_EXEMPLARS, "true")
-        self._exemplars_enabled = enable_exemplars_str.lower() == "true"
+        Args:
+            env: Mapping to read instead of os.environ
 
-        # Rate limit (0 = unlimited)
-        rate_limit_str = os.environ.get(self.ENV_RATE_LIMIT, "0")
-        try:
-            rate_limit = int(rate_limit_str)
-            if rate_limit > 0:
-                self._rate_limit = rate_limit
-        except ValueError:
-            pass
+        Returns:
+            Self for method chaining
+        """
+        if env is None:
+            env = os.environ
 
+        # Core settings
+        self.with_api_key_from_env(env)
+        self.with_endpoint_from_env(env)
+        self.with_service_from_env(env)
+        self.with_service_namespace_from_env(env)
+        self.with_environment_from_env(env)
+        self.with_collector_id_from_env(env)
+
+        global _auto_configure
+        if _auto_configure is None:
+            _auto_configure = _compile_auto_spec(TelemetryFlowBuilder._AUTO_SPEC)
+        _auto_configure(self, env)
         return self
 
     # Build Methods
@@ -601,22 +812,48 @@ class TelemetryFlowBuilder:
         Raises:
             BuilderError: If configuration is invalid
         """
-        self._validate()
+        return TelemetryFlowClient(self._build_config())
+
+    def get_or_create(self) -> TelemetryFlowClient:
+        """
+        Return the process-wide client for this endpoint and API key.
+
+        Subsystems that configure the same endpoint and API key share one
+        client, and with it one set of exporters and background threads.
+        Every call takes a reference that must be released with exactly one
+        ``shutdown()``; the client is torn down when the last reference is
+        released.
 
-        if self._errors:
-            raise BuilderError("; ".join(self._errors))
+        Returns:
+            Shared TelemetryFlowClient instance
 
-        # Create credentials
-        try:
-            credentials = Credentials.create(
-                key_id=self._api_key_id or "",
-                key_secret=self._api_key_secret or "",
-            )
-        except CredentialsError as e:
-            raise BuilderError(str(e)) from e
+        Raises:
+            BuilderError: If configuration is invalid
+            ValueError: If a shared client for this endpoint and API key
+                already exists with a different configuration
+        """
+        return TelemetryFlowClient.get_or_create(self._build_config())
+
+    def _build_config(self) -> TelemetryConfig:
+        """Validate the builder state and create the configuration."""
+        key_id = self._api_key_id
+        key_secret = self._api_key_secret
+        # Only a failed check pays for collecting the error messages
+        if not (
+            key_id
+            and key_id.startswith(KEY_ID_PREFIX)
+            and key_secret
+            and key_secret.startswith(KEY_SECRET_PREFIX)
+            and self._endpoint
+            and self._service_name
+        ):
+            raise BuilderError("; ".join(self._iter_errors()))
+
+        # The checks above are the ones Credentials would repeat
+        credentials = Credentials._unchecked(key_id, key_secret)
 
         # Create configuration
-        config = TelemetryConfig(
+        return TelemetryConfig(
             credentials=credentials,
             endpoint=self._endpoint,
             service_name=self._service_name or "",
@@ -634,15 +871,17 @@ class TelemetryFlowBuilder:
             service_version=self._service_version,
             service_namespace=self._service_namespace,
             environment=self._environment,
-            custom_attributes=self._custom_attributes,
+            custom_attributes=self._custom_attributes or {},
             batch_timeout=self._batch_timeout,
             batch_max_size=self._batch_max_size,
+            batch_max_queue_size=self._batch_max_queue_size,
+            batch_export_timeout=self._batch_export_timeout,
+            exporter_pool_size=self._exporter_pool_size,
+            sampling_ratio=self._sampling_ratio,
             collector_id=self._collector_id,
             rate_limit=self._rate_limit,
         )
 
-        return TelemetryFlowClient(config)
-
     def must_build(self) -> TelemetryFlowClient:
         """
         Build the client, raising an exception on failure.
@@ -657,18 +896,20 @@ class TelemetryFlowBuilder:
         """
         return self.build()
 
-    def _validate(self) -> None:
-        """Validate the configuration."""
-        self._errors = []
-
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield a message for each missing or malformed required setting."""
         if not self._api_key_id:
-            self._errors.append("API key ID is required")
+            yield "API key ID is required"
+        elif not self._api_key_id.startswith(KEY_ID_PREFIX):
+            yield f"API key ID must start with '{KEY_ID_PREFIX}'"
         if not self._api_key_secret:
-            self._errors.append("API key secret is required")
+            yield "API key secret is required"
+        elif not self._api_key_secret.startswith(KEY_SECRET_PREFIX):
+            yield f"API key secret must start with '{KEY_SECRET_PREFIX}'"
         if not self._endpoint:
-            self._errors.append("Endpoint is required")
+            yield "Endpoint is required"
         if not self._service_name:
-            self._errors.append("Service name is required")
+            yield "Service name is required"
 
 
 # Convenience functions
@@ -696,13 +937,12 @@ def new_simple(
     service_name: str,
 ) -> TelemetryFlowClient:
     """Create a new client with minimal configuration."""
-    return (
-        TelemetryFlowBuilder()
-        .with_api_key(api_key_id, api_key_secret)
-        .with_endpoint(endpoint)
-        .with_service(service_name)
-        .build()
-    )
+    return TelemetryFlowBuilder._from_kwargs(
+        api_key_id=api_key_id,
+        api_key_secret=api_key_secret,
+        endpoint=endpoint,
+        service_name=service_name,
+    ).build()
 
 
 def must_new_simple(
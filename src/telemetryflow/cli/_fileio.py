@@ -0,0 +1,111 @@
+"""Unbuffered file output for the code generators."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+# Same permissions as open(): 0o666 masked by the process umask
+_FILE_MODE = 0o666
+# Batches smaller than this are written serially; thread start-up costs
+# more than a few small writes
+_PARALLEL_WRITE_MIN = 8
+
+
+def _open_for_write(path: Path, flags: int) -> int:
+    """Open a file for writing, creating missing parent directories on demand."""
+    try:
+        return os.open(path, flags, _FILE_MODE)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, flags, _FILE_MODE)
+
+
+def write_utf8(path: Path, content: str | bytes, force: bool = True) -> bool:
+    """
+    Write a string to a file as UTF-8.
+
+    The content is encoded once and written straight to the descriptor,
+    skipping the TextIOWrapper and buffer that ``Path.write_text`` sets up
+    for a single write. Newlines are written as-is on every platform.
+    Content written many times, such as a placeholder, can be passed
+    already encoded to skip the encode.
+
+    Existence is checked by the open itself: without ``force`` the file is
+    created with ``O_EXCL``, which fails atomically if it already exists.
+    Missing parent directories are only created after the open fails, so
+    writing into an existing directory costs a single ``open`` call.
+
+    Args:
+        path: File to write
+        content: Text to write, or its UTF-8 encoding
+        force: Replace an existing file instead of leaving it untouched
+
+    Returns:
+        True if the file was written, False if it existed and force is off
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if force else os.O_EXCL)
+    try:
+        fd = _open_for_write(path, flags)
+    except FileExistsError:
+        return False
+
+    data = memoryview(content.encode("utf-8") if isinstance(content, str) else content)
+    try:
+        # os.write may write less than asked for, e.g. when interrupted
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+    return True
+
+
+def write_batch(files: Sequence[tuple[Path, str | bytes]], force: bool = True) -> list[bool]:
+    """
+    Write several files with ``write_utf8``, in parallel for large batches.
+
+    File writes release the GIL, so batches of at least
+    ``_PARALLEL_WRITE_MIN`` files are written from a thread pool and their
+    open and write calls overlap; smaller ones are written serially.
+
+    Args:
+        files: (path, content) pairs
+        force: Replace existing files instead of leaving them untouched
+
+    Returns:
+        Whether each file was written, in the order of ``files``
+    """
+    if len(files) < _PARALLEL_WRITE_MIN:
+        return [write_utf8(path, content, force) for path, content in files]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(files), 8)) as executor:
+        # list() surfaces the first write error, as the serial path does
+        return list(executor.map(lambda item: write_utf8(item[0], item[1], force), files))
+
+
+def write_files(files: Sequence[tuple[Path, str | bytes]], force: bool = False) -> int:
+    """
+    Write a batch of generated files, reporting each one in order.
+
+    Args:
+        files: (path, content) pairs
+        force: Overwrite existing files
+
+    Returns:
+        Number of files written
+    """
+    written = write_batch(files, force)
+    if files:
+        # One write for the whole report instead of one per file
+        print(
+            "\n".join(
+                f"Generated: {path}"
+                if ok
+                else f"Skipping {path} (already exists, use --force to overwrite)"
+                for (path, _), ok in zip(files, written, strict=True)
+            )
+        )
+    return sum(written)
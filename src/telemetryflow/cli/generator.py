@@ -9,83 +9,106 @@ Generate boilerplate code for integrating TelemetryFlow into your Python applica
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
+import functools
 import sys
-from importlib import resources
+from dataclasses import dataclass, field
 from pathlib import Path
-from string import Template
 from typing import Any
 
 from telemetryflow.banner import print_banner
+from telemetryflow.cli._fileio import write_files, write_utf8
+from telemetryflow.cli._substitute import compile_template
 from telemetryflow.version import __version__
 
+# Template spellings of booleans, looked up instead of str(flag).lower()
+_BOOL_STR = {True: "true", False: "false"}
+# Placeholders rendered when no API key is given
+_DEFAULT_KEY_ID = "tfk_your_key_id"
+_DEFAULT_KEY_SECRET = "tfs_your_key_secret"
+# Printed after a successful init, as one write
+_INIT_NEXT_STEPS = """
+TelemetryFlow initialized successfully!
+
+Next steps:
+1. Edit .env.telemetryflow with your API credentials
+2. Import the telemetry module in your code:
+   from telemetry import init, get_client
+3. Initialize at startup:
+   init()
+
+For more information, visit https://docs.telemetryflow.id"""
+
 # =============================================================================
 # TEMPLATE DATA STRUCTURES
 # =============================================================================
 
 
+@dataclass(frozen=True, slots=True)
 class TemplateData:
     """Data structure for template rendering."""
 
-    def __init__(
-        self,
-        project_name: str = "",
-        service_name: str = "",
-        service_version: str = "1.0.0",
-        environment: str = "production",
-        api_key_id: str = "",
-        api_key_secret: str = "",
-        endpoint: str = "localhost:4317",
-        enable_metrics: bool = True,
-        enable_logs: bool = True,
-        enable_traces: bool = True,
-        port: str = "8080",
-        # TFO v2 API settings (aligned with TFO-Collector v1.1.2)
-        use_v2_api: bool = True,
-        v2_only: bool = False,
-        collector_name: str = "TelemetryFlow Python SDK",
-        datacenter: str = "default",
-        enrich_resources: bool = True,
-        protocol: str = "grpc",
-    ) -> None:
-        self.project_name = project_name
-        self.service_name = service_name or project_name
-        self.service_version = service_version
-        self.environment = environment
-        self.api_key_id = api_key_id
-        self.api_key_secret = api_key_secret
-        self.endpoint = endpoint
-        self.enable_metrics = enable_metrics
-        self.enable_logs = enable_logs
-        self.enable_traces = enable_traces
-        self.port = port
-        # TFO v2 API fields
-        self.use_v2_api = use_v2_api
-        self.v2_only = v2_only
-        self.collector_name = collector_name
-        self.datacenter = datacenter
-        self.enrich_resources = enrich_resources
-        self.protocol = protocol
+    project_name: str = ""
+    service_name: str = ""
+    service_version: str = "1.0.0"
+    environment: str = "production"
+    api_key_id: str = ""
+    api_key_secret: str = ""
+    endpoint: str = "localhost:4317"
+    enable_metrics: bool = True
+    enable_logs: bool = True
+    enable_traces: bool = True
+    port: str = "8080"
+    # TFO v2 API settings (aligned with TFO-Collector v1.1.2)
+    use_v2_api: bool = True
+    v2_only: bool = False
+    collector_name: str = "TelemetryFlow Python SDK"
+    datacenter: str = "default"
+    enrich_resources: bool = True
+    protocol: str = "grpc"
+    _cached_dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Default the service name to the project name."""
+        if not self.service_name:
+            object.__setattr__(self, "service_name", self.project_name)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for template substitution."""
+        """
+        Convert to dictionary for template substitution.
+
+        The dictionary is built on the first call and returned again by later
+        calls, so every file rendered from this data shares one copy. The
+        instance is frozen, so the copy cannot go stale; it should not be
+        modified by callers.
+        """
+        cached = self._cached_dict
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, "_cached_dict", cached)
+        return cached
+
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the substitution dictionary from the current fields."""
         return {
             "project_name": self.project_name,
             "service_name": self.service_name,
             "service_version": self.service_version,
             "environment": self.environment,
-            "api_key_id": self.api_key_id or "tfk_your_key_id",
-            "api_key_secret": self.api_key_secret or "tfs_your_key_secret",
+            "api_key_id": self.api_key_id or _DEFAULT_KEY_ID,
+            "api_key_secret": self.api_key_secret or _DEFAULT_KEY_SECRET,
             "endpoint": self.endpoint,
-            "enable_metrics": str(self.enable_metrics).lower(),
-            "enable_logs": str(self.enable_logs).lower(),
-            "enable_traces": str(self.enable_traces).lower(),
+            "enable_metrics": _BOOL_STR[self.enable_metrics],
+            "enable_logs": _BOOL_STR[self.enable_logs],
+            "enable_traces": _BOOL_STR[self.enable_traces],
             "port": self.port,
             # TFO v2 API fields
-            "use_v2_api": str(self.use_v2_api).lower(),
-            "v2_only": str(self.v2_only).lower(),
+            "use_v2_api": _BOOL_STR[self.use_v2_api],
+            "v2_only": _BOOL_STR[self.v2_only],
             "collector_name": self.collector_name,
             "datacenter": self.datacenter,
-            "enrich_resources": str(self.enrich_resources).lower(),
+            "enrich_resources": _BOOL_STR[self.enrich_resources],
             "protocol": self.protocol,
             "sdk_version": __version__,
             "tfo_collector_version": "1.1.2",
@@ -97,23 +120,51 @@ class TemplateData:
 # =============================================================================
 
 
+# Keeps directories extracted by resources.as_file() alive until exit
+_resource_paths = contextlib.ExitStack()
+atexit.register(_resource_paths.close)
+
+
+@functools.cache
 def get_template_dir() -> Path:
-    """Get the templates directory path."""
-    # Use importlib.resources for Python 3.9+
+    """Get the templates directory path, resolved once per process."""
+    # Imported here: importlib.resources is slow to import and only needed
+    # by commands that render templates
+    from importlib import resources
+
     try:
-        with resources.as_file(
-            resources.files("telemetryflow.cli.templates.native")
-        ) as template_path:
-            return template_path
+        return _resource_paths.enter_context(
+            resources.as_file(resources.files("telemetryflow.cli.templates.native"))
+        )
     except (TypeError, AttributeError):
         # Fallback for older Python or if resources aren't properly installed
         cli_dir = Path(__file__).parent
         return cli_dir / "templates" / "native"
 
 
+@functools.cache
+def _bundled_templates() -> dict[str, str]:
+    """Read every bundled template in one pass, keyed by file name."""
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in get_template_dir().iterdir()
+        if path.suffix == ".tpl"
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _read_template(path: Path, _mtime_ns: int, _size: int) -> str:
+    """Read a template from a custom directory, cached per file version."""
+    return path.read_text(encoding="utf-8")
+
+
 def load_template(template_name: str, template_dir: Path | None = None) -> str:
     """Load a template file.
 
+    Bundled templates are all read on the first call and served from memory
+    afterwards; files from a custom directory are read again only after they
+    change.
+
     Args:
         template_name: Name of the template file (e.g., "env.tpl").
         template_dir: Optional custom template directory.
@@ -122,19 +173,23 @@ def load_template(template_name: str, template_dir: Path | None = None) -> str:
         Template content as string.
     """
     if template_dir is None:
-        template_dir = get_template_dir()
+        template = _bundled_templates().get(template_name)
+        if template is None:
+            raise FileNotFoundError(f"Template not found: {get_template_dir() / template_name}")
+        return template
 
     template_path = template_dir / template_name
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template not found: {template_path}")
-
-    return template_path.read_text(encoding="utf-8")
+    try:
+        # Keyed on the file's mtime and size, so an edited file is read again
+        stat = template_path.stat()
+        return _read_template(template_path, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_path}") from None
 
 
 def render_template(template_str: str, data: TemplateData) -> str:
     """Render a template with the given data."""
-    template = Template(template_str)
-    return template.safe_substitute(data.to_dict())
+    return compile_template(template_str)(data.to_dict())
 
 
 def render_template_file(
@@ -172,16 +227,24 @@ def write_file(path: Path, content: str, force: bool = False) -> bool:
     Returns:
         True if file was written, False otherwise.
     """
-    if path.exists() and not force:
+    if not write_utf8(path, content, force):
         print(f"Skipping {path} (already exists, use --force to overwrite)")
         return False
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
     print(f"Generated: {path}")
     return True
 
 
+# Telemetry package files: (file name, template name)
+_INIT_FILES = (
+    ("__init__.py", "init.py.tpl"),
+    ("metrics.py", "metrics.py.tpl"),
+    ("logs.py", "logs.py.tpl"),
+    ("traces.py", "traces.py.tpl"),
+    ("README.md", "README.md.tpl"),
+)
+
+
 def generate_init_files(
     output_dir: Path,
     data: TemplateData,
@@ -189,42 +252,18 @@ def generate_init_files(
     template_dir: Path | None = None,
 ) -> None:
     """Generate telemetry integration files."""
-    telemetry_dir = output_dir / "telemetry"
+    write_files(_render_init_files(output_dir, data, template_dir), force)
 
-    # Main init module
-    write_file(
-        telemetry_dir / "__init__.py",
-        render_template_file("init.py.tpl", data, template_dir),
-        force,
-    )
-
-    # Metrics module
-    write_file(
-        telemetry_dir / "metrics.py",
-        render_template_file("metrics.py.tpl", data, template_dir),
-        force,
-    )
-
-    # Logs module
-    write_file(
-        telemetry_dir / "logs.py",
-        render_template_file("logs.py.tpl", data, template_dir),
-        force,
-    )
-
-    # Traces module
-    write_file(
-        telemetry_dir / "traces.py",
-        render_template_file("traces.py.tpl", data, template_dir),
-        force,
-    )
 
-    # README
-    write_file(
-        telemetry_dir / "README.md",
-        render_template_file("README.md.tpl", data, template_dir),
-        force,
-    )
+def _render_init_files(
+    output_dir: Path, data: TemplateData, template_dir: Path | None
+) -> list[tuple[Path, str]]:
+    """Render the telemetry package files as (path, content) pairs."""
+    telemetry_dir = output_dir / "telemetry"
+    return [
+        (telemetry_dir / filename, render_template_file(template_name, data, template_dir))
+        for filename, template_name in _INIT_FILES
+    ]
 
 
 def generate_config_file(
@@ -241,6 +280,15 @@ def generate_config_file(
     )
 
 
+# Example types: (file name, template name)
+_EXAMPLES = {
+    "basic": ("example_basic.py", "example_basic.py.tpl"),
+    "http-server": ("example_http_server.py", "example_http_server.py.tpl"),
+    "grpc-server": ("example_grpc_server.py", "example_grpc_server.py.tpl"),
+    "worker": ("example_worker.py", "example_worker.py.tpl"),
+}
+
+
 def generate_example(
     example_type: str,
     output_dir: Path,
@@ -260,19 +308,14 @@ def generate_example(
     Returns:
         True if successful, False otherwise.
     """
-    examples = {
-        "basic": ("example_basic.py", "example_basic.py.tpl"),
-        "http-server": ("example_http_server.py", "example_http_server.py.tpl"),
-        "grpc-server": ("example_grpc_server.py", "example_grpc_server.py.tpl"),
-        "worker": ("example_worker.py", "example_worker.py.tpl"),
-    }
-
-    if example_type not in examples:
-        print(f"Error: Unknown example type '{example_type}'")
-        print(f"Available types: {', '.join(examples.keys())}")
+    if example_type not in _EXAMPLES:
+        print(
+            f"Error: Unknown example type '{example_type}'\n"
+            f"Available types: {', '.join(_EXAMPLES.keys())}"
+        )
         return False
 
-    filename, template_name = examples[example_type]
+    filename, template_name = _EXAMPLES[example_type]
     try:
         content = render_template_file(template_name, data, template_dir)
         return write_file(output_dir / filename, content, force)
@@ -312,21 +355,24 @@ def cmd_init(args: argparse.Namespace) -> int:
 
     print(f"Initializing TelemetryFlow integration for project: {data.project_name}")
 
-    # Generate files
-    generate_config_file(output_dir, data, args.force, template_dir)
-    generate_init_files(output_dir, data, args.force, template_dir)
+    # Render everything first, then write it as one batch
+    files = [
+        (output_dir / ".env.telemetryflow", render_template_file("env.tpl", data, template_dir))
+    ]
+    files += _render_init_files(output_dir, data, template_dir)
 
     # Generate basic example
-    generate_example("basic", output_dir, data, args.force, template_dir)
+    filename, template_name = _EXAMPLES["basic"]
+    try:
+        files.append(
+            (output_dir / filename, render_template_file(template_name, data, template_dir))
+        )
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+
+    write_files(files, args.force)
 
-    print("\nTelemetryFlow initialized successfully!")
-    print("\nNext steps:")
-    print("1. Edit .env.telemetryflow with your API credentials")
-    print("2. Import the telemetry module in your code:")
-    print("   from telemetry import init, get_client")
-    print("3. Initialize at startup:")
-    print("   init()")
-    print("\nFor more information, visit https://docs.telemetryflow.id")
+    print(_INIT_NEXT_STEPS)
 
     return 0
 
@@ -388,6 +434,16 @@ def cmd_version(_args: argparse.Namespace) -> int:
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+    # Version requests need neither the banner nor the parser
+    version_request = [arg for arg in argv if arg != "--no-banner"]
+    if version_request == ["version"]:
+        return cmd_version(argparse.Namespace())
+    if version_request[:1] in (["--version"], ["-v"]):
+        print(f"telemetryflow-gen {__version__}")
+        return 0
+
     parser = argparse.ArgumentParser(
         prog="telemetryflow-gen",
         description="TelemetryFlow SDK Generator - Generate boilerplate code for TelemetryFlow integration",
@@ -408,6 +464,10 @@ def main(argv: list[str] | None = None) -> int:
         help="Custom template directory (uses embedded templates if not set)",
     )
 
+    # Command arguments are only added for commands named on the command
+    # line; the others are registered by name and help text alone, which is
+    # all the top-level help shows
+    requested = set(argv)
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # ===== init command =====
@@ -416,59 +476,64 @@ def main(argv: list[str] | None = None) -> int:
         help="Initialize TelemetryFlow in your project",
         description="Generate all necessary files to integrate TelemetryFlow into your project",
     )
-    init_parser.add_argument("-p", "--project", help="Project name")
-    init_parser.add_argument("-n", "--service", help="Service name (defaults to project name)")
-    init_parser.add_argument("--version", dest="version", help="Service version", default="1.0.0")
-    init_parser.add_argument("-k", "--key-id", help="TelemetryFlow API Key ID")
-    init_parser.add_argument("-s", "--key-secret", help="TelemetryFlow API Key Secret")
-    init_parser.add_argument(
-        "-e",
-        "--endpoint",
-        help="OTLP endpoint",
-        default="localhost:4317",
-    )
-    init_parser.add_argument(
-        "--environment",
-        help="Environment (development, staging, production)",
-        default="production",
-    )
-    init_parser.add_argument("-o", "--output", help="Output directory")
-    init_parser.add_argument("-f", "--force", action="store_true", help="Overwrite existing files")
-    init_parser.add_argument("--no-metrics", action="store_true", help="Disable metrics")
-    init_parser.add_argument("--no-logs", action="store_true", help="Disable logs")
-    init_parser.add_argument("--no-traces", action="store_true", help="Disable traces")
-    init_parser.add_argument("--template-dir", help="Custom template directory")
-    # TFO v2 API options
-    init_parser.add_argument(
-        "--use-v2-api",
-        dest="use_v2_api",
-        action="store_true",
-        default=True,
-        help="Enable TFO v2 API endpoints (default: true)",
-    )
-    init_parser.add_argument(
-        "--v2-only",
-        dest="v2_only",
-        action="store_true",
-        default=False,
-        help="Enable v2-only mode (disables v1 endpoints)",
-    )
-    init_parser.add_argument(
-        "--collector-name",
-        help="Collector name for identity",
-        default="TelemetryFlow Python SDK",
-    )
-    init_parser.add_argument(
-        "--datacenter",
-        help="Datacenter/region identifier",
-        default="default",
-    )
-    init_parser.add_argument(
-        "--protocol",
-        choices=["grpc", "http"],
-        help="Protocol (grpc or http)",
-        default="grpc",
-    )
+    if "init" in requested:
+        init_parser.add_argument("-p", "--project", help="Project name")
+        init_parser.add_argument("-n", "--service", help="Service name (defaults to project name)")
+        init_parser.add_argument(
+            "--version", dest="version", help="Service version", default="1.0.0"
+        )
+        init_parser.add_argument("-k", "--key-id", help="TelemetryFlow API Key ID")
+        init_parser.add_argument("-s", "--key-secret", help="TelemetryFlow API Key Secret")
+        init_parser.add_argument(
+            "-e",
+            "--endpoint",
+            help="OTLP endpoint",
+            default="localhost:4317",
+        )
+        init_parser.add_argument(
+            "--environment",
+            help="Environment (development, staging, production)",
+            default="production",
+        )
+        init_parser.add_argument("-o", "--output", help="Output directory")
+        init_parser.add_argument(
+            "-f", "--force", action="store_true", help="Overwrite existing files"
+        )
+        init_parser.add_argument("--no-metrics", action="store_true", help="Disable metrics")
+        init_parser.add_argument("--no-logs", action="store_true", help="Disable logs")
+        init_parser.add_argument("--no-traces", action="store_true", help="Disable traces")
+        init_parser.add_argument("--template-dir", help="Custom template directory")
+        # TFO v2 API options
+        init_parser.add_argument(
+            "--use-v2-api",
+            dest="use_v2_api",
+            action="store_true",
+            default=True,
+            help="Enable TFO v2 API endpoints (default: true)",
+        )
+        init_parser.add_argument(
+            "--v2-only",
+            dest="v2_only",
+            action="store_true",
+            default=False,
+            help="Enable v2-only mode (disables v1 endpoints)",
+        )
+        init_parser.add_argument(
+            "--collector-name",
+            help="Collector name for identity",
+            default="TelemetryFlow Python SDK",
+        )
+        init_parser.add_argument(
+            "--datacenter",
+            help="Datacenter/region identifier",
+            default="default",
+        )
+        init_parser.add_argument(
+            "--protocol",
+            choices=["grpc", "http"],
+            help="Protocol (grpc or http)",
+            default="grpc",
+        )
 
     # ===== example command =====
     example_parser = subparsers.add_parser(
@@ -476,19 +541,20 @@ def main(argv: list[str] | None = None) -> int:
         help="Generate example code",
         description="Generate example code for specific use cases",
     )
-    example_parser.add_argument(
-        "type",
-        choices=["basic", "http-server", "grpc-server", "worker"],
-        help="Example type",
-    )
-    example_parser.add_argument("-o", "--output", help="Output directory")
-    example_parser.add_argument(
-        "-f", "--force", action="store_true", help="Overwrite existing files"
-    )
-    example_parser.add_argument(
-        "--port", help="Server port (for http-server example)", default="8080"
-    )
-    example_parser.add_argument("--template-dir", help="Custom template directory")
+    if "example" in requested:
+        example_parser.add_argument(
+            "type",
+            choices=["basic", "http-server", "grpc-server", "worker"],
+            help="Example type",
+        )
+        example_parser.add_argument("-o", "--output", help="Output directory")
+        example_parser.add_argument(
+            "-f", "--force", action="store_true", help="Overwrite existing files"
+        )
+        example_parser.add_argument(
+            "--port", help="Server port (for http-server example)", default="8080"
+        )
+        example_parser.add_argument("--template-dir", help="Custom template directory")
 
     # ===== config command =====
     config_parser = subparsers.add_parser(
@@ -496,39 +562,44 @@ def main(argv: list[str] | None = None) -> int:
         help="Generate configuration file",
         description="Generate a .env configuration file with TelemetryFlow settings",
     )
-    config_parser.add_argument("-n", "--service", help="Service name")
-    config_parser.add_argument("--version", dest="version", help="Service version", default="1.0.0")
-    config_parser.add_argument("-k", "--key-id", help="TelemetryFlow API Key ID")
-    config_parser.add_argument("-s", "--key-secret", help="TelemetryFlow API Key Secret")
-    config_parser.add_argument("-e", "--endpoint", help="OTLP endpoint", default="localhost:4317")
-    config_parser.add_argument("--environment", help="Environment", default="production")
-    config_parser.add_argument("-o", "--output", help="Output directory")
-    config_parser.add_argument(
-        "-f", "--force", action="store_true", help="Overwrite existing files"
-    )
-    config_parser.add_argument("--template-dir", help="Custom template directory")
-    # TFO v2 API options
-    config_parser.add_argument(
-        "--use-v2-api",
-        dest="use_v2_api",
-        action="store_true",
-        default=True,
-        help="Enable TFO v2 API endpoints",
-    )
-    config_parser.add_argument(
-        "--v2-only",
-        dest="v2_only",
-        action="store_true",
-        default=False,
-        help="Enable v2-only mode",
-    )
-    config_parser.add_argument(
-        "--collector-name",
-        help="Collector name for identity",
-        default="TelemetryFlow Python SDK",
-    )
-    config_parser.add_argument("--datacenter", help="Datacenter/region", default="default")
-    config_parser.add_argument("--protocol", choices=["grpc", "http"], default="grpc")
+    if "config" in requested:
+        config_parser.add_argument("-n", "--service", help="Service name")
+        config_parser.add_argument(
+            "--version", dest="version", help="Service version", default="1.0.0"
+        )
+        config_parser.add_argument("-k", "--key-id", help="TelemetryFlow API Key ID")
+        config_parser.add_argument("-s", "--key-secret", help="TelemetryFlow API Key Secret")
+        config_parser.add_argument(
+            "-e", "--endpoint", help="OTLP endpoint", default="localhost:4317"
+        )
+        config_parser.add_argument("--environment", help="Environment", default="production")
+        config_parser.add_argument("-o", "--output", help="Output directory")
+        config_parser.add_argument(
+            "-f", "--force", action="store_true", help="Overwrite existing files"
+        )
+        config_parser.add_argument("--template-dir", help="Custom template directory")
+        # TFO v2 API options
+        config_parser.add_argument(
+            "--use-v2-api",
+            dest="use_v2_api",
+            action="store_true",
+            default=True,
+            help="Enable TFO v2 API endpoints",
+        )
+        config_parser.add_argument(
+            "--v2-only",
+            dest="v2_only",
+            action="store_true",
+            default=False,
+            help="Enable v2-only mode",
+        )
+        config_parser.add_argument(
+            "--collector-name",
+            help="Collector name for identity",
+            default="TelemetryFlow Python SDK",
+        )
+        config_parser.add_argument("--datacenter", help="Datacenter/region", default="default")
+        config_parser.add_argument("--protocol", choices=["grpc", "http"], default="grpc")
 
     # ===== version command =====
     subparsers.add_parser("version", help="Show version information")
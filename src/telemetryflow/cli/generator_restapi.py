@@ -9,24 +9,47 @@ Generate a complete DDD + CQRS pattern RESTful API project with Flask and SQLAlc
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
+import functools
 import re
 import sys
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from importlib import resources
 from pathlib import Path
-from string import Template
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from telemetryflow.banner import print_banner
+from telemetryflow.cli._fileio import write_batch, write_files, write_utf8
+from telemetryflow.cli._substitute import compile_template
 from telemetryflow.version import __version__
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Template spellings of booleans, looked up instead of str(flag).lower()
+_BOOL_STR = {True: "true", False: "false"}
+
+
+@functools.cache
+def _process_start() -> datetime:
+    """Capture the current UTC time once per process; imports datetime on first use."""
+    from datetime import UTC, datetime
+
+    return datetime.now(UTC)
+
+
+@functools.cache
+def _process_timestamp(fmt: str) -> str:
+    """Format the process start time, so every file from one run shares it."""
+    return _process_start().strftime(fmt)
+
+
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityField:
     """Represents a field in an entity."""
 
@@ -37,20 +60,23 @@ class EntityField:
     python_type: str = ""
     sqlalchemy_type: str = ""
     nullable: bool = False
+    snake_name: str = ""
 
     def __post_init__(self) -> None:
         """Initialize computed fields."""
+        if not self.snake_name:
+            self.snake_name = to_snake_case(self.name)
         if not self.json_name:
             self.json_name = to_camel_case(self.name)
         if not self.db_column:
-            self.db_column = to_snake_case(self.name)
+            self.db_column = self.snake_name
         if not self.python_type:
             self.python_type = map_type_to_python(self.field_type)
         if not self.sqlalchemy_type:
             self.sqlalchemy_type = map_type_to_sqlalchemy(self.field_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateData:
     """Data structure for template rendering."""
 
@@ -87,6 +113,11 @@ class TemplateData:
 
     # Computed
     timestamp: str = ""
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _field_code: dict[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+    _entity_context: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize computed fields."""
@@ -99,15 +130,23 @@ class TemplateData:
         if not self.env_prefix:
             self.env_prefix = to_snake_case(self.project_name).upper().replace("-", "_")
         if not self.timestamp:
-            self.timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+            self.timestamp = _process_timestamp("%Y-%m-%d %H:%M:%S")
         if self.entity_name and not self.entity_name_lower:
             self.entity_name_lower = self.entity_name.lower()
         if self.entity_name and not self.entity_name_plural:
             self.entity_name_plural = pluralize(self.entity_name_lower)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for template substitution."""
-        result = {
+        """
+        Convert to dictionary for template substitution.
+
+        The dictionary is built on the first call and shared by every later
+        render, so fields should not be changed after the first render and
+        the result should not be modified.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "project_name": self.project_name,
             "module_name": self.module_name,
             "service_name": self.service_name,
@@ -120,30 +159,63 @@ class TemplateData:
             "db_name": self.db_name,
             "db_user": self.db_user,
             "server_port": self.server_port,
-            "enable_telemetry": str(self.enable_telemetry).lower(),
-            "enable_swagger": str(self.enable_swagger).lower(),
-            "enable_cors": str(self.enable_cors).lower(),
-            "enable_auth": str(self.enable_auth).lower(),
-            "enable_rate_limit": str(self.enable_rate_limit).lower(),
+            "enable_telemetry": _BOOL_STR[self.enable_telemetry],
+            "enable_swagger": _BOOL_STR[self.enable_swagger],
+            "enable_cors": _BOOL_STR[self.enable_cors],
+            "enable_auth": _BOOL_STR[self.enable_auth],
+            "enable_rate_limit": _BOOL_STR[self.enable_rate_limit],
             "entity_name": self.entity_name,
             "entity_name_lower": self.entity_name_lower,
             "entity_name_plural": self.entity_name_plural,
             "timestamp": self.timestamp,
         }
-        return result
+        return self._dict_cache
+
+    def field_code(self) -> dict[str, str]:
+        """
+        Return the generated code for entity_fields, keyed by placeholder name.
+
+        Built on the first call and reused for every entity template, so
+        entity_fields should not change afterwards.
+        """
+        if self._field_code is None:
+            fields = self.entity_fields
+            self._field_code = {
+                "field_definitions": generate_field_definitions(fields),
+                "field_columns": generate_sqlalchemy_columns(fields),
+                "field_dto": generate_dto_fields(fields),
+                "field_validation": generate_validation_code(fields),
+            }
+        return self._field_code
+
+    def entity_context(self) -> dict[str, Any]:
+        """
+        Return to_dict() merged with field_code() for entity templates.
+
+        Merged once and shared by every entity template rendered from this
+        data, under the same no-changes-after-first-render rule.
+        """
+        if self._entity_context is None:
+            self._entity_context = {**self.to_dict(), **self.field_code()}
+        return self._entity_context
 
 
 # =============================================================================
 # STRING HELPERS
 # =============================================================================
 
+_WORD_SEPARATOR_RE = re.compile(r"[_\-\s]+")
+_UPPER_RE = re.compile(r"([A-Z])")
 
+
+@functools.lru_cache(maxsize=1024)
 def to_pascal_case(s: str) -> str:
     """Convert string to PascalCase."""
-    words = re.split(r"[_\-\s]+", s)
+    words = _WORD_SEPARATOR_RE.split(s)
     return "".join(word.capitalize() for word in words)
 
 
+@functools.lru_cache(maxsize=1024)
 def to_camel_case(s: str) -> str:
     """Convert string to camelCase."""
     pascal = to_pascal_case(s)
@@ -152,10 +224,11 @@ def to_camel_case(s: str) -> str:
     return pascal[0].lower() + pascal[1:]
 
 
+@functools.lru_cache(maxsize=1024)
 def to_snake_case(s: str) -> str:
     """Convert string to snake_case."""
     # Insert underscore before uppercase letters
-    result = re.sub(r"([A-Z])", r"_\1", s)
+    result = _UPPER_RE.sub(r"_\1", s)
     # Convert to lowercase and remove leading underscore
     return result.lower().lstrip("_").replace("-", "_")
 
@@ -169,54 +242,60 @@ def pluralize(s: str) -> str:
     return s + "s"
 
 
+_PYTHON_TYPES = {
+    "string": "str",
+    "text": "str",
+    "int": "int",
+    "integer": "int",
+    "int64": "int",
+    "bigint": "int",
+    "float": "float",
+    "float64": "float",
+    "decimal": "float",
+    "bool": "bool",
+    "boolean": "bool",
+    "time": "datetime",
+    "datetime": "datetime",
+    "timestamp": "datetime",
+    "uuid": "UUID",
+    "json": "dict[str, Any]",
+    "jsonb": "dict[str, Any]",
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def map_type_to_python(t: str) -> str:
     """Map field type to Python type."""
     t = t.rstrip("?")
-    type_map = {
-        "string": "str",
-        "text": "str",
-        "int": "int",
-        "integer": "int",
-        "int64": "int",
-        "bigint": "int",
-        "float": "float",
-        "float64": "float",
-        "decimal": "float",
-        "bool": "bool",
-        "boolean": "bool",
-        "time": "datetime",
-        "datetime": "datetime",
-        "timestamp": "datetime",
-        "uuid": "UUID",
-        "json": "dict[str, Any]",
-        "jsonb": "dict[str, Any]",
-    }
-    return type_map.get(t.lower(), "str")
-
-
+    return _PYTHON_TYPES.get(t.lower(), "str")
+
+
+_SQLALCHEMY_TYPES = {
+    "string": "String(255)",
+    "text": "Text",
+    "int": "Integer",
+    "integer": "Integer",
+    "int64": "BigInteger",
+    "bigint": "BigInteger",
+    "float": "Float",
+    "float64": "Float",
+    "decimal": "Numeric(10, 2)",
+    "bool": "Boolean",
+    "boolean": "Boolean",
+    "time": "DateTime",
+    "datetime": "DateTime",
+    "timestamp": "DateTime",
+    "uuid": "UUID",
+    "json": "JSON",
+    "jsonb": "JSONB",
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def map_type_to_sqlalchemy(t: str) -> str:
     """Map field type to SQLAlchemy type."""
     t = t.rstrip("?")
-    type_map = {
-        "string": "String(255)",
-        "text": "Text",
-        "int": "Integer",
-        "integer": "Integer",
-        "int64": "BigInteger",
-        "bigint": "BigInteger",
-        "float": "Float",
-        "float64": "Float",
-        "decimal": "Numeric(10, 2)",
-        "bool": "Boolean",
-        "boolean": "Boolean",
-        "time": "DateTime",
-        "datetime": "DateTime",
-        "timestamp": "DateTime",
-        "uuid": "UUID",
-        "json": "JSON",
-        "jsonb": "JSONB",
-    }
-    return type_map.get(t.lower(), "String(255)")
+    return _SQLALCHEMY_TYPES.get(t.lower(), "String(255)")
 
 
 def parse_fields(fields_str: str) -> list[EntityField]:
@@ -252,8 +331,14 @@ def parse_fields(fields_str: str) -> list[EntityField]:
 # =============================================================================
 
 
+# Keeps directories extracted by resources.as_file() alive until exit
+_resource_paths = contextlib.ExitStack()
+atexit.register(_resource_paths.close)
+
+
+@functools.cache
 def get_template_dir(subdir: str = "project") -> Path:
-    """Get the templates directory path for a specific subdirectory.
+    """Get the templates directory path for a specific subdirectory, resolved once.
 
     Args:
         subdir: The subdirectory within restapi templates (project, infrastructure, domain, application, entity).
@@ -261,22 +346,43 @@ def get_template_dir(subdir: str = "project") -> Path:
     Returns:
         Path to the template directory.
     """
+    from importlib import resources
+
     try:
-        with resources.as_file(
-            resources.files(f"telemetryflow.cli.templates.restapi.{subdir}")
-        ) as template_path:
-            return template_path
+        return _resource_paths.enter_context(
+            resources.as_file(resources.files(f"telemetryflow.cli.templates.restapi.{subdir}"))
+        )
     except (TypeError, AttributeError, ModuleNotFoundError):
         # Fallback for development or when resources aren't available
         cli_dir = Path(__file__).parent
         return cli_dir / "templates" / "restapi" / subdir
 
 
+@functools.cache
+def _bundled_templates(subdir: str) -> dict[str, str]:
+    """Read every bundled template of a subdirectory in one pass, keyed by file name."""
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in get_template_dir(subdir).iterdir()
+        if path.suffix == ".tpl"
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _read_template(path: Path, _mtime_ns: int, _size: int) -> str:
+    """Read a template from a custom directory, cached per file version."""
+    return path.read_text(encoding="utf-8")
+
+
 def load_template(
     template_name: str, subdir: str = "project", template_dir: Path | None = None
 ) -> str:
     """Load a template file from the specified subdirectory.
 
+    Bundled templates of a subdirectory are all read on the first call and
+    served from memory afterwards; files from a custom directory are read again
+    only after they change.
+
     Args:
         template_name: Name of the template file.
         subdir: Subdirectory within restapi templates.
@@ -289,19 +395,25 @@ def load_template(
         FileNotFoundError: If template file doesn't exist.
     """
     if template_dir is None:
-        template_dir = get_template_dir(subdir)
+        template = _bundled_templates(subdir).get(template_name)
+        if template is None:
+            raise FileNotFoundError(
+                f"Template not found: {get_template_dir(subdir) / template_name}"
+            )
+        return template
 
     template_path = template_dir / template_name
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template not found: {template_path}")
-
-    return template_path.read_text(encoding="utf-8")
+    try:
+        # Keyed on the file's mtime and size, so an edited file is read again
+        stat = template_path.stat()
+        return _read_template(template_path, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_path}") from None
 
 
 def render_template(template_str: str, data: TemplateData) -> str:
     """Render a template with the given data."""
-    template = Template(template_str)
-    return template.safe_substitute(data.to_dict())
+    return compile_template(template_str)(data.to_dict())
 
 
 def render_template_file(
@@ -327,21 +439,10 @@ def render_template_file(
 
 def render_with_fields(template_str: str, data: TemplateData) -> str:
     """Render a template that includes entity fields."""
-    result = render_template(template_str, data)
-
-    # Generate field-specific code
-    if data.entity_fields:
-        field_definitions = generate_field_definitions(data.entity_fields)
-        field_columns = generate_sqlalchemy_columns(data.entity_fields)
-        field_dto = generate_dto_fields(data.entity_fields)
-        field_validation = generate_validation_code(data.entity_fields)
-
-        result = result.replace("${field_definitions}", field_definitions)
-        result = result.replace("${field_columns}", field_columns)
-        result = result.replace("${field_dto}", field_dto)
-        result = result.replace("${field_validation}", field_validation)
-
-    return result
+    # Field placeholders are substituted in the same pass; without fields
+    # they are left in place
+    mapping = data.entity_context() if data.entity_fields else data.to_dict()
+    return compile_template(template_str)(mapping)
 
 
 def render_entity_template_file(
@@ -365,50 +466,44 @@ def render_entity_template_file(
 
 def generate_field_definitions(fields: list[EntityField]) -> str:
     """Generate field definitions for dataclass."""
-    lines = []
-    for f in fields:
-        nullable_suffix = " | None = None" if f.nullable else ""
-        lines.append(f"    {to_snake_case(f.name)}: {f.python_type}{nullable_suffix}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"    {f.snake_name}: {f.python_type}{' | None = None' if f.nullable else ''}"
+        for f in fields
+    )
 
 
 def generate_sqlalchemy_columns(fields: list[EntityField]) -> str:
     """Generate SQLAlchemy column definitions."""
-    lines = []
-    for f in fields:
-        nullable = ", nullable=True" if f.nullable else ", nullable=False"
-        lines.append(f"    {to_snake_case(f.name)} = Column({f.sqlalchemy_type}{nullable})")
-    return "\n".join(lines)
+    return "\n".join(
+        f"    {f.snake_name} = Column({f.sqlalchemy_type}, nullable={f.nullable})" for f in fields
+    )
 
 
 def generate_dto_fields(fields: list[EntityField]) -> str:
     """Generate DTO field definitions."""
-    lines = []
-    for f in fields:
-        nullable_suffix = " | None = None" if f.nullable else ""
-        lines.append(f"    {to_snake_case(f.name)}: {f.python_type}{nullable_suffix}")
-    return "\n".join(lines)
+    return generate_field_definitions(fields)
 
 
 def generate_validation_code(fields: list[EntityField]) -> str:
     """Generate validation code for fields."""
-    lines = []
-    for f in fields:
-        if not f.nullable:
-            snake_name = to_snake_case(f.name)
-            lines.append(f"        if not self.{snake_name}:")
-            lines.append(f'            raise ValueError("{snake_name} is required")')
-    return "\n".join(lines)
+    return "\n".join(
+        f"        if not self.{f.snake_name}:\n"
+        f'            raise ValueError("{f.snake_name} is required")'
+        for f in fields
+        if not f.nullable
+    )
+
+
+# Encoded once; written to every package directory of a new project
+_INIT_PLACEHOLDER = b'"""Auto-generated by telemetryflow-restapi."""\n'
 
 
 def write_file(path: Path, content: str, force: bool = False) -> bool:
     """Write content to a file."""
-    if path.exists() and not force:
+    if not write_utf8(path, content, force):
         print(f"Skipping {path} (already exists, use --force to overwrite)")
         return False
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
     print(f"Generated: {path}")
     return True
 
@@ -418,6 +513,72 @@ def write_file(path: Path, content: str, force: bool = False) -> bool:
 # =============================================================================
 
 
+# Directories of a new project, relative to its root. Each gets an __init__.py
+_PROJECT_DIRS: tuple[str, ...] = (
+    "src/{module}/domain/entity",
+    "src/{module}/domain/repository",
+    "src/{module}/application/command",
+    "src/{module}/application/query",
+    "src/{module}/application/handler",
+    "src/{module}/application/dto",
+    "src/{module}/infrastructure/config",
+    "src/{module}/infrastructure/persistence",
+    "src/{module}/infrastructure/http/handlers",
+    "src/{module}/infrastructure/http/middleware",
+    "src/{module}/pkg",
+    "tests/unit",
+    "tests/integration",
+    "migrations",
+    "docs",
+)
+
+# Rendered project files: (path relative to the project root, template, template subdir)
+_PROJECT_FILES: tuple[tuple[str, str, str], ...] = (
+    # Project root files
+    ("pyproject.toml", "pyproject.toml.tpl", "project"),
+    (".env.example", "env.example.tpl", "project"),
+    (".gitignore", "gitignore.tpl", "project"),
+    ("Dockerfile", "Dockerfile.tpl", "project"),
+    ("docker-compose.yml", "docker-compose.yml.tpl", "project"),
+    ("Makefile", "Makefile.tpl", "project"),
+    ("README.md", "README.md.tpl", "project"),
+    ("requirements.txt", "requirements.txt.tpl", "project"),
+    ("src/{module}/main.py", "main.py.tpl", "project"),
+    # Config
+    ("src/{module}/infrastructure/config/__init__.py", "config.py.tpl", "infrastructure"),
+    # Database
+    ("src/{module}/infrastructure/persistence/database.py", "database.py.tpl", "infrastructure"),
+    # HTTP
+    ("src/{module}/infrastructure/http/server.py", "server.py.tpl", "infrastructure"),
+    ("src/{module}/infrastructure/http/routes.py", "routes.py.tpl", "infrastructure"),
+    (
+        "src/{module}/infrastructure/http/middleware/__init__.py",
+        "middleware.py.tpl",
+        "infrastructure",
+    ),
+    (
+        "src/{module}/infrastructure/http/handlers/health.py",
+        "health_handler.py.tpl",
+        "infrastructure",
+    ),
+    # Domain base
+    ("src/{module}/domain/entity/base.py", "base_entity.py.tpl", "domain"),
+    ("src/{module}/domain/repository/base.py", "base_repository.py.tpl", "domain"),
+    # Application base (CQRS)
+    ("src/{module}/application/command/base.py", "base_command.py.tpl", "application"),
+    ("src/{module}/application/query/base.py", "base_query.py.tpl", "application"),
+    ("src/{module}/application/handler/base.py", "base_handler.py.tpl", "application"),
+    ("src/{module}/application/dto/base.py", "base_dto.py.tpl", "application"),
+    # Pkg
+    ("src/{module}/pkg/response.py", "response.py.tpl", "infrastructure"),
+    # Documentation
+    ("docs/API.md", "API.md.tpl", "docs"),
+    ("docs/ARCHITECTURE.md", "ARCHITECTURE.md.tpl", "docs"),
+    ("docs/DEVELOPMENT.md", "DEVELOPMENT.md.tpl", "docs"),
+    ("docs/DEPLOYMENT.md", "DEPLOYMENT.md.tpl", "docs"),
+)
+
+
 def generate_project(
     data: TemplateData,
     output_dir: Path,
@@ -426,209 +587,68 @@ def generate_project(
 ) -> None:
     """Generate complete project structure."""
     project_root = output_dir / data.project_name
-    src_dir = project_root / "src" / data.module_name
-
-    # Create directory structure
-    dirs = [
-        src_dir / "domain" / "entity",
-        src_dir / "domain" / "repository",
-        src_dir / "application" / "command",
-        src_dir / "application" / "query",
-        src_dir / "application" / "handler",
-        src_dir / "application" / "dto",
-        src_dir / "infrastructure" / "config",
-        src_dir / "infrastructure" / "persistence",
-        src_dir / "infrastructure" / "http" / "handlers",
-        src_dir / "infrastructure" / "http" / "middleware",
-        src_dir / "pkg",
-        project_root / "tests" / "unit",
-        project_root / "tests" / "integration",
-        project_root / "migrations",
-        project_root / "docs",
+    module = data.module_name
+
+    # Writing each __init__.py placeholder creates its directory on the way.
+    # They are written before the rendered files, as some share their paths
+    write_batch(
+        [
+            (project_root / d.format(module=module) / "__init__.py", _INIT_PLACEHOLDER)
+            for d in _PROJECT_DIRS
+        ],
+        force=False,
+    )
+
+    files = [
+        (
+            project_root / "src" / module / "__init__.py",
+            f'"""{data.project_name} package."""\n__version__ = "{data.service_version}"\n',
+        )
     ]
-
-    for d in dirs:
-        d.mkdir(parents=True, exist_ok=True)
-        # Create __init__.py files
-        init_file = d / "__init__.py"
-        if not init_file.exists():
-            init_file.write_text(
-                '"""Auto-generated by telemetryflow-restapi."""\n', encoding="utf-8"
-            )
-
-    # Generate project files using templates
-    project_tpl_dir = template_dir / "project" if template_dir else None
-    infra_tpl_dir = template_dir / "infrastructure" if template_dir else None
-    domain_tpl_dir = template_dir / "domain" if template_dir else None
-    app_tpl_dir = template_dir / "application" if template_dir else None
-
-    # Project root files
-    write_file(
-        project_root / "pyproject.toml",
-        render_template_file("pyproject.toml.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / ".env.example",
-        render_template_file("env.example.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / ".gitignore",
-        render_template_file("gitignore.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "Dockerfile",
-        render_template_file("Dockerfile.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "docker-compose.yml",
-        render_template_file("docker-compose.yml.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "Makefile",
-        render_template_file("Makefile.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "README.md",
-        render_template_file("README.md.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "requirements.txt",
-        render_template_file("requirements.txt.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-
-    # Generate source files
-    write_file(
-        src_dir / "__init__.py",
-        f'"""{data.project_name} package."""\n__version__ = "{data.service_version}"\n',
-        force,
-    )
-    write_file(
-        src_dir / "main.py",
-        render_template_file("main.py.tpl", data, "project", project_tpl_dir),
-        force,
-    )
-
-    # Config
-    write_file(
-        src_dir / "infrastructure" / "config" / "__init__.py",
-        render_template_file("config.py.tpl", data, "infrastructure", infra_tpl_dir),
-        force,
-    )
-
-    # Database
-    write_file(
-        src_dir / "infrastructure" / "persistence" / "database.py",
-        render_template_file("database.py.tpl", data, "infrastructure", infra_tpl_dir),
-        force,
-    )
-
-    # HTTP
-    write_file(
-        src_dir / "infrastructure" / "http" / "server.py",
-        render_template_file("server.py.tpl", data, "infrastructure", infra_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "infrastructure" / "http" / "routes.py",
-        render_template_file("routes.py.tpl", data, "infrastructure", infra_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "infrastructure" / "http" / "middleware" / "__init__.py",
-        render_template_file("middleware.py.tpl", data, "infrastructure", infra_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "infrastructure" / "http" / "handlers" / "health.py",
-        render_template_file("health_handler.py.tpl", data, "infrastructure", infra_tpl_dir),
-        force,
-    )
-
-    # Domain base
-    write_file(
-        src_dir / "domain" / "entity" / "base.py",
-        render_template_file("base_entity.py.tpl", data, "domain", domain_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "domain" / "repository" / "base.py",
-        render_template_file("base_repository.py.tpl", data, "domain", domain_tpl_dir),
-        force,
-    )
-
-    # Application base (CQRS)
-    write_file(
-        src_dir / "application" / "command" / "base.py",
-        render_template_file("base_command.py.tpl", data, "application", app_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "application" / "query" / "base.py",
-        render_template_file("base_query.py.tpl", data, "application", app_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "application" / "handler" / "base.py",
-        render_template_file("base_handler.py.tpl", data, "application", app_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "application" / "dto" / "base.py",
-        render_template_file("base_dto.py.tpl", data, "application", app_tpl_dir),
-        force,
-    )
-
-    # Pkg
-    write_file(
-        src_dir / "pkg" / "response.py",
-        render_template_file("response.py.tpl", data, "infrastructure", infra_tpl_dir),
-        force,
-    )
-
-    # Documentation
-    docs_tpl_dir = template_dir / "docs" if template_dir else None
-    write_file(
-        project_root / "docs" / "API.md",
-        render_template_file("API.md.tpl", data, "docs", docs_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "docs" / "ARCHITECTURE.md",
-        render_template_file("ARCHITECTURE.md.tpl", data, "docs", docs_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "docs" / "DEVELOPMENT.md",
-        render_template_file("DEVELOPMENT.md.tpl", data, "docs", docs_tpl_dir),
-        force,
-    )
-    write_file(
-        project_root / "docs" / "DEPLOYMENT.md",
-        render_template_file("DEPLOYMENT.md.tpl", data, "docs", docs_tpl_dir),
-        force,
+    files.extend(
+        (
+            project_root / rel.format(module=module),
+            render_template_file(
+                template, data, subdir, template_dir / subdir if template_dir else None
+            ),
+        )
+        for rel, template, subdir in _PROJECT_FILES
     )
+    write_files(files, force)
 
-    print(f"\nProject '{data.project_name}' created successfully!")
-    print("\nNext steps:")
-    print(f"  1. cd {data.project_name}")
-    print("  2. cp .env.example .env")
-    print("  3. Edit .env with your configuration")
-    print("  4. pip install -e '.[dev]'")
-    print("  5. make run")
-    print("\nTo add a new entity:")
     print(
+        f"\nProject '{data.project_name}' created successfully!\n"
+        "\nNext steps:\n"
+        f"  1. cd {data.project_name}\n"
+        "  2. cp .env.example .env\n"
+        "  3. Edit .env with your configuration\n"
+        "  4. pip install -e '.[dev]'\n"
+        "  5. make run\n"
+        "\nTo add a new entity:\n"
         f"  telemetryflow-restapi entity -n User -f 'name:string,email:string' -o {data.project_name}"
     )
 
 
+# Entity files: (path relative to the project root, template)
+_ENTITY_FILES: tuple[tuple[str, str], ...] = (
+    # Domain files
+    ("src/{module}/domain/entity/{name}.py", "entity.py.tpl"),
+    ("src/{module}/domain/repository/{name}_repository.py", "repository.py.tpl"),
+    # CQRS files
+    ("src/{module}/application/command/{name}_commands.py", "commands.py.tpl"),
+    ("src/{module}/application/query/{name}_queries.py", "queries.py.tpl"),
+    ("src/{module}/application/handler/{name}_command_handler.py", "command_handler.py.tpl"),
+    ("src/{module}/application/handler/{name}_query_handler.py", "query_handler.py.tpl"),
+    ("src/{module}/application/dto/{name}_dto.py", "dto.py.tpl"),
+    # Infrastructure files
+    ("src/{module}/infrastructure/persistence/{name}_repository.py", "persistence.py.tpl"),
+    ("src/{module}/infrastructure/http/handlers/{name}_handler.py", "http_handler.py.tpl"),
+    # Migration files
+    ("migrations/{timestamp}_create_{plural}.up.sql", "migration_up.sql.tpl"),
+    ("migrations/{timestamp}_create_{plural}.down.sql", "migration_down.sql.tpl"),
+)
+
+
 def generate_entity(
     data: TemplateData,
     output_dir: Path,
@@ -638,76 +658,29 @@ def generate_entity(
     """Generate entity files."""
     src_dir = output_dir / "src" / data.module_name
     entity_tpl_dir = template_dir / "entity" if template_dir else None
+    names = {
+        "module": data.module_name,
+        "name": data.entity_name_lower,
+        "plural": data.entity_name_plural,
+        "timestamp": _process_timestamp("%Y%m%d%H%M%S"),
+    }
 
-    # Generate entity files
-    write_file(
-        src_dir / "domain" / "entity" / f"{data.entity_name_lower}.py",
-        render_entity_template_file("entity.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "domain" / "repository" / f"{data.entity_name_lower}_repository.py",
-        render_entity_template_file("repository.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-
-    # CQRS files
-    write_file(
-        src_dir / "application" / "command" / f"{data.entity_name_lower}_commands.py",
-        render_entity_template_file("commands.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "application" / "query" / f"{data.entity_name_lower}_queries.py",
-        render_entity_template_file("queries.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "application" / "handler" / f"{data.entity_name_lower}_command_handler.py",
-        render_entity_template_file("command_handler.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "application" / "handler" / f"{data.entity_name_lower}_query_handler.py",
-        render_entity_template_file("query_handler.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "application" / "dto" / f"{data.entity_name_lower}_dto.py",
-        render_entity_template_file("dto.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-
-    # Infrastructure files
-    write_file(
-        src_dir / "infrastructure" / "persistence" / f"{data.entity_name_lower}_repository.py",
-        render_entity_template_file("persistence.py.tpl", data, entity_tpl_dir),
-        force,
-    )
-    write_file(
-        src_dir / "infrastructure" / "http" / "handlers" / f"{data.entity_name_lower}_handler.py",
-        render_entity_template_file("http_handler.py.tpl", data, entity_tpl_dir),
-        force,
-    )
+    files = [
+        (
+            output_dir / rel.format_map(names),
+            render_entity_template_file(template, data, entity_tpl_dir),
+        )
+        for rel, template in _ENTITY_FILES
+    ]
+    write_files(files, force)
 
-    # Migration files
-    timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
-    write_file(
-        output_dir / "migrations" / f"{timestamp}_create_{data.entity_name_plural}.up.sql",
-        render_entity_template_file("migration_up.sql.tpl", data, entity_tpl_dir),
-        force,
-    )
-    write_file(
-        output_dir / "migrations" / f"{timestamp}_create_{data.entity_name_plural}.down.sql",
-        render_entity_template_file("migration_down.sql.tpl", data, entity_tpl_dir),
-        force,
+    print(
+        f"\nEntity '{data.entity_name}' created successfully!\n"
+        "\nDon't forget to:\n"
+        f"  1. Register routes in {src_dir}/infrastructure/http/routes.py\n"
+        "  2. Run migrations: make migrate"
     )
 
-    print(f"\nEntity '{data.entity_name}' created successfully!")
-    print("\nDon't forget to:")
-    print(f"  1. Register routes in {src_dir}/infrastructure/http/routes.py")
-    print("  2. Run migrations: make migrate")
-
 
 # =============================================================================
 # CLI COMMANDS
@@ -742,20 +715,24 @@ def cmd_new(args: argparse.Namespace) -> int:
     return 0
 
 
+def _detect_module_name(pyproject_path: Path) -> str:
+    """Read [project].name from a generated project's pyproject.toml, or return ""."""
+    import tomllib
+
+    try:
+        with pyproject_path.open("rb") as f:
+            name = tomllib.load(f)["project"]["name"]
+    except (OSError, tomllib.TOMLDecodeError, KeyError, TypeError):
+        return ""
+    return name if isinstance(name, str) else ""
+
+
 def cmd_entity(args: argparse.Namespace) -> int:
     """Add new entity to project."""
     output_dir = Path(args.output or ".")
     template_dir = Path(args.template_dir) if args.template_dir else None
 
-    # Try to detect module name from pyproject.toml
-    pyproject_path = output_dir / "pyproject.toml"
-    module_name = ""
-    if pyproject_path.exists():
-        content = pyproject_path.read_text(encoding="utf-8")
-        for line in content.split("\n"):
-            if line.startswith("name = "):
-                module_name = line.split("=")[1].strip().strip('"')
-                break
+    module_name = _detect_module_name(output_dir / "pyproject.toml")
 
     if not module_name:
         print("Error: Could not detect module name. Run this from project root or specify --module")
@@ -787,6 +764,16 @@ def cmd_version(_args: argparse.Namespace) -> int:
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+    # Version requests need neither the banner nor the parser
+    version_request = [arg for arg in argv if arg != "--no-banner"]
+    if version_request == ["version"]:
+        return cmd_version(argparse.Namespace())
+    if version_request[:1] in (["--version"], ["-v"]):
+        print(f"telemetryflow-restapi {__version__}")
+        return 0
+
     parser = argparse.ArgumentParser(
         prog="telemetryflow-restapi",
         description="TelemetryFlow RESTful API Generator - Generate DDD + CQRS Flask projects",
@@ -803,6 +790,10 @@ def main(argv: list[str] | None = None) -> int:
         help="Disable banner output",
     )
 
+    # Command arguments are only added for commands named on the command
+    # line; the others are registered by name and help text alone, which is
+    # all the top-level help shows
+    requested = set(argv)
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # ===== new command =====
@@ -811,31 +802,38 @@ def main(argv: list[str] | None = None) -> int:
         help="Create a new RESTful API project",
         description="Generate a complete DDD + CQRS RESTful API project structure",
     )
-    new_parser.add_argument("-n", "--name", required=True, help="Project name")
-    new_parser.add_argument(
-        "-m", "--module", help="Python module name (defaults to snake_case of name)"
-    )
-    new_parser.add_argument("--service", help="Service name (defaults to project name)")
-    new_parser.add_argument("--version", dest="version", default="1.0.0", help="Service version")
-    new_parser.add_argument("--environment", default="development", help="Environment")
-    new_parser.add_argument(
-        "--db-driver",
-        default="postgresql",
-        help="Database driver (postgresql, mysql, sqlite)",
-    )
-    new_parser.add_argument("--db-host", default="localhost", help="Database host")
-    new_parser.add_argument("--db-port", default="5432", help="Database port")
-    new_parser.add_argument("--db-name", help="Database name (defaults to project name)")
-    new_parser.add_argument("--db-user", default="postgres", help="Database user")
-    new_parser.add_argument("--port", default="5000", help="Server port")
-    new_parser.add_argument("-o", "--output", help="Output directory")
-    new_parser.add_argument("-f", "--force", action="store_true", help="Overwrite existing files")
-    new_parser.add_argument("--template-dir", help="Custom template directory")
-    new_parser.add_argument("--no-telemetry", action="store_true", help="Disable TelemetryFlow")
-    new_parser.add_argument("--no-swagger", action="store_true", help="Disable Swagger")
-    new_parser.add_argument("--no-cors", action="store_true", help="Disable CORS")
-    new_parser.add_argument("--no-auth", action="store_true", help="Disable JWT auth")
-    new_parser.add_argument("--no-rate-limit", action="store_true", help="Disable rate limiting")
+    if "new" in requested:
+        new_parser.add_argument("-n", "--name", required=True, help="Project name")
+        new_parser.add_argument(
+            "-m", "--module", help="Python module name (defaults to snake_case of name)"
+        )
+        new_parser.add_argument("--service", help="Service name (defaults to project name)")
+        new_parser.add_argument(
+            "--version", dest="version", default="1.0.0", help="Service version"
+        )
+        new_parser.add_argument("--environment", default="development", help="Environment")
+        new_parser.add_argument(
+            "--db-driver",
+            default="postgresql",
+            help="Database driver (postgresql, mysql, sqlite)",
+        )
+        new_parser.add_argument("--db-host", default="localhost", help="Database host")
+        new_parser.add_argument("--db-port", default="5432", help="Database port")
+        new_parser.add_argument("--db-name", help="Database name (defaults to project name)")
+        new_parser.add_argument("--db-user", default="postgres", help="Database user")
+        new_parser.add_argument("--port", default="5000", help="Server port")
+        new_parser.add_argument("-o", "--output", help="Output directory")
+        new_parser.add_argument(
+            "-f", "--force", action="store_true", help="Overwrite existing files"
+        )
+        new_parser.add_argument("--template-dir", help="Custom template directory")
+        new_parser.add_argument("--no-telemetry", action="store_true", help="Disable TelemetryFlow")
+        new_parser.add_argument("--no-swagger", action="store_true", help="Disable Swagger")
+        new_parser.add_argument("--no-cors", action="store_true", help="Disable CORS")
+        new_parser.add_argument("--no-auth", action="store_true", help="Disable JWT auth")
+        new_parser.add_argument(
+            "--no-rate-limit", action="store_true", help="Disable rate limiting"
+        )
 
     # ===== entity command =====
     entity_parser = subparsers.add_parser(
@@ -843,17 +841,18 @@ def main(argv: list[str] | None = None) -> int:
         help="Add a new entity with full CRUD",
         description="Generate domain entity, repository, commands, queries, handlers, and API endpoints",
     )
-    entity_parser.add_argument(
-        "-n", "--name", required=True, help="Entity name (e.g., User, Product)"
-    )
-    entity_parser.add_argument(
-        "-f",
-        "--fields",
-        help="Entity fields (e.g., 'name:string,email:string,age:int')",
-    )
-    entity_parser.add_argument("-o", "--output", help="Project root directory")
-    entity_parser.add_argument("--force", action="store_true", help="Overwrite existing files")
-    entity_parser.add_argument("--template-dir", help="Custom template directory")
+    if "entity" in requested:
+        entity_parser.add_argument(
+            "-n", "--name", required=True, help="Entity name (e.g., User, Product)"
+        )
+        entity_parser.add_argument(
+            "-f",
+            "--fields",
+            help="Entity fields (e.g., 'name:string,email:string,age:int')",
+        )
+        entity_parser.add_argument("-o", "--output", help="Project root directory")
+        entity_parser.add_argument("--force", action="store_true", help="Overwrite existing files")
+        entity_parser.add_argument("--template-dir", help="Custom template directory")
 
     # ===== version command =====
     subparsers.add_parser("version", help="Show version information")
@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
-from collections.abc import Generator
+import time
+from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar, NoReturn
 
+from telemetryflow.application._fastinit import positional_initializer
+from telemetryflow.application._pool import ClassPool
 from telemetryflow.application.commands import (
+    EMPTY_ATTRIBUTES,
     AddSpanEventCommand,
+    AddSpanEventsBatchCommand,
+    Command,
+    EmitBatchLogsCommand,
     EmitLogCommand,
     EndSpanCommand,
+    FinishRequestCommand,
     FlushTelemetryCommand,
     InitializeSDKCommand,
+    MetricCommand,
+    RecordBatchMetricsCommand,
     RecordCounterCommand,
     RecordGaugeCommand,
     RecordHistogramCommand,
@@ -23,11 +35,65 @@ from telemetryflow.application.commands import (
     SpanKind,
     StartSpanCommand,
 )
-from telemetryflow.infrastructure.handlers import TelemetryCommandHandler
+from telemetryflow.version import __version__
 
 if TYPE_CHECKING:
     from telemetryflow.domain.config import TelemetryConfig
 
+# ID of the span active in the current thread or asyncio task
+_current_span: ContextVar[str | None] = ContextVar("telemetryflow_current_span", default=None)
+
+# Commands created on every telemetry call are pooled per client. The handler
+# consumes them synchronously, so they go back to the pool once handled.
+_POOLED_COMMANDS: tuple[type[Command], ...] = (
+    StartSpanCommand,
+    EndSpanCommand,
+    AddSpanEventCommand,
+    RecordCounterCommand,
+    RecordHistogramCommand,
+    EmitLogCommand,
+)
+_POOL_CAPACITY = 64
+
+# Generated initializers for the pooled commands, taking fields positionally
+# in the order the client passes them; they skip the keyword handling and
+# default checks of the dataclass __init__
+_init_start_span = positional_initializer(
+    StartSpanCommand, "name", "kind", "attributes", "parent_span_id", "links", "new_trace"
+)
+_init_end_span = positional_initializer(EndSpanCommand, "span_id", "error")
+_init_span_event = positional_initializer(AddSpanEventCommand, "span_id", "name", "attributes")
+_init_counter = positional_initializer(RecordCounterCommand, "name", "value", "attributes")
+_init_histogram = positional_initializer(
+    RecordHistogramCommand, "name", "value", "unit", "attributes"
+)
+_init_log = positional_initializer(EmitLogCommand, "message", "severity", "attributes")
+
+
+@dataclass
+class _CommandBatch:
+    """Commands buffered by TelemetryFlowClient.batch()."""
+
+    client: TelemetryFlowClient
+    metrics: list[MetricCommand] = field(default_factory=list)
+    logs: list[EmitLogCommand] = field(default_factory=list)
+    events: list[AddSpanEventCommand] = field(default_factory=list)
+
+    def add(self, command: Command) -> None:
+        """Buffer a command in the list for its type."""
+        if isinstance(command, AddSpanEventCommand):
+            self.events.append(command)
+        elif isinstance(command, EmitLogCommand):
+            self.logs.append(command)
+        else:
+            self.metrics.append(command)  # type: ignore[arg-type]
+
+
+# Batch opened by TelemetryFlowClient.batch() in the current thread or task
+_current_batch: ContextVar[_CommandBatch | None] = ContextVar(
+    "telemetryflow_current_batch", default=None
+)
+
 
 class TelemetryFlowError(Exception):
     """Base exception for TelemetryFlow SDK errors."""
@@ -63,6 +129,26 @@ class TelemetryFlowClient:
         >>> client.shutdown()
     """
 
+    # Per-event methods that skip the initialization check. Until initialize()
+    # and after shutdown() the instance's class is swapped for a subclass that
+    # overrides them with _not_initialized, so the initialized path carries no
+    # check at all.
+    _GUARDED_METHODS: ClassVar[tuple[str, ...]] = (
+        "record_metric",
+        "increment_counter",
+        "record_gauge",
+        "record_histogram",
+        "log",
+        "start_span",
+        "end_span",
+        "add_span_event",
+        "finish_request",
+    )
+
+    # Clients handed out by get_or_create(), keyed by (endpoint, api_key_id)
+    _shared: ClassVar[dict[tuple[str, str], TelemetryFlowClient]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, config: TelemetryConfig) -> None:
         """
         Initialize the TelemetryFlow client.
@@ -70,10 +156,70 @@ class TelemetryFlowClient:
         Args:
             config: The SDK configuration
         """
+        # Imported here so importing this module (or the builder) does not
+        # load the OpenTelemetry SDK until a client is actually created
+        from telemetryflow.infrastructure.handlers import TelemetryCommandHandler
+
         self._config = config
         self._handler = TelemetryCommandHandler()
-        self._lock = threading.RLock()
+        # Serializes initialize() and shutdown(); neither re-enters the other
+        self._init_lock = threading.Lock()
         self._initialized = False
+        self._shared_key: tuple[str, str] | None = None
+        self._refcount = 0
+        # Reusable instances of the commands dispatched on every call
+        self._pools: dict[type[Command], ClassPool[Any]] = {
+            command_type: ClassPool(command_type, _POOL_CAPACITY)
+            for command_type in _POOLED_COMMANDS
+        }
+        # Their handler methods, resolved once so each call skips the lookup
+        self._handlers: dict[type[Command], Callable[[Any], Any]] = {
+            command_type: self._handler.handler_for(command_type)
+            for command_type in _POOLED_COMMANDS
+        }
+        # The class to restore on initialize(); the instance starts out as its
+        # not-initialized variant
+        self._client_class = type(self)
+        self.__class__ = _not_initialized_variant(self._client_class)
+
+    @classmethod
+    def get_or_create(cls, config: TelemetryConfig) -> TelemetryFlowClient:
+        """
+        Return the shared client for the configured endpoint and API key.
+
+        The first call creates the client; later calls with the same endpoint
+        and API key ID return it and take another reference. Every holder
+        shares one object, so references are counted per call, not per
+        holder: each call must be matched by exactly one ``shutdown()``, and
+        the client is shut down by the call that releases the last reference.
+        A holder that calls ``shutdown()`` twice releases another holder's
+        reference.
+
+        Args:
+            config: The SDK configuration; must equal the configuration of an
+                existing shared client for the same endpoint and API key
+
+        Returns:
+            The shared client
+
+        Raises:
+            ValueError: If a shared client for the endpoint and API key
+                already exists with a different configuration
+        """
+        key = (config.endpoint, config.credentials.key_id)
+        with cls._shared_lock:
+            client = cls._shared.get(key)
+            if client is None:
+                client = cls(config)
+                client._shared_key = key
+                cls._shared[key] = client
+            elif client._config != config:
+                raise ValueError(
+                    f"A shared client for endpoint '{config.endpoint}' and API key "
+                    f"'{config.credentials.key_id}' already exists with a different configuration"
+                )
+            client._refcount += 1
+            return client
 
     def initialize(self) -> None:
         """
@@ -84,13 +230,21 @@ class TelemetryFlowClient:
         Raises:
             TelemetryFlowError: If initialization fails
         """
-        with self._lock:
+        # Already initialized: a plain read, no lock
+        if self._initialized:
+            return
+
+        with self._init_lock:
             if self._initialized:
                 return
 
             try:
                 command = InitializeSDKCommand(config=self._config)
                 self._handler.handle(command)
+                for pool in self._pools.values():
+                    pool.prefill()
+                # Swap first, so a thread that sees the flag can record
+                self.__class__ = self._client_class
                 self._initialized = True
             except Exception as e:
                 raise TelemetryFlowError(f"Failed to initialize SDK: {e}") from e
@@ -104,7 +258,13 @@ class TelemetryFlowClient:
         Args:
             timeout: Maximum time to wait for shutdown in seconds
         """
-        with self._lock:
+        if self._shared_key is not None and not self._release_shared():
+            return
+
+        if not self._initialized:
+            return
+
+        with self._init_lock:
             if not self._initialized:
                 return
 
@@ -113,18 +273,57 @@ class TelemetryFlowClient:
                 self._handler.handle(command)
             finally:
                 self._initialized = False
+                self.__class__ = _not_initialized_variant(self._client_class)
+
+    async def ashutdown(self, timeout: float = 30.0) -> None:
+        """
+        Shut down the SDK without blocking the event loop.
+
+        The final flush runs in a worker thread, so other tasks keep running
+        while pending telemetry is exported.
+
+        Args:
+            timeout: Maximum time to wait for shutdown in seconds
+        """
+        await asyncio.to_thread(self.shutdown, timeout)
+
+    def _release_shared(self) -> bool:
+        """Drop one reference to a shared client, returning True for the last one."""
+        with TelemetryFlowClient._shared_lock:
+            self._refcount -= 1
+            if self._refcount > 0:
+                return False
+            if self._shared_key is not None:
+                TelemetryFlowClient._shared.pop(self._shared_key, None)
+                self._shared_key = None
+            return True
 
-    def flush(self) -> None:
+    def flush(self, timeout: float = 30.0) -> None:
         """
         Force flush all pending telemetry data.
 
         This is useful before application shutdown or when you need
         to ensure data is sent immediately.
+
+        Args:
+            timeout: Maximum time to wait for each signal in seconds
         """
         self._ensure_initialized()
-        command = FlushTelemetryCommand()
+        command = FlushTelemetryCommand(timeout_seconds=timeout)
         self._handler.handle(command)
 
+    async def aflush(self, timeout: float = 30.0) -> None:
+        """
+        Force flush all pending telemetry data without blocking the event loop.
+
+        The export runs in a worker thread via asyncio.to_thread.
+
+        Args:
+            timeout: Maximum time to wait for each signal in seconds
+        """
+        self._ensure_initialized()
+        await asyncio.to_thread(self.flush, timeout)
+
     def is_initialized(self) -> bool:
         """Check if the client is initialized."""
         return self._initialized
@@ -134,6 +333,89 @@ class TelemetryFlowClient:
         """Get the SDK configuration."""
         return self._config
 
+    def _dispatch_pooled(self, command: Command) -> Any:
+        """Dispatch a command taken from its pool and return it to the pool."""
+        command_type = type(command)
+        try:
+            return self._handlers[command_type](command)
+        finally:
+            self._pools[command_type].release(command)
+
+    def _dispatch_batchable(self, command: Command) -> None:
+        """Dispatch a metric, log or span event command, or buffer it in the active batch."""
+        batch = _current_batch.get()
+        if batch is not None and batch.client is self:
+            batch.add(command)
+        elif type(command) in self._pools:
+            self._dispatch_pooled(command)
+        else:
+            self._handler.handle(command)
+
+    # Batching API
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """
+        Context manager that buffers telemetry and dispatches it on exit.
+
+        Metrics, logs and span events recorded inside the block are collected
+        per type and handed to the handler as one batch command each when the
+        block exits, including on error. Pending span events are also
+        dispatched before a span ends. Nested batches join the outer one.
+        The batch follows the current thread or asyncio task.
+
+        Example:
+            >>> with client.span("job.process"), client.batch():
+            ...     client.increment_counter("jobs.started")
+            ...     client.add_event("job_completed")
+        """
+        self._ensure_initialized()
+        current = _current_batch.get()
+        if current is not None and current.client is self:
+            yield
+            return
+
+        batch = _CommandBatch(self)
+        token = _current_batch.set(batch)
+        try:
+            yield
+        finally:
+            _current_batch.reset(token)
+            self._flush_batch(batch)
+
+    def _flush_batch(self, batch: _CommandBatch) -> None:
+        """Dispatch the buffered commands of a batch and recycle them."""
+        try:
+            if batch.metrics:
+                self._handler.handle(RecordBatchMetricsCommand(metrics=batch.metrics))
+            if batch.logs:
+                self._handler.handle(EmitBatchLogsCommand(logs=batch.logs))
+            if batch.events:
+                self._handler.handle(AddSpanEventsBatchCommand(events=batch.events))
+        finally:
+            self._release_all(batch.metrics)
+            self._release_all(batch.logs)
+            self._release_all(batch.events)
+
+    def _flush_batched_events(self) -> None:
+        """Dispatch span events buffered by the active batch before a span ends."""
+        batch = _current_batch.get()
+        if batch is None or batch.client is not self or not batch.events:
+            return
+
+        events, batch.events = batch.events, []
+        try:
+            self._handler.handle(AddSpanEventsBatchCommand(events=events))
+        finally:
+            self._release_all(events)
+
+    def _release_all(self, commands: Sequence[Command]) -> None:
+        """Return pooled commands to their pools."""
+        for command in commands:
+            pool = self._pools.get(type(command))
+            if pool is not None:
+                pool.release(command)
+
     # Metrics API
 
     def record_metric(
@@ -152,14 +434,14 @@ class TelemetryFlowClient:
             unit: Unit of measurement
             attributes: Additional attributes
         """
-        self._ensure_initialized()
-        command = RecordMetricCommand(
-            name=name,
-            value=value,
-            unit=unit,
-            attributes=attributes or {},
+        self._dispatch_batchable(
+            RecordMetricCommand(
+                name=name,
+                value=value,
+                unit=unit,
+                attributes=attributes or EMPTY_ATTRIBUTES,
+            )
         )
-        self._handler.handle(command)
 
     def increment_counter(
         self,
@@ -175,13 +457,14 @@ class TelemetryFlowClient:
             value: Amount to increment (default: 1)
             attributes: Additional attributes
         """
-        self._ensure_initialized()
-        command = RecordCounterCommand(
-            name=name,
-            value=value,
-            attributes=attributes or {},
+        self._dispatch_batchable(
+            _init_counter(
+                self._pools[RecordCounterCommand].take(),
+                name,
+                value,
+                attributes or EMPTY_ATTRIBUTES,
+            )
         )
-        self._handler.handle(command)
 
     def record_gauge(
         self,
@@ -197,13 +480,13 @@ class TelemetryFlowClient:
             value: Current value
             attributes: Additional attributes
         """
-        self._ensure_initialized()
-        command = RecordGaugeCommand(
-            name=name,
-            value=value,
-            attributes=attributes or {},
+        self._dispatch_batchable(
+            RecordGaugeCommand(
+                name=name,
+                value=value,
+                attributes=attributes or EMPTY_ATTRIBUTES,
+            )
         )
-        self._handler.handle(command)
 
     def record_histogram(
         self,
@@ -221,14 +504,15 @@ class TelemetryFlowClient:
             unit: Unit of measurement
             attributes: Additional attributes
         """
-        self._ensure_initialized()
-        command = RecordHistogramCommand(
-            name=name,
-            value=value,
-            unit=unit,
-            attributes=attributes or {},
+        self._dispatch_batchable(
+            _init_histogram(
+                self._pools[RecordHistogramCommand].take(),
+                name,
+                value,
+                unit,
+                attributes or EMPTY_ATTRIBUTES,
+            )
         )
-        self._handler.handle(command)
 
     # Logs API
 
@@ -246,13 +530,14 @@ class TelemetryFlowClient:
             severity: Log severity level
             attributes: Additional attributes
         """
-        self._ensure_initialized()
-        command = EmitLogCommand(
-            message=message,
-            severity=severity,
-            attributes=attributes or {},
+        self._dispatch_batchable(
+            _init_log(
+                self._pools[EmitLogCommand].take(),
+                message,
+                severity,
+                attributes or EMPTY_ATTRIBUTES,
+            )
         )
-        self._handler.handle(command)
 
     def log_info(
         self,
@@ -317,25 +602,37 @@ class TelemetryFlowClient:
         name: str,
         kind: SpanKind = SpanKind.INTERNAL,
         attributes: dict[str, Any] | None = None,
+        links: list[str] | None = None,
+        new_trace: bool = False,
     ) -> str:
         """
         Start a new trace span.
 
+        The span becomes a child of the current span (see use_span) unless
+        new_trace is set.
+
         Args:
             name: Span name
             kind: Span kind (internal, server, client, producer, consumer)
             attributes: Span attributes
+            links: IDs of active spans this span is causally linked to,
+                without becoming their child
+            new_trace: Start a new trace instead of joining the current span
 
         Returns:
             Span ID for use with end_span and add_span_event
         """
-        self._ensure_initialized()
-        command = StartSpanCommand(
-            name=name,
-            kind=kind,
-            attributes=attributes or {},
+        result: str = self._dispatch_pooled(
+            _init_start_span(
+                self._pools[StartSpanCommand].take(),
+                name,
+                kind,
+                attributes or EMPTY_ATTRIBUTES,
+                None if new_trace else _current_span.get(),
+                links or [],
+                new_trace,
+            )
         )
-        result: str = self._handler.handle(command)
         return result
 
     def end_span(
@@ -350,12 +647,8 @@ class TelemetryFlowClient:
             span_id: The span ID returned by start_span
             error: Optional exception if the span represents a failure
         """
-        self._ensure_initialized()
-        command = EndSpanCommand(
-            span_id=span_id,
-            error=error,
-        )
-        self._handler.handle(command)
+        self._flush_batched_events()
+        self._dispatch_pooled(_init_end_span(self._pools[EndSpanCommand].take(), span_id, error))
 
     def add_span_event(
         self,
@@ -371,11 +664,100 @@ class TelemetryFlowClient:
             name: Event name
             attributes: Event attributes
         """
-        self._ensure_initialized()
-        command = AddSpanEventCommand(
+        self._dispatch_batchable(
+            _init_span_event(
+                self._pools[AddSpanEventCommand].take(),
+                span_id,
+                name,
+                attributes or EMPTY_ATTRIBUTES,
+            )
+        )
+
+    def add_event(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Add an event to the current span.
+
+        Does nothing when no span is current.
+
+        Args:
+            name: Event name
+            attributes: Event attributes
+        """
+        span_id = _current_span.get()
+        if span_id is not None:
+            self.add_span_event(span_id, name, attributes)
+
+    def current_span_id(self) -> str | None:
+        """
+        Get the ID of the current span.
+
+        Returns:
+            The span ID activated by span() or use_span(), or None
+        """
+        return _current_span.get()
+
+    @contextmanager
+    def use_span(self, span_id: str) -> Generator[str, None, None]:
+        """
+        Make a started span current without ending it on exit.
+
+        Spans started inside the block become its children, and add_event
+        targets it. The current span follows threads and asyncio tasks.
+
+        Args:
+            span_id: The span ID returned by start_span
+
+        Yields:
+            Span ID
+        """
+        token = _current_span.set(span_id)
+        try:
+            yield span_id
+        finally:
+            _current_span.reset(token)
+
+    def finish_request(
+        self,
+        span_id: str,
+        duration: float,
+        *,
+        status_code: int = 0,
+        attributes: dict[str, Any] | None = None,
+        span_attributes: dict[str, Any] | None = None,
+        duration_metric: str = "http.request.duration",
+        error_metric: str | None = "http.errors.total",
+        error: Exception | None = None,
+    ) -> None:
+        """
+        Record the outcome of a request and end its span.
+
+        This replaces the usual record_histogram / increment_counter /
+        end_span sequence at the end of a request with a single call.
+
+        Args:
+            span_id: The request span returned by start_span
+            duration: Request duration in seconds
+            status_code: Response status code; 400 and above count as errors
+            attributes: Attributes for the duration and error metrics
+            span_attributes: Attributes set on the span before it ends
+            duration_metric: Name of the duration histogram
+            error_metric: Name of the error counter, or None to skip it
+            error: Optional exception that failed the request
+        """
+        self._flush_batched_events()
+        command = FinishRequestCommand(
             span_id=span_id,
-            name=name,
-            attributes=attributes or {},
+            duration=duration,
+            status_code=status_code,
+            attributes=attributes or EMPTY_ATTRIBUTES,
+            span_attributes=span_attributes or EMPTY_ATTRIBUTES,
+            duration_metric=duration_metric,
+            error_metric=error_metric,
+            error=error,
         )
         self._handler.handle(command)
 
@@ -385,30 +767,36 @@ class TelemetryFlowClient:
         name: str,
         kind: SpanKind = SpanKind.INTERNAL,
         attributes: dict[str, Any] | None = None,
+        links: list[str] | None = None,
+        new_trace: bool = False,
     ) -> Generator[str, None, None]:
         """
         Context manager for creating a span.
 
         This is the recommended way to create spans as it ensures
-        proper cleanup even if an exception occurs.
+        proper cleanup even if an exception occurs. The span is current
+        for the duration of the block.
 
         Args:
             name: Span name
             kind: Span kind
             attributes: Span attributes
+            links: IDs of active spans this span is causally linked to
+            new_trace: Start a new trace instead of joining the current span
 
         Yields:
             Span ID
 
         Example:
-            >>> with client.span("process_request", SpanKind.SERVER) as span_id:
+            >>> with client.span("process_request", SpanKind.SERVER):
             ...     # Do work
-            ...     client.add_span_event(span_id, "checkpoint")
+            ...     client.add_event("checkpoint")
         """
-        span_id = self.start_span(name, kind, attributes)
+        span_id = self.start_span(name, kind, attributes, links, new_trace)
         error: Exception | None = None
         try:
-            yield span_id
+            with self.use_span(span_id):
+                yield span_id
         except Exception as e:
             error = e
             raise
@@ -425,18 +813,17 @@ class TelemetryFlowClient:
             Dictionary with SDK status information
         """
         handler = self._handler
-        uptime = None
-        if handler.start_time:
-            uptime = datetime.now(UTC) - handler.start_time
+        started = handler.start_monotonic_ns
+        uptime = None if started is None else (time.monotonic_ns() - started) / 1e9
 
         return {
             "initialized": self._initialized,
-            "version": self._get_version(),
+            "version": __version__,
             "service_name": self._config.service_name,
             "endpoint": self._config.endpoint,
             "protocol": self._config.protocol.value,
             "signals_enabled": [s.value for s in self._config.get_enabled_signals()],
-            "uptime_seconds": uptime.total_seconds() if uptime else None,
+            "uptime_seconds": uptime,
             "metrics_sent": handler.metrics_sent,
             "logs_sent": handler.logs_sent,
             "spans_sent": handler.spans_sent,
@@ -445,13 +832,11 @@ class TelemetryFlowClient:
     def _ensure_initialized(self) -> None:
         """Ensure the client is initialized."""
         if not self._initialized:
-            raise NotInitializedError("Client is not initialized. Call initialize() first.")
-
-    def _get_version(self) -> str:
-        """Get the SDK version."""
-        from telemetryflow.version import __version__
+            self._not_initialized()
 
-        return __version__
+    def _not_initialized(self, *_args: Any, **_kwargs: Any) -> NoReturn:
+        """Stand-in for the per-event methods while the client is not initialized."""
+        raise NotInitializedError("Client is not initialized. Call initialize() first.")
 
     def __enter__(self) -> TelemetryFlowClient:
         """Context manager entry."""
@@ -466,3 +851,24 @@ class TelemetryFlowClient:
         """Return string representation."""
         status = "initialized" if self._initialized else "not initialized"
         return f"TelemetryFlowClient(service={self._config.service_name}, {status})"
+
+
+# Not-initialized variant of each client class, created on first use
+_not_initialized_variants: dict[type[TelemetryFlowClient], type[TelemetryFlowClient]] = {}
+
+
+def _not_initialized_variant(cls: type[TelemetryFlowClient]) -> type[TelemetryFlowClient]:
+    """
+    Return the subclass a client of class cls belongs to while not initialized.
+
+    It overrides each of cls._GUARDED_METHODS with _not_initialized and adds
+    no instance layout, so instances can switch between the two classes by
+    assigning ``__class__``. It keeps the name of cls for reprs and errors.
+    """
+    variant = _not_initialized_variants.get(cls)
+    if variant is None:
+        namespace: dict[str, Any] = dict.fromkeys(cls._GUARDED_METHODS, cls._not_initialized)
+        namespace.update(__module__=cls.__module__, __qualname__=cls.__qualname__, __slots__=())
+        # setdefault keeps one variant per class if two threads race here
+        variant = _not_initialized_variants.setdefault(cls, type(cls.__name__, (cls,), namespace))
+    return variant
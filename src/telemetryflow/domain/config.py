@@ -72,6 +72,9 @@ class TelemetryConfig:
     grpc_read_buffer_size: int = 512 * 1024  # 512 KB
     grpc_write_buffer_size: int = 512 * 1024  # 512 KB
 
+    # HTTP exporter connection pool
+    exporter_pool_size: int = 10
+
     # Signal configuration
     enable_metrics: bool = True
     enable_logs: bool = True
@@ -87,10 +90,13 @@ class TelemetryConfig:
     # Batch settings
     batch_timeout: timedelta = field(default_factory=lambda: timedelta(seconds=10))
     batch_max_size: int = 512
+    batch_max_queue_size: int = 2048
+    batch_export_timeout: timedelta = field(default_factory=lambda: timedelta(seconds=30))
 
     # Advanced settings
     collector_id: str | None = None
     rate_limit: int = 1000  # requests per minute
+    sampling_ratio: float = 1.0  # fraction of new traces to record
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -108,10 +114,18 @@ class TelemetryConfig:
             errors.append("Timeout must be positive")
         if self.max_retries < 0:
             errors.append("Max retries must be non-negative")
+        if self.exporter_pool_size <= 0:
+            errors.append("Exporter pool size must be positive")
         if self.batch_max_size <= 0:
             errors.append("Batch max size must be positive")
+        if self.batch_max_queue_size <= 0:
+            errors.append("Batch max queue size must be positive")
+        if self.batch_export_timeout.total_seconds() <= 0:
+            errors.append("Batch export timeout must be positive")
         if self.rate_limit <= 0:
             errors.append("Rate limit must be positive")
+        if not 0.0 <= self.sampling_ratio <= 1.0:
+            errors.append("Sampling ratio must be between 0 and 1")
 
         if errors:
             raise ConfigError("; ".join(errors))
@@ -205,13 +219,21 @@ class TelemetryConfig:
         return self
 
     def with_batch_settings(
-        self, timeout: timedelta | None = None, max_size: int | None = None
+        self,
+        timeout: timedelta | None = None,
+        max_size: int | None = None,
+        max_queue_size: int | None = None,
+        export_timeout: timedelta | None = None,
     ) -> TelemetryConfig:
         """Configure batch export settings."""
         if timeout:
             self.batch_timeout = timeout
         if max_size:
             self.batch_max_size = max_size
+        if max_queue_size:
+            self.batch_max_queue_size = max_queue_size
+        if export_timeout:
+            self.batch_export_timeout = export_timeout
         return self
 
     def with_rate_limit(self, rate_limit: int) -> TelemetryConfig:
@@ -112,3 +112,23 @@ class Credentials:
             CredentialsError: If validation fails
         """
         return cls(key_id=key_id, key_secret=key_secret)
+
+    @classmethod
+    def _unchecked(cls, key_id: str, key_secret: str) -> Credentials:
+        """
+        Create Credentials without running validation.
+
+        For callers that have already checked both values against the rules
+        in ``_validate``, such as the builder.
+
+        Args:
+            key_id: A non-empty key ID starting with 'tfk_'
+            key_secret: A non-empty key secret starting with 'tfs_'
+
+        Returns:
+            A new Credentials instance
+        """
+        credentials = object.__new__(cls)
+        object.__setattr__(credentials, "key_id", key_id)
+        object.__setattr__(credentials, "key_secret", key_secret)
+        return credentials
@@ -15,6 +15,8 @@ from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
 from opentelemetry.sdk.metrics.export import MetricExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace.export import SpanExporter
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 if TYPE_CHECKING:
     from telemetryflow.domain.config import TelemetryConfig
@@ -117,6 +119,7 @@ class OTLPExporterFactory:
             "endpoint": endpoint,
             "headers": self._headers,
             "timeout": int(self._config.timeout.total_seconds()),
+            "session": self._create_http_session(),
         }
 
         if self._config.compression:
@@ -150,6 +153,7 @@ class OTLPExporterFactory:
             "endpoint": endpoint,
             "headers": self._headers,
             "timeout": int(self._config.timeout.total_seconds()),
+            "session": self._create_http_session(),
         }
 
         if self._config.compression:
@@ -159,6 +163,23 @@ class OTLPExporterFactory:
 
         return HTTPMetricExporter(**kwargs)
 
+    def _create_http_session(self) -> Session:
+        """
+        Create an HTTP session sized by the exporter pool setting.
+
+        Each exporter owns its session because exporters close their
+        session on shutdown.
+
+        Returns:
+            Session with pooled adapters mounted for http and https
+        """
+        pool_size = self._config.exporter_pool_size
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session = Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _get_http_endpoint(self, path: str) -> str:
         """
         Get the full HTTP endpoint URL.
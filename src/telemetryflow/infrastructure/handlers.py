@@ -2,33 +2,43 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import random
 import threading
-import uuid
+import time
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
+from opentelemetry.context import Context
 from opentelemetry.metrics import get_meter_provider, set_meter_provider
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.trace import SpanKind as OTELSpanKind
 from opentelemetry.trace import Status, StatusCode
 
 from telemetryflow.application.commands import (
+    EMPTY_ATTRIBUTES,
     AddSpanEventCommand,
+    AddSpanEventsBatchCommand,
     Command,
     EmitBatchLogsCommand,
     EmitLogCommand,
     EndSpanCommand,
+    FinishRequestCommand,
     FlushTelemetryCommand,
     InitializeSDKCommand,
+    RecordBatchMetricsCommand,
     RecordCounterCommand,
     RecordGaugeCommand,
     RecordHistogramCommand,
     RecordMetricCommand,
+    SeverityLevel,
     ShutdownSDKCommand,
     SpanKind,
     StartSpanCommand,
@@ -45,6 +55,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; start_span looks the kind up on every call
+_OTEL_SPAN_KINDS: dict[SpanKind, OTELSpanKind] = {
+    SpanKind.INTERNAL: OTELSpanKind.INTERNAL,
+    SpanKind.SERVER: OTELSpanKind.SERVER,
+    SpanKind.CLIENT: OTELSpanKind.CLIENT,
+    SpanKind.PRODUCER: OTELSpanKind.PRODUCER,
+    SpanKind.CONSUMER: OTELSpanKind.CONSUMER,
+}
+
+# Plain string per severity, so emit_log skips the enum's value descriptor
+_SEVERITY_NAMES: dict[SeverityLevel, str] = {level: level.value for level in SeverityLevel}
+
+# Source of the handles returned by start_span. They only key _active_spans
+# within this process, so a counter with a random start replaces uuid4;
+# OpenTelemetry still generates the exported trace and span IDs.
+_span_ids = itertools.count(random.getrandbits(32))
+
 
 class TelemetryCommandHandler:
     """
@@ -83,21 +110,14 @@ class TelemetryCommandHandler:
 
         # Statistics
         self._start_time: datetime | None = None
+        # Uptime is measured on the monotonic clock, immune to wall-clock changes
+        self._start_monotonic_ns: int | None = None
         self._metrics_sent: int = 0
         self._logs_sent: int = 0
         self._spans_sent: int = 0
 
-    def handle(self, command: Command) -> Any:
-        """
-        Handle a command by dispatching to the appropriate handler method.
-
-        Args:
-            command: The command to handle
-
-        Returns:
-            Command-specific result
-        """
-        handlers = {
+        # Handler method per command type, bound once instead of per command
+        self._dispatch: dict[type[Command], Callable[[Any], Any]] = {
             InitializeSDKCommand: self._handle_initialize,
             ShutdownSDKCommand: self._handle_shutdown,
             FlushTelemetryCommand: self._handle_flush,
@@ -105,18 +125,48 @@ class TelemetryCommandHandler:
             RecordCounterCommand: self._handle_record_counter,
             RecordGaugeCommand: self._handle_record_gauge,
             RecordHistogramCommand: self._handle_record_histogram,
+            RecordBatchMetricsCommand: self._handle_record_batch_metrics,
             EmitLogCommand: self._handle_emit_log,
             EmitBatchLogsCommand: self._handle_emit_batch_logs,
             StartSpanCommand: self._handle_start_span,
             EndSpanCommand: self._handle_end_span,
             AddSpanEventCommand: self._handle_add_span_event,
+            AddSpanEventsBatchCommand: self._handle_add_span_events_batch,
+            FinishRequestCommand: self._handle_finish_request,
         }
 
-        handler = handlers.get(type(command))
-        if handler is None:
-            raise ValueError(f"Unknown command type: {type(command).__name__}")
+    def handle(self, command: Command) -> Any:
+        """
+        Handle a command by dispatching to the appropriate handler method.
 
-        return handler(command)  # type: ignore[operator]
+        Args:
+            command: The command to handle
+
+        Returns:
+            Command-specific result
+        """
+        return self.handler_for(type(command))(command)
+
+    def handler_for(self, command_type: type[Command]) -> Callable[[Any], Any]:
+        """
+        Return the bound handler method for a command type.
+
+        Callers on hot paths can resolve the method once and call it directly,
+        skipping the type lookup that handle() performs on every command.
+
+        Args:
+            command_type: The command class
+
+        Returns:
+            The handler method, which takes a command of that type
+
+        Raises:
+            ValueError: If the command type is not supported
+        """
+        handler = self._dispatch.get(command_type)
+        if handler is None:
+            raise ValueError(f"Unknown command type: {command_type.__name__}")
+        return handler
 
     def _handle_initialize(self, command: InitializeSDKCommand) -> None:
         """Initialize the SDK with the given configuration."""
@@ -139,6 +189,7 @@ class TelemetryCommandHandler:
 
             self._initialized = True
             self._start_time = datetime.now(UTC)
+            self._start_monotonic_ns = time.monotonic_ns()
             logger.info(f"TelemetryFlow SDK initialized for service '{self._config.service_name}'")
 
     def _init_tracer(self, resource: Resource) -> None:
@@ -147,13 +198,19 @@ class TelemetryCommandHandler:
             return
 
         trace_exporter = self._exporter_factory.create_trace_exporter()
+        max_queue_size = self._config.batch_max_queue_size
         self._span_processor = BatchSpanProcessor(
             trace_exporter,
-            max_queue_size=self._config.batch_max_size,
+            max_queue_size=max_queue_size,
+            max_export_batch_size=min(self._config.batch_max_size, max_queue_size),
             schedule_delay_millis=int(self._config.batch_timeout.total_seconds() * 1000),
+            export_timeout_millis=int(self._config.batch_export_timeout.total_seconds() * 1000),
         )
 
-        self._tracer_provider = TracerProvider(resource=resource)
+        self._tracer_provider = TracerProvider(
+            resource=resource,
+            sampler=ParentBased(TraceIdRatioBased(self._config.sampling_ratio)),
+        )
         self._tracer_provider.add_span_processor(self._span_processor)
         trace.set_tracer_provider(self._tracer_provider)
         self._tracer = trace.get_tracer(
@@ -221,16 +278,17 @@ class TelemetryCommandHandler:
             if errors:
                 raise RuntimeError(f"Shutdown completed with {len(errors)} error(s)")
 
-    def _handle_flush(self, _command: FlushTelemetryCommand) -> None:
+    def _handle_flush(self, command: FlushTelemetryCommand) -> None:
         """Force flush all pending telemetry data."""
         if not self._initialized:
             return
 
+        timeout_millis = int(command.timeout_seconds * 1000)
         if self._tracer_provider is not None:
-            self._tracer_provider.force_flush()
+            self._tracer_provider.force_flush(timeout_millis=timeout_millis)
 
         if self._meter_provider is not None:
-            self._meter_provider.force_flush()
+            self._meter_provider.force_flush(timeout_millis=timeout_millis)
 
     def _handle_record_metric(self, command: RecordMetricCommand) -> None:
         """Record a generic metric (as gauge)."""
@@ -253,13 +311,7 @@ class TelemetryCommandHandler:
             return
 
         with self._instruments_lock:
-            if command.name not in self._counters:
-                self._counters[command.name] = self._meter.create_counter(
-                    command.name,
-                    description=f"Counter for {command.name}",
-                )
-
-            counter = self._counters[command.name]
+            counter = self._get_counter(command.name)
 
         attrs = self._convert_attributes(command.attributes)
         counter.add(command.value, attrs)
@@ -291,19 +343,49 @@ class TelemetryCommandHandler:
             return
 
         with self._instruments_lock:
-            if command.name not in self._histograms:
-                self._histograms[command.name] = self._meter.create_histogram(
-                    command.name,
-                    unit=command.unit or "1",
-                    description=f"Histogram for {command.name}",
-                )
-
-            histogram = self._histograms[command.name]
+            histogram = self._get_histogram(command.name, command.unit)
 
         attrs = self._convert_attributes(command.attributes)
         histogram.record(command.value, attrs)
         self._metrics_sent += 1
 
+    def _get_counter(self, name: str) -> Any:
+        """Return the counter for a name, creating it on first use (lock held)."""
+        counter = self._counters.get(name)
+        if counter is None:
+            assert self._meter is not None
+            counter = self._meter.create_counter(name, description=f"Counter for {name}")
+            self._counters[name] = counter
+        return counter
+
+    def _get_histogram(self, name: str, unit: str) -> Any:
+        """Return the histogram for a name, creating it on first use (lock held)."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            assert self._meter is not None
+            histogram = self._meter.create_histogram(
+                name,
+                unit=unit or "1",
+                description=f"Histogram for {name}",
+            )
+            self._histograms[name] = histogram
+        return histogram
+
+    def _handle_record_batch_metrics(self, command: RecordBatchMetricsCommand) -> None:
+        """Record multiple metric values."""
+        if not self._initialized or self._meter is None:
+            return
+
+        for metric in command.metrics:
+            if isinstance(metric, RecordCounterCommand):
+                self._handle_record_counter(metric)
+            elif isinstance(metric, RecordHistogramCommand):
+                self._handle_record_histogram(metric)
+            elif isinstance(metric, RecordGaugeCommand):
+                self._handle_record_gauge(metric)
+            else:
+                self._handle_record_metric(metric)
+
     def _handle_emit_log(self, command: EmitLogCommand) -> None:
         """Emit a log entry."""
         if not self._initialized:
@@ -314,8 +396,10 @@ class TelemetryCommandHandler:
         if self._tracer is not None:
             current_span = trace.get_current_span()
             if current_span.is_recording():
-                attrs = self._convert_attributes(command.attributes)
-                attrs["log.severity"] = command.severity.value
+                attrs = {
+                    **self._convert_attributes(command.attributes),
+                    "log.severity": _SEVERITY_NAMES[command.severity],
+                }
                 current_span.add_event(command.message, attrs)
 
         self._logs_sent += 1
@@ -333,15 +417,33 @@ class TelemetryCommandHandler:
         # Convert span kind
         otel_kind = self._convert_span_kind(command.kind)
 
+        # Resolve the parent and links to other active spans. Without a
+        # context OpenTelemetry parents the span to its current span, so a
+        # new trace starts from an empty context
+        parent_context = Context() if command.new_trace else None
+        links: list[trace.Link] = []
+        if command.parent_span_id or command.links:
+            with self._spans_lock:
+                if command.parent_span_id:
+                    parent = self._active_spans.get(command.parent_span_id)
+                    if parent is not None:
+                        parent_context = trace.set_span_in_context(parent)
+                for linked_id in command.links:
+                    linked = self._active_spans.get(linked_id)
+                    if linked is not None:
+                        links.append(trace.Link(linked.get_span_context()))
+
         # Start the span
         span = self._tracer.start_span(
             command.name,
+            context=parent_context,
             kind=otel_kind,
             attributes=self._convert_attributes(command.attributes),
+            links=links,
         )
 
         # Generate and store span ID
-        span_id = str(uuid.uuid4())
+        span_id = f"{next(_span_ids):016x}"
         with self._spans_lock:
             self._active_spans[span_id] = span
 
@@ -357,9 +459,13 @@ class TelemetryCommandHandler:
             logger.warning(f"Span not found: {command.span_id}")
             return
 
-        if command.error:
-            span.set_status(Status(StatusCode.ERROR, str(command.error)))
-            span.record_exception(command.error)
+        self._end_span(span, command.error)
+
+    def _end_span(self, span: Span, error: Exception | None) -> None:
+        """Set the span status from the error, if any, and end it."""
+        if error:
+            span.set_status(Status(StatusCode.ERROR, str(error)))
+            span.record_exception(error)
         else:
             span.set_status(Status(StatusCode.OK))
 
@@ -377,19 +483,56 @@ class TelemetryCommandHandler:
         attrs = self._convert_attributes(command.attributes)
         span.add_event(command.name, attrs)
 
+    def _handle_add_span_events_batch(self, command: AddSpanEventsBatchCommand) -> None:
+        """Add multiple events to active spans, resolving the spans under one lock."""
+        with self._spans_lock:
+            spans = [self._active_spans.get(event.span_id) for event in command.events]
+
+        for event, span in zip(command.events, spans, strict=True):
+            if span is None:
+                logger.warning(f"Span not found: {event.span_id}")
+                continue
+            span.add_event(event.name, self._convert_attributes(event.attributes))
+
+    def _handle_finish_request(self, command: FinishRequestCommand) -> None:
+        """Record request metrics and end the request span."""
+        with self._spans_lock:
+            span = self._active_spans.pop(command.span_id, None)
+
+        if self._initialized and self._meter is not None:
+            error_metric = command.error_metric if command.failed else None
+            with self._instruments_lock:
+                histogram = self._get_histogram(command.duration_metric, "s")
+                error_counter = self._get_counter(error_metric) if error_metric else None
+
+            attrs = self._convert_attributes(command.attributes)
+            histogram.record(command.duration, attrs)
+            self._metrics_sent += 1
+            if error_counter is not None:
+                error_counter.add(1, attrs)
+                self._metrics_sent += 1
+
+        if span is None:
+            logger.warning(f"Span not found: {command.span_id}")
+            return
+
+        if command.span_attributes:
+            span.set_attributes(self._convert_attributes(command.span_attributes))
+        self._end_span(span, command.error)
+
     def _convert_span_kind(self, kind: SpanKind) -> OTELSpanKind:
         """Convert SDK SpanKind to OpenTelemetry SpanKind."""
-        mapping = {
-            SpanKind.INTERNAL: OTELSpanKind.INTERNAL,
-            SpanKind.SERVER: OTELSpanKind.SERVER,
-            SpanKind.CLIENT: OTELSpanKind.CLIENT,
-            SpanKind.PRODUCER: OTELSpanKind.PRODUCER,
-            SpanKind.CONSUMER: OTELSpanKind.CONSUMER,
-        }
-        return mapping.get(kind, OTELSpanKind.INTERNAL)
+        return _OTEL_SPAN_KINDS.get(kind, OTELSpanKind.INTERNAL)
+
+    def _convert_attributes(self, attributes: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Convert attributes to OpenTelemetry compatible format.
 
-    def _convert_attributes(self, attributes: dict[str, Any]) -> dict[str, Any]:
-        """Convert attributes to OpenTelemetry compatible format."""
+        Calls without attributes get the shared read-only EMPTY_ATTRIBUTES
+        rather than a new dict; OpenTelemetry copies attributes it keeps.
+        """
+        if not attributes:
+            return EMPTY_ATTRIBUTES
         result: dict[str, Any] = {}
         for key, value in attributes.items():
             # OpenTelemetry supports: str, bool, int, float, and sequences of these
@@ -418,6 +561,11 @@ class TelemetryCommandHandler:
         """Get the SDK start time."""
         return self._start_time
 
+    @property
+    def start_monotonic_ns(self) -> int | None:
+        """Get the SDK start time as a ``time.monotonic_ns()`` reading."""
+        return self._start_monotonic_ns
+
     @property
     def metrics_sent(self) -> int:
         """Get the number of metrics sent."""
@@ -0,0 +1,7 @@
+"""Runtime primitives for moving work between threads."""
+
+from telemetryflow.runtime.mpmc_ring import MpmcRing
+
+__all__ = [
+    "MpmcRing",
+]
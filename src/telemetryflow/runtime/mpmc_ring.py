@@ -0,0 +1,197 @@
+"""Multi-producer/multi-consumer ring buffer."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+
+
+class _Slot[T]:
+    """A ring slot: its sequence number, payload and wakeup condition."""
+
+    __slots__ = ("seq", "item", "cond")
+
+    def __init__(self, seq: int) -> None:
+        self.seq = seq
+        self.item: T | None = None
+        self.cond = threading.Condition(threading.Lock())
+
+
+class MpmcRing[T]:
+    """
+    Bounded FIFO shared by any number of producer and consumer threads.
+
+    Follows the sequenced-slot design of Vyukov's bounded MPMC queue. Each
+    slot carries a sequence number telling which position may use it next.
+    Producers advance the tail and consumers advance the head, each under
+    its own short lock, so ``put_many()`` can reserve consecutive positions
+    for a whole batch at once and ``len()`` is the distance between the two.
+    Each thread then only locks the slot it claimed, and threads working on
+    different slots never contend.
+
+    ``put()`` blocks while the claimed slot still holds an unread item, and
+    ``get()`` blocks until its slot is filled. A claimed position cannot be
+    given back, so neither call takes a timeout; ``close()`` wakes every
+    waiter instead. Every ``put()`` that returns is delivered, even if its
+    slot is filled after ``close()``; a producer still waiting for a slot
+    to free up raises instead, and consumers skip its position. Once the
+    ring is empty, ``get()`` returns None and ``put()`` raises. Items must
+    not be None.
+
+    Example:
+        >>> ring: MpmcRing[str] = MpmcRing(1024)
+        >>> ring.put("job")  # any producer thread
+        >>> ring.get()  # any consumer thread
+        'job'
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Create an empty ring.
+
+        Args:
+            capacity: Number of slots; must be a power of two, at least 2
+        """
+        # With one slot a filled sequence number equals the next producer's position
+        if capacity < 2 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two, at least 2")
+        self._slots: list[_Slot[T]] = [_Slot(seq) for seq in range(capacity)]
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._tail = 0  # next position to fill, advanced under _tail_lock
+        self._tail_lock = threading.Lock()
+        self._head = 0  # next position to read, advanced under _head_lock
+        self._head_lock = threading.Lock()
+        # Set under _tail_lock, so no position is claimed after close()
+        self._closed = False
+        # Claimed positions whose producer gave up at close(), under _tail_lock
+        self._abandoned: set[int] = set()
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the ring."""
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """
+        Return the number of queued items; a snapshot under concurrent use.
+
+        Positions count from the moment they are claimed, so an item being
+        written is included and one being read is not.
+        """
+        # Consumers waiting on an empty ring claim positions past the tail
+        return max(self._tail - self._head, 0)
+
+    def put(self, item: T) -> None:
+        """
+        Add an item, waiting for its slot to be free if the ring is full.
+
+        Args:
+            item: The item to enqueue
+
+        Raises:
+            RuntimeError: If the ring is closed
+        """
+        with self._tail_lock:
+            if self._closed:
+                raise RuntimeError("ring is closed")
+            pos = self._tail
+            self._tail = pos + 1
+        self._fill(pos, item)
+
+    def put_many(self, items: Sequence[T]) -> None:
+        """
+        Add several items at consecutive positions.
+
+        The positions are reserved in one step, so items from other producers
+        cannot interleave with the batch.
+
+        Args:
+            items: The items to enqueue, in order
+
+        Raises:
+            RuntimeError: If the ring is closed
+        """
+        with self._tail_lock:
+            if self._closed:
+                raise RuntimeError("ring is closed")
+            start = self._tail
+            self._tail = end = start + len(items)
+        for pos, item in enumerate(items, start):
+            try:
+                self._fill(pos, item)
+            except RuntimeError:
+                self._abandon(range(pos + 1, end))
+                raise
+
+    def _fill(self, pos: int, item: T) -> None:
+        """Store an item at a reserved position once its slot is free."""
+        slot = self._slots[pos & self._mask]
+        with slot.cond:
+            while slot.seq != pos:
+                if self._closed:
+                    # The slot may never free up; release the consumer of pos
+                    with self._tail_lock:
+                        self._abandoned.add(pos)
+                    slot.cond.notify_all()
+                    raise RuntimeError("ring is closed")
+                slot.cond.wait()
+            slot.item = item
+            slot.seq = pos + 1
+            slot.cond.notify_all()
+
+    def get(self) -> T | None:
+        """
+        Remove and return the oldest item, waiting for one if necessary.
+
+        Returns:
+            The oldest item, or None once the ring is closed and empty
+        """
+        while True:
+            with self._head_lock:
+                pos = self._head
+                self._head = pos + 1
+            slot = self._slots[pos & self._mask]
+            with slot.cond:
+                while slot.seq != pos + 1:
+                    if self._closed:
+                        with self._tail_lock:
+                            unclaimed = pos >= self._tail
+                            abandoned = pos in self._abandoned
+                            self._abandoned.discard(pos)
+                        if unclaimed:
+                            return None
+                        if abandoned:
+                            break
+                    # A claimed position is filled even after close()
+                    slot.cond.wait()
+                else:
+                    item = slot.item
+                    slot.item = None
+                    # Free the slot for the producer one lap ahead
+                    slot.seq = pos + self._capacity
+                    slot.cond.notify_all()
+                    return item
+            # Abandoned by its producer: move on to the next position
+
+    def _abandon(self, positions: range) -> None:
+        """Mark claimed positions that will never be filled and wake their consumers."""
+        with self._tail_lock:
+            self._abandoned.update(positions)
+        for pos in positions:
+            slot = self._slots[pos & self._mask]
+            with slot.cond:
+                slot.cond.notify_all()
+
+    def close(self) -> None:
+        """Wake all waiting threads; later get() calls on an empty ring return None."""
+        with self._tail_lock:
+            self._closed = True
+        for slot in self._slots:
+            with slot.cond:
+                slot.cond.notify_all()
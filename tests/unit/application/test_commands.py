@@ -1,18 +1,22 @@
 """Unit tests for CQRS Commands."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 
 from telemetryflow.application.commands import (
+    EMPTY_ATTRIBUTES,
     AddSpanEventCommand,
+    AddSpanEventsBatchCommand,
     Command,
     CommandBus,
     EmitBatchLogsCommand,
     EmitLogCommand,
     EndSpanCommand,
+    FinishRequestCommand,
     FlushTelemetryCommand,
     InitializeSDKCommand,
+    RecordBatchMetricsCommand,
     RecordCounterCommand,
     RecordGaugeCommand,
     RecordHistogramCommand,
@@ -103,6 +107,7 @@ class TestFlushTelemetryCommand:
         cmd = FlushTelemetryCommand()
 
         assert isinstance(cmd.timestamp, datetime)
+        assert cmd.timeout_seconds == 30.0
 
 
 class TestRecordMetricCommand:
@@ -151,6 +156,24 @@ class TestRecordCounterCommand:
 
         assert cmd.value == 1
 
+    def test_default_attributes_shared_and_read_only(self) -> None:
+        """Test that commands without attributes share one immutable empty mapping."""
+        first = RecordCounterCommand(name="a")
+        second = RecordCounterCommand(name="b")
+
+        assert first.attributes is second.attributes is EMPTY_ATTRIBUTES
+        assert first.attributes == {}
+        with pytest.raises(TypeError):
+            first.attributes["key"] = "value"  # type: ignore[index]
+
+    def test_uses_slots(self) -> None:
+        """Test that commands carry no per-instance __dict__."""
+        cmd = RecordCounterCommand(name="test.counter")
+
+        assert not hasattr(cmd, "__dict__")
+        with pytest.raises(AttributeError):
+            cmd.unknown = 1  # type: ignore[attr-defined]
+
 
 class TestRecordGaugeCommand:
     """Test suite for RecordGaugeCommand."""
@@ -285,6 +308,35 @@ class TestAddSpanEventCommand:
         assert cmd.attributes == {"progress": 50}
 
 
+class TestFinishRequestCommand:
+    """Test suite for FinishRequestCommand."""
+
+    def test_create_command(self) -> None:
+        """Test creating FinishRequestCommand with defaults."""
+        cmd = FinishRequestCommand(span_id="span-123", duration=0.25, status_code=200)
+
+        assert cmd.duration_metric == "http.request.duration"
+        assert cmd.error_metric == "http.errors.total"
+        assert cmd.failed is False
+
+    def test_failed_on_error_status(self) -> None:
+        """Test that 4xx/5xx status codes count as failures."""
+        cmd = FinishRequestCommand(span_id="span-123", status_code=404)
+
+        assert cmd.failed is True
+
+    def test_failed_on_error(self) -> None:
+        """Test that an exception counts as a failure."""
+        cmd = FinishRequestCommand(span_id="span-123", error=ValueError("boom"))
+
+        assert cmd.failed is True
+
+    def test_requires_span_id(self) -> None:
+        """Test that span_id is required."""
+        with pytest.raises(ValueError, match="span_id is required"):
+            FinishRequestCommand()
+
+
 class TestCommandBus:
     """Test suite for CommandBus."""
 
@@ -381,6 +433,12 @@ class TestCommandBaseClass:
         cmd = FlushTelemetryCommand()
         assert isinstance(cmd.timestamp, datetime)
 
+    def test_timestamp_derived_from_nanoseconds(self) -> None:
+        """Test that timestamp is built from the stored epoch nanoseconds."""
+        cmd = FlushTelemetryCommand(timestamp_ns=1_700_000_000_500_000_000)
+
+        assert cmd.timestamp == datetime(2023, 11, 14, 22, 13, 20, 500000, tzinfo=UTC)
+
 
 class TestEmitBatchLogsCommand:
     """Tests for EmitBatchLogsCommand."""
@@ -400,3 +458,42 @@ class TestEmitBatchLogsCommand:
         assert len(cmd.logs) == 2
         assert cmd.logs[0].message == "Log 1"
         assert cmd.logs[1].severity == SeverityLevel.ERROR
+
+
+class TestRecordBatchMetricsCommand:
+    """Tests for RecordBatchMetricsCommand."""
+
+    def test_default_empty_metrics(self) -> None:
+        """Test default empty metrics list."""
+        cmd = RecordBatchMetricsCommand()
+        assert cmd.metrics == []
+
+    def test_with_mixed_metrics(self) -> None:
+        """Test with metrics of different types."""
+        cmd = RecordBatchMetricsCommand(
+            metrics=[
+                RecordCounterCommand(name="jobs.started"),
+                RecordHistogramCommand(name="job.duration", value=0.5, unit="s"),
+            ]
+        )
+        assert [metric.name for metric in cmd.metrics] == ["jobs.started", "job.duration"]
+
+
+class TestAddSpanEventsBatchCommand:
+    """Tests for AddSpanEventsBatchCommand."""
+
+    def test_default_empty_events(self) -> None:
+        """Test default empty events list."""
+        cmd = AddSpanEventsBatchCommand()
+        assert cmd.events == []
+
+    def test_with_multiple_events(self) -> None:
+        """Test with multiple events."""
+        cmd = AddSpanEventsBatchCommand(
+            events=[
+                AddSpanEventCommand(span_id="span-1", name="started"),
+                AddSpanEventCommand(span_id="span-1", name="completed"),
+            ]
+        )
+        assert len(cmd.events) == 2
+        assert cmd.events[1].name == "completed"
@@ -0,0 +1,77 @@
+"""Unit tests for generated positional initializers."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from telemetryflow.application._fastinit import positional_initializer
+from telemetryflow.application.commands import (
+    EmitLogCommand,
+    RecordCounterCommand,
+    SeverityLevel,
+    StartSpanCommand,
+)
+
+
+class TestPositionalInitializer:
+    """Test suite for positional_initializer."""
+
+    def test_sets_named_fields_and_defaults(self) -> None:
+        """Test that named fields come from arguments and the rest from defaults."""
+        init = positional_initializer(EmitLogCommand, "message", "attributes")
+
+        command = init(EmitLogCommand.__new__(EmitLogCommand), "hello", {"key": "value"})
+
+        assert command.message == "hello"
+        assert command.attributes == {"key": "value"}
+        assert command.severity == SeverityLevel.INFO
+        assert command.trace_id is None
+        assert command.span_id is None
+        assert isinstance(command.timestamp_ns, int)
+
+    def test_matches_dataclass_init(self) -> None:
+        """Test that the result equals a normally constructed command."""
+        init = positional_initializer(StartSpanCommand, "name", "attributes")
+
+        command = init(StartSpanCommand.__new__(StartSpanCommand), "request", {"a": 1})
+        expected = StartSpanCommand(
+            name="request", attributes={"a": 1}, timestamp_ns=command.timestamp_ns
+        )
+
+        assert command == expected
+        assert command.links is not expected.links
+
+    def test_default_factories_run_per_call(self) -> None:
+        """Test that mutable defaults are not shared between instances."""
+        init = positional_initializer(StartSpanCommand, "name")
+
+        first = init(StartSpanCommand.__new__(StartSpanCommand), "a")
+        second = init(StartSpanCommand.__new__(StartSpanCommand), "b")
+
+        assert first.links is not second.links
+
+    def test_runs_validation(self) -> None:
+        """Test that __post_init__ validation still applies."""
+        init = positional_initializer(RecordCounterCommand, "name", "value", "attributes")
+
+        with pytest.raises(ValueError, match="name is required"):
+            init(RecordCounterCommand.__new__(RecordCounterCommand), "", 1, {})
+
+    def test_unknown_field(self) -> None:
+        """Test that names must be fields of the class."""
+        with pytest.raises(ValueError, match="has no fields"):
+            positional_initializer(RecordCounterCommand, "name", "unit")
+
+    def test_required_field_without_default(self) -> None:
+        """Test that every field left out must have a default."""
+
+        @dataclass
+        class Point:
+            x: int
+            y: int = 0
+
+        with pytest.raises(TypeError, match="Point.x has no default"):
+            positional_initializer(Point, "y")
+
+        point = positional_initializer(Point, "x")(Point.__new__(Point), 3)
+        assert point == Point(3)
@@ -0,0 +1,80 @@
+"""Unit tests for ClassPool."""
+
+import pytest
+
+from telemetryflow.application._pool import ClassPool
+from telemetryflow.application.commands import EndSpanCommand, RecordCounterCommand
+
+
+class TestClassPool:
+    """Test suite for ClassPool."""
+
+    def test_invalid_capacity(self) -> None:
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="capacity must be positive"):
+            ClassPool(RecordCounterCommand, capacity=0)
+
+    def test_acquire_from_empty_pool_constructs(self) -> None:
+        """Test acquiring from an empty pool builds a new instance."""
+        pool = ClassPool(RecordCounterCommand, capacity=4)
+
+        command = pool.acquire(name="requests.total", value=2)
+
+        assert isinstance(command, RecordCounterCommand)
+        assert command.name == "requests.total"
+        assert command.value == 2
+        assert len(pool) == 0
+
+    def test_release_and_reuse(self) -> None:
+        """Test that a released instance is reused and fully reinitialized."""
+        pool = ClassPool(RecordCounterCommand, capacity=4)
+        first = pool.acquire(name="a", value=5, attributes={"key": "value"})
+        first_timestamp = first.timestamp
+        pool.release(first)
+
+        second = pool.acquire(name="b")
+
+        assert second is first
+        assert second.name == "b"
+        assert second.value == 1
+        assert second.attributes == {}
+        assert second.timestamp >= first_timestamp
+
+    def test_take_returns_uninitialized_instances(self) -> None:
+        """Test that take pops idle instances and falls back to blank ones."""
+        pool = ClassPool(RecordCounterCommand, capacity=4)
+        released = pool.acquire(name="a")
+        pool.release(released)
+
+        assert pool.take() is released
+        blank = pool.take()
+        assert isinstance(blank, RecordCounterCommand)
+        assert not hasattr(blank, "name")
+
+    def test_acquire_validates_fields(self) -> None:
+        """Test that reuse runs the same validation as construction."""
+        pool = ClassPool(RecordCounterCommand, capacity=4)
+        pool.prefill()
+
+        with pytest.raises(ValueError, match="name is required"):
+            pool.acquire(name="")
+
+    def test_release_clears_references(self) -> None:
+        """Test that idle instances do not keep field values alive."""
+        pool = ClassPool(EndSpanCommand, capacity=4)
+        command = pool.acquire(span_id="span-1", error=ValueError("boom"))
+
+        pool.release(command)
+
+        assert not hasattr(command, "span_id")
+        assert not hasattr(command, "error")
+
+    def test_prefill_and_capacity_bound(self) -> None:
+        """Test that prefill and release never exceed the capacity."""
+        pool = ClassPool(RecordCounterCommand, capacity=2)
+        pool.prefill()
+        assert len(pool) == 2
+
+        pool.release(RecordCounterCommand(name="extra"))
+
+        assert len(pool) == pool.capacity == 2
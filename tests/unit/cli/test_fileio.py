@@ -0,0 +1,60 @@
+"""Unit tests for generator file output."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from telemetryflow.cli._fileio import write_utf8
+
+
+class TestWriteUtf8:
+    """Test suite for write_utf8."""
+
+    def test_writes_utf8_and_truncates(self) -> None:
+        """Test that content is UTF-8 encoded and replaces longer old content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "out.py"
+            path.write_text("x" * 100)
+
+            write_utf8(path, "name = 'café'\n")
+
+            assert path.read_bytes() == "name = 'café'\n".encode()
+
+    def test_writes_large_content(self) -> None:
+        """Test that content larger than a pipe or page buffer is written in full."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "big.txt"
+            content = "0123456789abcdef\n" * 100_000
+
+            write_utf8(path, content)
+
+            assert path.read_text() == content
+
+    def test_writes_bytes_as_is(self) -> None:
+        """Test that pre-encoded content is written unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "out.py"
+
+            assert write_utf8(path, "é\n".encode()) is True
+            assert path.read_bytes() == b"\xc3\xa9\n"
+
+    def test_keeps_existing_file_without_force(self) -> None:
+        """Test that an existing file is left untouched when force is off."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "out.py"
+            path.write_text("old")
+
+            assert write_utf8(path, "new", force=False) is False
+            assert path.read_text() == "old"
+            assert write_utf8(path, "new") is True
+            assert path.read_text() == "new"
+
+    @pytest.mark.parametrize("force", [True, False])
+    def test_creates_missing_parents(self, force: bool) -> None:
+        """Test that missing parent directories are created on demand."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "a" / "b" / "out.py"
+
+            assert write_utf8(path, "x = 1\n", force=force) is True
+            assert path.read_text() == "x = 1\n"
@@ -2,9 +2,11 @@
 
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
+from telemetryflow import __version__
 from telemetryflow.cli.generator import (
     TemplateData,
     get_template_dir,
@@ -12,6 +14,7 @@ from telemetryflow.cli.generator import (
     main,
     render_template,
     render_template_file,
+    write_files,
 )
 
 
@@ -115,6 +118,25 @@ class TestTemplateData:
 
         assert data.service_name == "my-project"
 
+    def test_template_data_is_frozen(self) -> None:
+        """Test that TemplateData cannot be changed after construction."""
+        data = TemplateData(project_name="my-project")
+
+        with pytest.raises(AttributeError):
+            data.port = "9090"  # type: ignore[misc]
+
+    def test_template_data_to_dict_is_cached(self) -> None:
+        """Test that to_dict builds the dictionary once."""
+        data = TemplateData(project_name="my-project")
+
+        assert data.to_dict() is data.to_dict()
+
+    def test_template_data_is_slotted(self) -> None:
+        """Test that TemplateData has no per-instance dict."""
+        data = TemplateData(project_name="my-project")
+
+        assert not hasattr(data, "__dict__")
+
 
 class TestTemplateLoading:
     """Test suite for template loading functions."""
@@ -127,6 +149,11 @@ class TestTemplateLoading:
         assert template_dir.is_dir()
         assert (template_dir / "env.tpl").exists()
 
+    def test_template_loading_is_cached(self) -> None:
+        """Test that the directory and template contents are resolved once."""
+        assert get_template_dir() is get_template_dir()
+        assert load_template("env.tpl") is load_template("env.tpl")
+
     def test_load_template_env(self) -> None:
         """Test loading env.tpl template."""
         content = load_template("env.tpl")
@@ -204,6 +231,31 @@ class TestTemplateLoading:
 
             assert "Custom template" in content
 
+    def test_load_template_custom_dir_read_once(self) -> None:
+        """Test that an unchanged custom template is read from disk only once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "once.tpl").write_text("first")
+
+            with mock.patch.object(Path, "read_text", autospec=True, return_value="first") as read:
+                for _ in range(3):
+                    assert load_template("once.tpl", Path(tmpdir)) == "first"
+
+            assert read.call_count == 1
+
+    def test_load_template_custom_dir_sees_changes(self) -> None:
+        """Test that an edited or deleted custom template is not served from the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            custom_template = Path(tmpdir) / "edited.tpl"
+            custom_template.write_text("first")
+            assert load_template("edited.tpl", Path(tmpdir)) == "first"
+
+            custom_template.write_text("second version")
+            assert load_template("edited.tpl", Path(tmpdir)) == "second version"
+
+            custom_template.unlink()
+            with pytest.raises(FileNotFoundError, match="Template not found"):
+                load_template("edited.tpl", Path(tmpdir))
+
 
 class TestTemplateRendering:
     """Test suite for template rendering functions."""
@@ -259,6 +311,49 @@ Endpoint: ${endpoint}
         assert "file-service" in result
 
 
+class TestWriteFiles:
+    """Test suite for batched file writing."""
+
+    @pytest.mark.parametrize("count", [3, 12])
+    def test_writes_every_file(self, count: int, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that serial and pooled batches write and report every file in order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = [(Path(tmpdir) / f"pkg{n % 2}" / f"f{n}.txt", str(n)) for n in range(count)]
+
+            assert write_files(files) == count
+
+            assert [path.read_text() for path, _ in files] == [str(n) for n in range(count)]
+            reported = capsys.readouterr().out.splitlines()
+            assert reported == [f"Generated: {path}" for path, _ in files]
+
+    def test_skips_existing_without_force(self) -> None:
+        """Test that existing files are kept unless force is set."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "existing.txt"
+            path.write_text("old")
+
+            assert write_files([(path, "new")]) == 0
+            assert path.read_text() == "old"
+            assert write_files([(path, "new")], force=True) == 1
+            assert path.read_text() == "new"
+
+    def test_reports_mixed_batch_in_order(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that skipped and written files are reported in batch order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            existing = Path(tmpdir) / "b.txt"
+            existing.write_text("old")
+            files = [(Path(tmpdir) / name, "new") for name in ("a.txt", "b.txt", "c.txt")]
+
+            assert write_files(files) == 2
+
+            assert existing.read_text() == "old"
+            assert capsys.readouterr().out.splitlines() == [
+                f"Generated: {files[0][0]}",
+                f"Skipping {existing} (already exists, use --force to overwrite)",
+                f"Generated: {files[2][0]}",
+            ]
+
+
 class TestCLI:
     """Test suite for CLI main function."""
 
@@ -267,11 +362,33 @@ class TestCLI:
         result = main(["version"])
         assert result == 0
 
+    @pytest.mark.parametrize("flag", ["--version", "-v"])
+    def test_cli_version_flag(self, flag: str, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that the version flag prints the program version without a banner."""
+        assert main(["--no-banner", flag]) == 0
+        assert capsys.readouterr().out == f"telemetryflow-gen {__version__}\n"
+
     def test_cli_help(self) -> None:
         """Test CLI help (no command)."""
         result = main([])
         assert result == 0
 
+    def test_cli_help_lists_every_command(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that top-level help lists commands whose arguments were not added."""
+        main(["--no-banner"])
+
+        out = capsys.readouterr().out
+        for command in ("init", "example", "config", "version"):
+            assert command in out
+
+    def test_cli_option_value_named_like_command(self) -> None:
+        """Test that a value spelled like another command does not break parsing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = main(["--no-banner", "config", "-n", "init", "-o", tmpdir])
+
+            assert result == 0
+            assert "init" in (Path(tmpdir) / ".env.telemetryflow").read_text()
+
     def test_cli_init_creates_files(self) -> None:
         """Test CLI init command creates files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from telemetryflow import __version__
 from telemetryflow.cli.generator_restapi import (
     EntityField,
     TemplateData,
@@ -21,6 +22,7 @@ from telemetryflow.cli.generator_restapi import (
     render_entity_template_file,
     render_template,
     render_template_file,
+    render_with_fields,
     to_camel_case,
     to_pascal_case,
     to_snake_case,
@@ -109,6 +111,17 @@ class TestEntityField:
         assert field.sqlalchemy_type == "String(255)"
         assert field.nullable is False
 
+    def test_entity_field_snake_name(self) -> None:
+        """Test that the snake_case name is computed once on creation."""
+        field = EntityField(name="CreatedAt", field_type="datetime")
+
+        assert field.snake_name == "created_at"
+        assert field.db_column == "created_at"
+
+    def test_entity_field_is_slotted(self) -> None:
+        """Test that EntityField instances carry no per-instance dict."""
+        assert not hasattr(EntityField(name="Name", field_type="string"), "__dict__")
+
     def test_create_entity_field_nullable(self) -> None:
         """Test creating nullable entity field."""
         field = EntityField(name="Description", field_type="text?", nullable=True)
@@ -165,6 +178,15 @@ class TestTemplateData:
         assert data.db_name == "my_project"
         assert data.env_prefix == "MY_PROJECT"
 
+    def test_timestamp_shared_within_process(self) -> None:
+        """Test that every instance gets the same default timestamp."""
+        first = TemplateData(project_name="First")
+        second = TemplateData(project_name="Second")
+
+        assert first.timestamp
+        assert second.timestamp == first.timestamp
+        assert TemplateData(project_name="X", timestamp="fixed").timestamp == "fixed"
+
     def test_template_data_entity(self) -> None:
         """Test creating template data with entity."""
         data = TemplateData(
@@ -185,6 +207,19 @@ class TestTemplateData:
         assert result["project_name"] == "TestProject"
         assert result["module_name"] == "test_project"
 
+    def test_template_data_to_dict_is_cached(self) -> None:
+        """Test that to_dict builds the dictionary once and renders leave it untouched."""
+        data = TemplateData(
+            project_name="TestProject",
+            entity_name="User",
+            entity_fields=[EntityField(name="Email", field_type="string")],
+        )
+        first = data.to_dict()
+        render_with_fields("${field_dto}", data)
+
+        assert data.to_dict() is first
+        assert "field_dto" not in first
+
 
 class TestTemplateLoading:
     """Test suite for template loading functions."""
@@ -353,6 +388,27 @@ class TestEntityTemplateRendering:
         assert "class User" in result
         assert "__tablename__" in result
 
+    def test_render_with_fields_substitutes_field_code(self) -> None:
+        """Test that field placeholders are filled in the same pass as the rest."""
+        data = TemplateData(
+            project_name="TestProject",
+            entity_name="User",
+            entity_fields=[EntityField(name="Email", field_type="string")],
+        )
+
+        result = render_with_fields("class ${entity_name}:\n${field_definitions}", data)
+
+        assert result == "class User:\n    email: str"
+        assert data.field_code() is data.field_code()
+        assert data.entity_context() is data.entity_context()
+        assert data.entity_context()["field_definitions"] == "    email: str"
+
+    def test_render_with_fields_without_fields(self) -> None:
+        """Test that field placeholders stay in place when there are no fields."""
+        data = TemplateData(project_name="TestProject", entity_name="User")
+
+        assert render_with_fields("${entity_name} ${field_dto}", data) == "User ${field_dto}"
+
 
 class TestCLI:
     """Test suite for CLI main function."""
@@ -362,6 +418,12 @@ class TestCLI:
         result = main(["version"])
         assert result == 0
 
+    @pytest.mark.parametrize("flag", ["--version", "-v"])
+    def test_cli_version_flag(self, flag: str, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that the version flag prints the program version without a banner."""
+        assert main(["--no-banner", flag]) == 0
+        assert capsys.readouterr().out == f"telemetryflow-restapi {__version__}\n"
+
     def test_cli_help(self) -> None:
         """Test CLI help (no command)."""
         result = main([])
@@ -438,6 +500,28 @@ class TestCLI:
             assert "sqlite" in config_content
             assert "testing" in config_content
 
+    def test_cli_entity_reads_project_name(self) -> None:
+        """Test that the module name comes from [project], not another table's name key."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "pyproject.toml").write_text(
+                '[tool.other]\nname = "wrong"\n\n[project]\nname = "shop_api"\n'
+            )
+
+            result = main(["--no-banner", "entity", "-n", "Product", "-o", tmpdir])
+
+            assert result == 0
+            assert (Path(tmpdir) / "src" / "shop_api" / "domain" / "entity" / "product.py").exists()
+            assert not (Path(tmpdir) / "src" / "wrong").exists()
+
+    @pytest.mark.parametrize("pyproject", [None, "not = [valid", '[tool.other]\nname = "x"\n'])
+    def test_cli_entity_without_project_name(self, pyproject: str | None) -> None:
+        """Test that entity fails when no [project] name can be read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            if pyproject is not None:
+                (Path(tmpdir) / "pyproject.toml").write_text(pyproject)
+
+            assert main(["--no-banner", "entity", "-n", "Product", "-o", tmpdir]) == 1
+
 
 class TestProjectTemplates:
     """Test suite for project templates."""
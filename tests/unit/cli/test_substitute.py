@@ -0,0 +1,48 @@
+"""Unit tests for compiled template substitution."""
+
+from pathlib import Path
+from string import Template
+
+import pytest
+
+from telemetryflow.cli._substitute import compile_template
+
+TEMPLATES_DIR = Path(__file__).parents[3] / "src" / "telemetryflow" / "cli" / "templates"
+
+
+class TestCompileTemplate:
+    """Test suite for compile_template."""
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "",
+            "plain text",
+            "$name and ${name}",
+            "${name}${other}",
+            "cost: $$5, $name",
+            "missing $unknown and ${unknown}",
+            "stray $ and $1 and ${ and trailing $",
+            "quotes ' \" and \\ backslash ${name}",
+        ],
+    )
+    def test_matches_safe_substitute(self, template: str) -> None:
+        """Test that rendering matches Template.safe_substitute."""
+        mapping = {"name": "svc", "other": 42}
+
+        assert compile_template(template)(mapping) == Template(template).safe_substitute(mapping)
+
+    def test_matches_safe_substitute_for_shipped_templates(self) -> None:
+        """Test every template shipped with the generators."""
+        mapping = {"project_name": "demo", "service_name": "demo-svc", "entity_name": "User"}
+        templates = sorted(TEMPLATES_DIR.rglob("*.tpl"))
+
+        assert templates
+        for path in templates:
+            source = path.read_text(encoding="utf-8")
+            expected = Template(source).safe_substitute(mapping)
+            assert compile_template(source)(mapping) == expected, path
+
+    def test_compiled_once(self) -> None:
+        """Test that the same template source reuses the compiled function."""
+        assert compile_template("${a}-${b}") is compile_template("${a}-${b}")
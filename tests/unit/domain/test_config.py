@@ -105,6 +105,26 @@ class TestTelemetryConfig:
                 batch_max_size=0,
             )
 
+    def test_invalid_sampling_ratio_raises_error(self, valid_credentials: Credentials) -> None:
+        """Test that a sampling ratio above 1 raises ConfigError."""
+        with pytest.raises(ConfigError, match="Sampling ratio must be between 0 and 1"):
+            TelemetryConfig(
+                credentials=valid_credentials,
+                endpoint="localhost:4317",
+                service_name="test-service",
+                sampling_ratio=1.5,
+            )
+
+    def test_zero_batch_queue_size_raises_error(self, valid_credentials: Credentials) -> None:
+        """Test that zero batch queue size raises ConfigError."""
+        with pytest.raises(ConfigError, match="Batch max queue size must be positive"):
+            TelemetryConfig(
+                credentials=valid_credentials,
+                endpoint="localhost:4317",
+                service_name="test-service",
+                batch_max_queue_size=0,
+            )
+
     def test_with_protocol(self, valid_credentials: Credentials) -> None:
         """Test with_protocol method."""
         config = TelemetryConfig(
@@ -559,6 +579,20 @@ class TestFluentMethods:
         assert config.batch_max_size == 1024
         assert config.batch_timeout == original_timeout
 
+    def test_with_batch_settings_queue(self, valid_credentials: Credentials) -> None:
+        """Test with_batch_settings with queue size and export timeout."""
+        config = TelemetryConfig(
+            credentials=valid_credentials,
+            endpoint="localhost:4317",
+            service_name="test-service",
+        )
+
+        config.with_batch_settings(max_queue_size=4096, export_timeout=timedelta(seconds=10))
+
+        assert config.batch_max_queue_size == 4096
+        assert config.batch_export_timeout == timedelta(seconds=10)
+        assert config.batch_max_size == 512
+
 
 class TestIsSignalEnabledEdgeCases:
     """Tests for is_signal_enabled edge cases."""
@@ -20,6 +20,13 @@ class TestCredentials:
         assert creds.key_id == "tfk_test_key_id"
         assert creds.key_secret == "tfs_test_key_secret"
 
+    def test_unchecked_matches_create(self) -> None:
+        """Test that unchecked construction yields equal credentials."""
+        creds = Credentials._unchecked("tfk_test_key_id", "tfs_test_key_secret")
+
+        assert creds == Credentials.create("tfk_test_key_id", "tfs_test_key_secret")
+        assert hash(creds) == hash(Credentials.create("tfk_test_key_id", "tfs_test_key_secret"))
+
     def test_create_credentials_using_dataclass(self) -> None:
         """Test creating credentials using dataclass constructor."""
         creds = Credentials(key_id="tfk_abc123", key_secret="tfs_xyz789")
@@ -224,6 +224,44 @@ class TestGrpcMetricExporter:
             assert "compression" in call_kwargs
 
 
+class TestHttpSession:
+    """Tests for HTTP exporter session pooling."""
+
+    def test_session_uses_pool_size(self, valid_credentials: Credentials) -> None:
+        """Test that the session adapters are sized by exporter_pool_size."""
+        config = TelemetryConfig(
+            credentials=valid_credentials,
+            endpoint="http://localhost:4318",
+            service_name="test-service",
+            protocol=Protocol.HTTP,
+            exporter_pool_size=25,
+        )
+        factory = OTLPExporterFactory(config)
+
+        session = factory._create_http_session()
+
+        adapter = session.get_adapter("https://collector.example.com")
+        assert adapter._pool_connections == 25  # type: ignore[attr-defined]
+        assert adapter._pool_maxsize == 25  # type: ignore[attr-defined]
+
+    def test_http_trace_exporter_receives_session(self, valid_credentials: Credentials) -> None:
+        """Test that the HTTP trace exporter is given a pooled session."""
+        config = TelemetryConfig(
+            credentials=valid_credentials,
+            endpoint="http://localhost:4318",
+            service_name="test-service",
+            protocol=Protocol.HTTP,
+            compression=False,
+        )
+        factory = OTLPExporterFactory(config)
+
+        with mock.patch("telemetryflow.infrastructure.exporters.HTTPSpanExporter") as mock_exporter:
+            factory._create_http_trace_exporter()
+
+            call_kwargs = mock_exporter.call_args[1]
+            assert "session" in call_kwargs
+
+
 class TestGetHttpEndpoint:
     """Tests for _get_http_endpoint method."""
 
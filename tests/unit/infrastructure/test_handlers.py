@@ -1,16 +1,23 @@
 """Unit tests for TelemetryCommandHandler."""
 
+from datetime import timedelta
 from unittest import mock
 
 import pytest
+from opentelemetry import trace
 
 from telemetryflow.application.commands import (
+    EMPTY_ATTRIBUTES,
     AddSpanEventCommand,
+    AddSpanEventsBatchCommand,
+    Command,
     EmitBatchLogsCommand,
     EmitLogCommand,
     EndSpanCommand,
+    FinishRequestCommand,
     FlushTelemetryCommand,
     InitializeSDKCommand,
+    RecordBatchMetricsCommand,
     RecordCounterCommand,
     RecordGaugeCommand,
     RecordHistogramCommand,
@@ -56,6 +63,7 @@ class TestTelemetryCommandHandlerInit:
         assert handler.is_initialized is False
         assert handler.config is None
         assert handler.start_time is None
+        assert handler.start_monotonic_ns is None
         assert handler.metrics_sent == 0
         assert handler.logs_sent == 0
         assert handler.spans_sent == 0
@@ -74,6 +82,7 @@ class TestHandleInitialize:
         assert handler.is_initialized is True
         assert handler.config == valid_config
         assert handler.start_time is not None
+        assert handler.start_monotonic_ns is not None
 
     def test_initialize_already_initialized(
         self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
@@ -121,6 +130,30 @@ class TestHandleInitialize:
 
         assert handler.is_initialized is True
 
+    def test_initialize_configures_span_processor(
+        self, handler: TelemetryCommandHandler, valid_credentials: Credentials
+    ) -> None:
+        """Test that batch settings are passed to the span processor."""
+        config = TelemetryConfig(
+            credentials=valid_credentials,
+            endpoint="localhost:4317",
+            service_name="test-service",
+            insecure=True,
+            batch_max_size=4096,
+            batch_max_queue_size=1024,
+            batch_export_timeout=timedelta(seconds=10),
+        )
+        with mock.patch(
+            "telemetryflow.infrastructure.handlers.BatchSpanProcessor"
+        ) as mock_processor:
+            handler.handle(InitializeSDKCommand(config=config))
+
+        kwargs = mock_processor.call_args.kwargs
+        assert kwargs["max_queue_size"] == 1024
+        # Export batches are clamped to the queue size
+        assert kwargs["max_export_batch_size"] == 1024
+        assert kwargs["export_timeout_millis"] == 10000
+
 
 class TestHandleShutdown:
     """Tests for _handle_shutdown method."""
@@ -183,6 +216,23 @@ class TestHandleFlush:
         # Should not raise
         handler.handle(flush_cmd)
 
+    def test_flush_passes_timeout(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that the flush timeout is forwarded to the providers."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        assert handler._tracer_provider is not None
+        assert handler._meter_provider is not None
+
+        with (
+            mock.patch.object(handler._tracer_provider, "force_flush") as trace_flush,
+            mock.patch.object(handler._meter_provider, "force_flush") as metric_flush,
+        ):
+            handler.handle(FlushTelemetryCommand(timeout_seconds=2.5))
+
+        trace_flush.assert_called_once_with(timeout_millis=2500)
+        metric_flush.assert_called_once_with(timeout_millis=2500)
+
 
 class TestHandleRecordMetric:
     """Tests for _handle_record_metric method."""
@@ -343,6 +393,21 @@ class TestHandleEmitLog:
 
         assert handler.logs_sent == 1
 
+    def test_emit_log_records_plain_severity(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that the severity attribute is stored as a plain string."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        span_id = handler.handle(StartSpanCommand(name="request"))
+        span = handler._active_spans[span_id]
+
+        with trace.use_span(span):
+            handler.handle(EmitLogCommand(message="slow query", severity=SeverityLevel.WARN))
+
+        severity = span.events[-1].attributes["log.severity"]
+        assert type(severity) is str
+        assert severity == "warn"
+
 
 class TestHandleEmitBatchLogs:
     """Tests for _handle_emit_batch_logs method."""
@@ -365,6 +430,54 @@ class TestHandleEmitBatchLogs:
         assert handler.logs_sent == 3
 
 
+class TestHandleBatches:
+    """Tests for the batch metric and span event handlers."""
+
+    def test_record_batch_metrics(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that every metric type in a batch is recorded."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+
+        handler.handle(
+            RecordBatchMetricsCommand(
+                metrics=[
+                    RecordCounterCommand(name="jobs.started"),
+                    RecordGaugeCommand(name="queue.size", value=3.0),
+                    RecordHistogramCommand(name="job.duration", value=0.5, unit="s"),
+                ]
+            )
+        )
+
+        assert handler.metrics_sent == 3
+
+    def test_record_batch_metrics_not_initialized(self, handler: TelemetryCommandHandler) -> None:
+        """Test that batches are ignored before initialization."""
+        handler.handle(RecordBatchMetricsCommand(metrics=[RecordCounterCommand(name="c")]))
+
+        assert handler.metrics_sent == 0
+
+    def test_add_span_events_batch(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that batched events land on their spans and unknown spans are skipped."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        span_id = handler.handle(StartSpanCommand(name="job"))
+
+        handler.handle(
+            AddSpanEventsBatchCommand(
+                events=[
+                    AddSpanEventCommand(span_id=span_id, name="started"),
+                    AddSpanEventCommand(span_id="unknown-span", name="lost"),
+                    AddSpanEventCommand(span_id=span_id, name="completed", attributes={"n": 1}),
+                ]
+            )
+        )
+
+        events = handler._active_spans[span_id].events  # type: ignore[attr-defined]
+        assert [event.name for event in events] == ["started", "completed"]
+
+
 class TestHandleStartSpan:
     """Tests for _handle_start_span method."""
 
@@ -375,6 +488,18 @@ class TestHandleStartSpan:
 
         assert result == ""
 
+    def test_span_ids_are_unique_hex(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that span IDs are distinct 16-digit hex strings."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+
+        span_ids = [handler.handle(StartSpanCommand(name="job")) for _ in range(100)]
+
+        assert len(set(span_ids)) == 100
+        assert all(len(span_id) == 16 for span_id in span_ids)
+        assert all(int(span_id, 16) >= 0 for span_id in span_ids)
+
     def test_start_span_success(
         self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
     ) -> None:
@@ -392,6 +517,55 @@ class TestHandleStartSpan:
         assert span_id != ""
         assert handler.spans_sent == 1
 
+    def test_start_span_with_links(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that links resolve to the context of active spans."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+
+        request_id = handler.handle(StartSpanCommand(name="request"))
+        query_id = handler.handle(
+            StartSpanCommand(name="query", links=[request_id, "unknown-span"])
+        )
+
+        request_span = handler._active_spans[request_id]
+        query_span = handler._active_spans[query_id]
+        assert len(query_span.links) == 1  # type: ignore[attr-defined]
+        assert query_span.links[0].context == request_span.get_span_context()  # type: ignore[attr-defined]
+
+    def test_start_span_with_parent(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that a known parent span ID makes the new span its child."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+
+        parent_id = handler.handle(StartSpanCommand(name="request"))
+        child_id = handler.handle(StartSpanCommand(name="query", parent_span_id=parent_id))
+        orphan_id = handler.handle(StartSpanCommand(name="orphan", parent_span_id="unknown-span"))
+
+        parent_context = handler._active_spans[parent_id].get_span_context()
+        child_span = handler._active_spans[child_id]
+        assert child_span.parent.span_id == parent_context.span_id  # type: ignore[attr-defined]
+        assert child_span.get_span_context().trace_id == parent_context.trace_id
+        assert handler._active_spans[orphan_id].parent is None  # type: ignore[attr-defined]
+
+    def test_start_span_new_trace_ignores_current_otel_span(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that a new trace is not parented to a span set through the OpenTelemetry API."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        assert handler._tracer is not None
+
+        with handler._tracer.start_as_current_span("instrumented") as outer:
+            joined_id = handler.handle(StartSpanCommand(name="joined"))
+            new_id = handler.handle(StartSpanCommand(name="background", new_trace=True))
+
+        outer_trace_id = outer.get_span_context().trace_id
+        new_span = handler._active_spans[new_id]
+        assert handler._active_spans[joined_id].get_span_context().trace_id == outer_trace_id
+        assert new_span.get_span_context().trace_id != outer_trace_id
+        assert new_span.parent is None  # type: ignore[attr-defined]
+
     def test_start_span_all_kinds(
         self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
     ) -> None:
@@ -488,6 +662,56 @@ class TestHandleAddSpanEvent:
         handler.handle(event_cmd)
 
 
+class TestHandleFinishRequest:
+    """Tests for _handle_finish_request method."""
+
+    def test_finish_request_success(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that a successful request records only the duration."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        span_id = handler.handle(StartSpanCommand(name="request"))
+
+        handler.handle(FinishRequestCommand(span_id=span_id, duration=0.1, status_code=200))
+
+        assert span_id not in handler._active_spans
+        assert "http.request.duration" in handler._histograms
+        assert "http.errors.total" not in handler._counters
+        assert handler.metrics_sent == 1
+
+    def test_finish_request_failure(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that a failed request also increments the error counter."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        span_id = handler.handle(StartSpanCommand(name="request"))
+
+        handler.handle(
+            FinishRequestCommand(
+                span_id=span_id,
+                duration=0.1,
+                status_code=500,
+                span_attributes={"http.status_code": 500},
+            )
+        )
+
+        assert span_id not in handler._active_spans
+        assert "http.errors.total" in handler._counters
+        assert handler.metrics_sent == 2
+
+    def test_finish_request_without_error_metric(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that failures are not counted when error_metric is None."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        span_id = handler.handle(StartSpanCommand(name="request"))
+
+        handler.handle(FinishRequestCommand(span_id=span_id, status_code=503, error_metric=None))
+
+        assert handler._counters == {}
+        assert handler.metrics_sent == 1
+
+
 class TestHandleUnknownCommand:
     """Tests for handling unknown commands."""
 
@@ -503,6 +727,28 @@ class TestHandleUnknownCommand:
             handler.handle(UnknownCommand())
 
 
+class TestHandlerFor:
+    """Tests for resolving handler methods by command type."""
+
+    def test_returns_bound_handler(
+        self, handler: TelemetryCommandHandler, valid_config: TelemetryConfig
+    ) -> None:
+        """Test that the resolved method handles commands of its type."""
+        handler.handle(InitializeSDKCommand(config=valid_config))
+        record_counter = handler.handler_for(RecordCounterCommand)
+
+        record_counter(RecordCounterCommand(name="requests.total"))
+        record_counter(RecordCounterCommand(name="requests.total"))
+
+        assert handler.metrics_sent == 2
+        handler.handle(ShutdownSDKCommand())
+
+    def test_unknown_type_raises_error(self, handler: TelemetryCommandHandler) -> None:
+        """Test that an unsupported command type is rejected."""
+        with pytest.raises(ValueError, match="Unknown command type: Command"):
+            handler.handler_for(Command)
+
+
 class TestShutdownWithErrors:
     """Tests for shutdown error handling."""
 
@@ -552,6 +798,16 @@ class TestShutdownWithErrors:
             handler.handle(shutdown_cmd)
 
 
+class TestConvertSpanKind:
+    """Tests for _convert_span_kind method."""
+
+    def test_convert_all_kinds(self, handler: TelemetryCommandHandler) -> None:
+        """Test that every SDK span kind maps to the OpenTelemetry kind of the same name."""
+        for kind in SpanKind:
+            otel_kind = handler._convert_span_kind(kind)
+            assert otel_kind.name == kind.name
+
+
 class TestConvertAttributes:
     """Tests for _convert_attributes method."""
 
@@ -626,3 +882,8 @@ class TestConvertAttributes:
 
         # Dict should be filtered out
         assert result["mixed"] == [1, "a", 2.0]
+
+    def test_empty_attributes_are_shared(self, handler: TelemetryCommandHandler) -> None:
+        """Test that converting no attributes returns the shared empty mapping."""
+        assert handler._convert_attributes({}) is EMPTY_ATTRIBUTES
+        assert handler._convert_attributes(EMPTY_ATTRIBUTES) is EMPTY_ATTRIBUTES
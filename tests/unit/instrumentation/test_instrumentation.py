@@ -215,8 +215,8 @@ class TestInstrumentSQLAlchemy:
         self, mock_is_available: mock.Mock
     ) -> None:
         """Test returns False when SQLAlchemy is not installed."""
-        mock_is_available.side_effect = (
-            lambda pkg: pkg == "opentelemetry.instrumentation.sqlalchemy"
+        mock_is_available.side_effect = lambda pkg: (
+            pkg == "opentelemetry.instrumentation.sqlalchemy"
         )
 
         result = instrument_sqlalchemy()
@@ -1,5 +1,9 @@
 """Unit tests for banner utilities."""
 
+import dataclasses
+
+import pytest
+
 from telemetryflow.banner import (
     ASCII_BANNER,
     BannerConfig,
@@ -39,6 +43,15 @@ class TestBannerConfig:
         assert config.version == "2.0.0"
         assert config.vendor == "Custom Vendor"
 
+    def test_config_is_immutable(self) -> None:
+        """Test that BannerConfig is frozen and hashable."""
+        config = BannerConfig()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.version = "2.0.0"  # type: ignore[misc]
+        assert hash(config) == hash(BannerConfig())
+        assert not hasattr(config, "__dict__")
+
 
 class TestGenerate:
     """Test suite for generate function."""
@@ -58,6 +71,12 @@ class TestGenerate:
         # Check for some ASCII art characters
         assert "_____" in banner or "═" in banner
 
+    def test_generate_is_cached(self) -> None:
+        """Test that repeated calls with an equal config reuse the rendering."""
+        config = BannerConfig(product_name="Cached SDK")
+
+        assert generate(config) is generate(BannerConfig(product_name="Cached SDK"))
+
     def test_generate_with_custom_config(self) -> None:
         """Test generate with custom config."""
         config = BannerConfig(
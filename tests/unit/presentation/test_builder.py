@@ -9,6 +9,7 @@ import pytest
 from telemetryflow.builder import (
     BuilderError,
     TelemetryFlowBuilder,
+    _compile_auto_spec,
     must_new_from_env,
     must_new_simple,
     new_builder,
@@ -32,6 +33,24 @@ class TestTelemetryFlowBuilder:
         assert builder._enable_logs is True
         assert builder._enable_traces is True
 
+    def test_builder_is_slotted(self) -> None:
+        """Test that builder state lives in slots rather than an instance dict."""
+        builder = TelemetryFlowBuilder()
+
+        assert not hasattr(builder, "__dict__")
+        with pytest.raises(AttributeError):
+            builder._unknown = 1  # type: ignore[attr-defined]
+
+    def test_from_kwargs(self) -> None:
+        """Test creating a builder with settings assigned by name."""
+        builder = TelemetryFlowBuilder._from_kwargs(service_name="svc", endpoint="host:4317")
+
+        assert builder._service_name == "svc"
+        assert builder._endpoint == "host:4317"
+        assert builder._service_version == TelemetryFlowBuilder.DEFAULT_SERVICE_VERSION
+        with pytest.raises(AttributeError):
+            TelemetryFlowBuilder._from_kwargs(unknown=1)
+
     def test_with_api_key(self) -> None:
         """Test setting API key."""
         builder = TelemetryFlowBuilder().with_api_key("tfk_key", "tfs_secret")
@@ -179,6 +198,53 @@ class TestTelemetryFlowBuilder:
         assert builder._batch_timeout == timedelta(seconds=15)
         assert builder._batch_max_size == 1024
 
+    def test_with_batch_settings_queue(self) -> None:
+        """Test setting batch queue size and export timeout."""
+        config = (
+            TelemetryFlowBuilder()
+            .with_api_key("tfk_test", "tfs_test")
+            .with_endpoint("localhost:4317")
+            .with_service("test-service")
+            .with_batch_settings(
+                max_size=256, max_queue_size=4096, export_timeout=timedelta(seconds=10)
+            )
+            .build()
+            .config
+        )
+
+        assert config.batch_max_size == 256
+        assert config.batch_max_queue_size == 4096
+        assert config.batch_export_timeout == timedelta(seconds=10)
+
+    def test_get_or_create_shares_client(self) -> None:
+        """Test that get_or_create returns one client per endpoint and key."""
+        builder = (
+            TelemetryFlowBuilder()
+            .with_api_key("tfk_test", "tfs_test")
+            .with_endpoint("shared.endpoint:4317")
+            .with_service("test-service")
+        )
+
+        first = builder.get_or_create()
+        second = builder.get_or_create()
+
+        assert first is second
+
+        first.shutdown()
+        second.shutdown()
+
+    def test_with_sampling_ratio(self) -> None:
+        """Test setting the trace sampling ratio."""
+        builder = TelemetryFlowBuilder().with_sampling_ratio(0.25)
+
+        assert builder._sampling_ratio == 0.25
+
+    def test_with_exporter_pool_size(self) -> None:
+        """Test setting the exporter pool size."""
+        builder = TelemetryFlowBuilder().with_exporter_pool_size(50)
+
+        assert builder._exporter_pool_size == 50
+
     def test_with_rate_limit(self) -> None:
         """Test setting rate limit."""
         builder = TelemetryFlowBuilder().with_rate_limit(500)
@@ -227,6 +293,15 @@ class TestTelemetryFlowBuilder:
         assert client.config.service_name == "my-service"
         assert client.config.endpoint == "localhost:4317"
 
+    def test_build_without_custom_attributes(self) -> None:
+        """Test that the attribute dict is only created when attributes are added."""
+        builder = (
+            TelemetryFlowBuilder().with_api_key("tfk_key", "tfs_secret").with_service("my-service")
+        )
+
+        assert builder._custom_attributes is None
+        assert builder.build().config.custom_attributes == {}
+
     def test_build_missing_api_key_id(self) -> None:
         """Test build fails without API key ID."""
         with pytest.raises(BuilderError, match="API key ID is required"):
@@ -259,6 +334,25 @@ class TestTelemetryFlowBuilder:
                 .build()
             )
 
+    def test_build_invalid_key_prefixes(self) -> None:
+        """Test that malformed API keys are reported by the builder."""
+        with pytest.raises(BuilderError) as exc_info:
+            TelemetryFlowBuilder().with_api_key("key", "secret").with_service("svc").build()
+
+        assert str(exc_info.value) == (
+            "API key ID must start with 'tfk_'; API key secret must start with 'tfs_'"
+        )
+
+    def test_build_reports_all_missing_settings(self) -> None:
+        """Test that every missing required setting is listed in one error."""
+        with pytest.raises(BuilderError) as exc_info:
+            TelemetryFlowBuilder().with_endpoint("").build()
+
+        assert str(exc_info.value) == (
+            "API key ID is required; API key secret is required; "
+            "Endpoint is required; Service name is required"
+        )
+
     def test_must_build(self) -> None:
         """Test must_build method."""
         client = (
@@ -341,6 +435,28 @@ class TestBuilderEnvironmentVariables:
 
             assert builder._collector_id == "collector-env"
 
+    def test_from_env_with_explicit_mapping(self) -> None:
+        """Test that the *_from_env methods read a given mapping instead of os.environ."""
+        env = {
+            "TELEMETRYFLOW_API_KEY_ID": "tfk_mapping",
+            "TELEMETRYFLOW_API_KEY_SECRET": "tfs_mapping",
+            "TELEMETRYFLOW_SERVICE_NAME": "mapping-service",
+            "ENV": "staging",
+        }
+        with mock.patch.dict(os.environ, {"TELEMETRYFLOW_SERVICE_NAME": "os-service"}):
+            builder = (
+                TelemetryFlowBuilder()
+                .with_api_key_from_env(env)
+                .with_service_from_env(env)
+                .with_environment_from_env(env)
+                .with_endpoint_from_env(env)
+            )
+
+        assert builder._api_key_id == "tfk_mapping"
+        assert builder._service_name == "mapping-service"
+        assert builder._environment == "staging"
+        assert builder._endpoint == TelemetryFlowBuilder.DEFAULT_ENDPOINT
+
     def test_with_auto_configuration(self) -> None:
         """Test auto configuration from environment."""
         with mock.patch.dict(
@@ -359,6 +475,91 @@ class TestBuilderEnvironmentVariables:
             assert builder._service_name == "auto-service"
             assert builder._environment == "auto-env"
 
+    def test_with_auto_configuration_parses_settings(self) -> None:
+        """Test that typed settings are parsed and invalid values keep the current one."""
+        with mock.patch.dict(
+            os.environ,
+            {
+                "TELEMETRYFLOW_PROTOCOL": "HTTP",
+                "TELEMETRYFLOW_INSECURE": "True",
+                "TELEMETRYFLOW_TIMEOUT": "15",
+                "TELEMETRYFLOW_RETRY_BACKOFF": "250",
+                "TELEMETRYFLOW_MAX_RETRIES": "many",
+                "TELEMETRYFLOW_ENABLE_LOGS": "false",
+                "TELEMETRYFLOW_RATE_LIMIT": "0",
+            },
+        ):
+            builder = TelemetryFlowBuilder().with_auto_configuration()
+
+        assert builder._protocol == Protocol.HTTP
+        assert builder._insecure is True
+        assert builder._timeout == timedelta(seconds=15)
+        assert builder._retry_backoff == timedelta(milliseconds=250)
+        assert builder._max_retries == 3
+        assert builder._enable_logs is False
+        assert builder._rate_limit == 1000
+
+    def test_with_auto_configuration_from_mapping(self) -> None:
+        """Test that auto configuration reads an explicit mapping instead of os.environ."""
+        env = {"TELEMETRYFLOW_SERVICE_NAME": "snapshot-service", "TELEMETRYFLOW_PROTOCOL": "http"}
+        with mock.patch.dict(os.environ, {"TELEMETRYFLOW_SERVICE_NAME": "os-service"}):
+            builder = TelemetryFlowBuilder().with_auto_configuration(env)
+
+        assert builder._service_name == "snapshot-service"
+        assert builder._protocol == Protocol.HTTP
+
+    def test_compile_auto_spec(self) -> None:
+        """Test the generated function for defaults, parsing and rejected values."""
+        spec = (
+            ("_max_retries", "RETRIES", int, 3),
+            ("_batch_max_size", "BATCH", int, 512),
+            ("_rate_limit", "LIMIT", int, None),
+        )
+        configure = _compile_auto_spec(spec)
+        builder = TelemetryFlowBuilder().with_rate_limit(50).with_batch_settings(max_size=64)
+
+        configure(builder, {"RETRIES": "7", "BATCH": "lots"})
+
+        assert builder._max_retries == 7
+        assert builder._batch_max_size == 64
+        assert builder._rate_limit == 50
+
+    def test_with_auto_configuration_unset_defaults(self) -> None:
+        """Test that unset variables apply the auto-configuration defaults."""
+        with mock.patch.dict(os.environ, clear=True):
+            builder = (
+                TelemetryFlowBuilder()
+                .with_timeout(timedelta(seconds=1))
+                .with_rate_limit(50)
+                .with_auto_configuration()
+            )
+
+        assert builder._timeout == timedelta(seconds=10)
+        assert builder._batch_timeout == timedelta(milliseconds=5000)
+        assert builder._compression is False
+        assert builder._rate_limit == 50
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("true", True),
+            ("TRUE", True),
+            ("1", True),
+            ("yes", True),
+            ("on", True),
+            ("false", False),
+            ("0", False),
+            ("no", False),
+            ("", False),
+        ],
+    )
+    def test_with_auto_configuration_boolean_spellings(self, value: str, expected: bool) -> None:
+        """Test the accepted spellings of boolean environment values."""
+        with mock.patch.dict(os.environ, {"TELEMETRYFLOW_COMPRESSION": value}):
+            builder = TelemetryFlowBuilder().with_auto_configuration()
+
+        assert builder._compression is expected
+
 
 class TestConvenienceFunctions:
     """Test suite for convenience functions."""
@@ -1,11 +1,19 @@
 """Unit tests for TelemetryFlowClient."""
 
+import threading
+from unittest import mock
+
 import pytest
 
-from telemetryflow.application.commands import SpanKind
+from telemetryflow.application.commands import (
+    InitializeSDKCommand,
+    RecordCounterCommand,
+    SpanKind,
+)
 from telemetryflow.client import NotInitializedError, TelemetryFlowClient
 from telemetryflow.domain.config import TelemetryConfig
 from telemetryflow.domain.credentials import Credentials
+from telemetryflow.version import __version__
 
 
 @pytest.fixture
@@ -74,6 +82,11 @@ class TestTelemetryFlowClient:
         with pytest.raises(NotInitializedError):
             client.start_span("test.span")
 
+    def test_finish_request_not_initialized(self, client: TelemetryFlowClient) -> None:
+        """Test finish_request fails when not initialized."""
+        with pytest.raises(NotInitializedError):
+            client.finish_request("span-123", 0.1)
+
     def test_end_span_not_initialized(self, client: TelemetryFlowClient) -> None:
         """Test end_span fails when not initialized."""
         with pytest.raises(NotInitializedError):
@@ -89,6 +102,11 @@ class TestTelemetryFlowClient:
         with pytest.raises(NotInitializedError):
             client.flush()
 
+    async def test_aflush_not_initialized(self, client: TelemetryFlowClient) -> None:
+        """Test aflush fails when not initialized."""
+        with pytest.raises(NotInitializedError):
+            await client.aflush()
+
     def test_shutdown_not_initialized(self, client: TelemetryFlowClient) -> None:
         """Test shutdown does nothing when not initialized."""
         # Should not raise
@@ -136,6 +154,27 @@ class TestTelemetryFlowClientInitialized:
         # Clean up
         client.shutdown()
 
+    def test_concurrent_initialize_runs_once(self, client: TelemetryFlowClient) -> None:
+        """Test that racing initialize() calls initialize the SDK once."""
+        handle = client._handler.handle
+        initialized: list[object] = []
+
+        def counting_handle(command: object) -> object:
+            if isinstance(command, InitializeSDKCommand):
+                initialized.append(command)
+            return handle(command)  # type: ignore[arg-type]
+
+        client._handler.handle = counting_handle  # type: ignore[method-assign]
+        threads = [threading.Thread(target=client.initialize) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        assert len(initialized) == 1
+        assert client.is_initialized() is True
+        client.shutdown()
+
     def test_shutdown_clears_flag(self, client: TelemetryFlowClient) -> None:
         """Test that shutdown clears the initialized flag."""
         client.initialize()
@@ -143,6 +182,53 @@ class TestTelemetryFlowClientInitialized:
 
         assert client.is_initialized() is False
 
+    def test_initialize_restores_client_class(self, client: TelemetryFlowClient) -> None:
+        """Test that initialized clients call the class methods without a check."""
+        assert isinstance(client, TelemetryFlowClient)
+        assert type(client) is not TelemetryFlowClient
+
+        client.initialize()
+
+        assert type(client) is TelemetryFlowClient
+        assert not set(TelemetryFlowClient._GUARDED_METHODS) & vars(client).keys()
+        assert client.increment_counter.__func__ is TelemetryFlowClient.increment_counter
+
+        client.shutdown()
+
+    def test_instance_attributes_survive_initialize(self, client: TelemetryFlowClient) -> None:
+        """Test that initialize() and shutdown() leave attributes set on the instance alone."""
+        with mock.patch.object(client, "log") as log:
+            client.initialize()
+            client.log("patched")
+            client.shutdown()
+            client.log("still patched")
+
+        assert log.call_count == 2
+
+    def test_subclass_is_kept(self, valid_config: TelemetryConfig) -> None:
+        """Test that a subclass instance returns to its own class on initialize()."""
+
+        class CustomClient(TelemetryFlowClient):
+            pass
+
+        client = CustomClient(valid_config)
+        with pytest.raises(NotInitializedError):
+            client.increment_counter("requests.total")
+
+        client.initialize()
+        assert type(client) is CustomClient
+        client.shutdown()
+        assert isinstance(client, CustomClient)
+
+    def test_events_fail_again_after_shutdown(self, client: TelemetryFlowClient) -> None:
+        """Test that shutdown restores the not-initialized errors."""
+        client.initialize()
+        client.shutdown()
+
+        for name in TelemetryFlowClient._GUARDED_METHODS:
+            with pytest.raises(NotInitializedError):
+                getattr(client, name)("x")
+
     def test_get_status(self, client: TelemetryFlowClient) -> None:
         """Test get_status returns correct info."""
         client.initialize()
@@ -150,16 +236,22 @@ class TestTelemetryFlowClientInitialized:
         status = client.get_status()
 
         assert status["initialized"] is True
+        assert status["version"] == __version__
         assert status["service_name"] == "test-service"
         assert status["endpoint"] == "localhost:4317"
         assert status["protocol"] == "grpc"
         assert "metrics" in status["signals_enabled"]
         assert "logs" in status["signals_enabled"]
         assert "traces" in status["signals_enabled"]
+        assert status["uptime_seconds"] >= 0.0
 
         # Clean up
         client.shutdown()
 
+    def test_get_status_uptime_before_initialize(self, client: TelemetryFlowClient) -> None:
+        """Test that uptime is unknown until the SDK is initialized."""
+        assert client.get_status()["uptime_seconds"] is None
+
     def test_context_manager(self, valid_config: TelemetryConfig) -> None:
         """Test client as context manager."""
         with TelemetryFlowClient(valid_config) as client:
@@ -223,6 +315,94 @@ class TestTelemetryFlowClientInitialized:
 
         client.shutdown()
 
+    def test_finish_request(self, client: TelemetryFlowClient) -> None:
+        """Test finishing a request span in one call."""
+        client.initialize()
+
+        span_id = client.start_span("GET /users", SpanKind.SERVER)
+        client.finish_request(
+            span_id,
+            0.05,
+            status_code=404,
+            attributes={"method": "GET", "path": "/users"},
+            span_attributes={"http.status_code": 404},
+        )
+
+        assert client.get_status()["metrics_sent"] == 2
+
+        client.shutdown()
+
+    def test_commands_are_pooled(self, client: TelemetryFlowClient) -> None:
+        """Test that hot-path commands are returned to their pools after dispatch."""
+        client.initialize()
+        counter_pool = client._pools[RecordCounterCommand]
+        idle = len(counter_pool)
+        assert idle == counter_pool.capacity
+
+        client.increment_counter("requests.total", attributes={"method": "GET"})
+        with client.span("request"):
+            client.log_info("handled")
+
+        assert len(counter_pool) == idle
+        assert all(len(pool) == pool.capacity for pool in client._pools.values())
+
+        client.shutdown()
+
+    def test_batch_defers_dispatch_until_exit(self, client: TelemetryFlowClient) -> None:
+        """Test that batched telemetry is dispatched once the block exits."""
+        client.initialize()
+
+        with client.span("job") as span_id:
+            with client.batch():
+                client.increment_counter("jobs.started")
+                client.record_histogram("job.duration", 0.5, unit="s")
+                client.record_gauge("queue.size", 2.0)
+                client.log_info("processing")
+                client.add_event("checkpoint")
+
+                status = client.get_status()
+                assert status["metrics_sent"] == 0
+                assert status["logs_sent"] == 0
+
+            status = client.get_status()
+            assert status["metrics_sent"] == 3
+            assert status["logs_sent"] == 1
+            events = client._handler._active_spans[span_id].events  # type: ignore[attr-defined]
+            assert [event.name for event in events] == ["checkpoint"]
+
+        assert all(len(pool) == pool.capacity for pool in client._pools.values())
+
+        client.shutdown()
+
+    def test_batch_flushes_events_before_span_ends(self, client: TelemetryFlowClient) -> None:
+        """Test that events for a span ending inside a batch are not lost."""
+        client.initialize()
+
+        with client.batch():
+            span_id = client.start_span("email.send")
+            client.add_span_event(span_id, "email_sent")
+            span = client._handler._active_spans[span_id]
+            client.end_span(span_id)
+
+            assert [event.name for event in span.events] == ["email_sent"]  # type: ignore[attr-defined]
+
+        client.shutdown()
+
+    def test_batch_flushes_on_error_and_nests(self, client: TelemetryFlowClient) -> None:
+        """Test that nested batches join the outer one and errors still flush."""
+        client.initialize()
+
+        with pytest.raises(ValueError), client.batch():
+            client.increment_counter("jobs.started")
+            with client.batch():
+                client.increment_counter("jobs.failed")
+            assert client.get_status()["metrics_sent"] == 0
+            raise ValueError("job failed")
+
+        assert client.get_status()["metrics_sent"] == 2
+
+        client.shutdown()
+
     def test_span_context_manager(self, client: TelemetryFlowClient) -> None:
         """Test span context manager."""
         client.initialize()
@@ -242,6 +422,51 @@ class TestTelemetryFlowClientInitialized:
 
         client.shutdown()
 
+    def test_span_context_manager_sets_current_span(self, client: TelemetryFlowClient) -> None:
+        """Test that nested spans track and restore the current span."""
+        client.initialize()
+
+        assert client.current_span_id() is None
+        with client.span("outer") as outer_id:
+            assert client.current_span_id() == outer_id
+            with client.span("inner") as inner_id:
+                assert client.current_span_id() == inner_id
+            assert client.current_span_id() == outer_id
+        assert client.current_span_id() is None
+
+        client.shutdown()
+
+    def test_nested_span_is_child_of_current_span(self, client: TelemetryFlowClient) -> None:
+        """Test that spans started under use_span join its trace."""
+        client.initialize()
+        active_spans = client._handler._active_spans
+
+        request_id = client.start_span("request", SpanKind.SERVER)
+        with client.use_span(request_id):
+            child_id = client.start_span("query", SpanKind.CLIENT)
+            detached_id = client.start_span("audit", new_trace=True)
+        assert client.current_span_id() is None
+
+        request_context = active_spans[request_id].get_span_context()
+        assert active_spans[child_id].parent.span_id == request_context.span_id  # type: ignore[attr-defined]
+        assert active_spans[detached_id].parent is None  # type: ignore[attr-defined]
+
+        client.shutdown()
+
+    def test_add_event_targets_current_span(self, client: TelemetryFlowClient) -> None:
+        """Test that add_event records on the current span or does nothing."""
+        client.initialize()
+
+        # No current span: should not raise
+        client.add_event("ignored")
+
+        with client.span("request") as span_id:
+            client.add_event("checkpoint", {"progress": 50})
+            events = client._handler._active_spans[span_id].events  # type: ignore[attr-defined]
+            assert [event.name for event in events] == ["checkpoint"]
+
+        client.shutdown()
+
     def test_flush(self, client: TelemetryFlowClient) -> None:
         """Test flush method."""
         client.initialize()
@@ -250,3 +475,89 @@ class TestTelemetryFlowClientInitialized:
         client.flush()
 
         client.shutdown()
+
+    async def test_aflush_and_ashutdown(self, client: TelemetryFlowClient) -> None:
+        """Test flushing and shutting down from a coroutine."""
+        client.initialize()
+        client.increment_counter("requests.total")
+
+        await client.aflush(timeout=1.0)
+        await client.ashutdown(timeout=1.0)
+
+        assert not client.is_initialized()
+
+
+class TestSharedClient:
+    """Test suite for TelemetryFlowClient.get_or_create."""
+
+    def test_returns_same_instance(self, valid_config: TelemetryConfig) -> None:
+        """Test that the same endpoint and key share one client."""
+        first = TelemetryFlowClient.get_or_create(valid_config)
+        second = TelemetryFlowClient.get_or_create(valid_config)
+
+        assert first is second
+
+        first.shutdown()
+        second.shutdown()
+
+    def test_different_key_gets_own_client(self, valid_config: TelemetryConfig) -> None:
+        """Test that a different API key gets a separate client."""
+        other_config = TelemetryConfig(
+            credentials=Credentials.create("tfk_other_key", "tfs_other_secret"),
+            endpoint="localhost:4317",
+            service_name="test-service",
+        )
+        first = TelemetryFlowClient.get_or_create(valid_config)
+        second = TelemetryFlowClient.get_or_create(other_config)
+
+        assert first is not second
+
+        first.shutdown()
+        second.shutdown()
+
+    def test_equal_config_shares_client(self, valid_config: TelemetryConfig) -> None:
+        """Test that an equal but separate configuration gets the shared client."""
+        same_config = TelemetryConfig(
+            credentials=valid_config.credentials,
+            endpoint=valid_config.endpoint,
+            service_name=valid_config.service_name,
+        )
+        first = TelemetryFlowClient.get_or_create(valid_config)
+        second = TelemetryFlowClient.get_or_create(same_config)
+
+        assert first is second
+
+        first.shutdown()
+        second.shutdown()
+
+    def test_different_config_same_key_raises(self, valid_config: TelemetryConfig) -> None:
+        """Test that a mismatched configuration does not silently get the shared client."""
+        other_config = TelemetryConfig(
+            credentials=valid_config.credentials,
+            endpoint=valid_config.endpoint,
+            service_name="other-service",
+        )
+        first = TelemetryFlowClient.get_or_create(valid_config)
+
+        with pytest.raises(ValueError, match="different configuration"):
+            TelemetryFlowClient.get_or_create(other_config)
+
+        first.shutdown()
+        replacement = TelemetryFlowClient.get_or_create(other_config)
+        assert replacement is not first
+        replacement.shutdown()
+
+    def test_shutdown_waits_for_last_reference(self, valid_config: TelemetryConfig) -> None:
+        """Test that the shared client stays up until every holder shuts down."""
+        first = TelemetryFlowClient.get_or_create(valid_config)
+        second = TelemetryFlowClient.get_or_create(valid_config)
+        first.initialize()
+
+        first.shutdown()
+        assert second.is_initialized() is True
+
+        second.shutdown()
+        assert second.is_initialized() is False
+        assert TelemetryFlowClient.get_or_create(valid_config) is not first
+
+        TelemetryFlowClient.get_or_create(valid_config).shutdown()
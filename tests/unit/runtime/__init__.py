@@ -0,0 +1 @@
+"""Runtime unit tests."""
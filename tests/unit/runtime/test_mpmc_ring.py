@@ -0,0 +1,193 @@
+"""Unit tests for MpmcRing."""
+
+import threading
+import time
+
+import pytest
+
+from telemetryflow.runtime import MpmcRing
+
+
+class TestMpmcRing:
+    """Test suite for MpmcRing."""
+
+    @pytest.mark.parametrize("capacity", [0, 1, -4, 3, 1000])
+    def test_invalid_capacity(self, capacity: int) -> None:
+        """Test that the capacity must be a power of two of at least 2."""
+        with pytest.raises(ValueError, match="power of two"):
+            MpmcRing[int](capacity)
+
+    def test_fifo_order_with_wraparound(self) -> None:
+        """Test FIFO order while positions wrap around the slots."""
+        ring: MpmcRing[int] = MpmcRing(4)
+        received = []
+        for value in range(10):
+            ring.put(value)
+            if value % 2:
+                received.append(ring.get())
+                received.append(ring.get())
+
+        assert received == list(range(10))
+        assert len(ring) == 0
+
+    def test_len_counts_queued_items(self) -> None:
+        """Test that len reports the number of unread items."""
+        ring: MpmcRing[int] = MpmcRing(4)
+        ring.put(1)
+        ring.put(2)
+
+        assert len(ring) == 2
+        assert ring.get() == 1
+        assert len(ring) == 1
+
+    def test_len_ignores_waiting_consumers(self) -> None:
+        """Test that consumers blocked on an empty ring do not make len negative."""
+        ring: MpmcRing[int] = MpmcRing(4)
+        consumer = threading.Thread(target=ring.get)
+        consumer.start()
+        while ring._head == 0:
+            time.sleep(0.001)
+
+        assert len(ring) == 0
+        ring.put(1)
+        consumer.join(timeout=5.0)
+        assert len(ring) == 0
+
+    def test_put_many_keeps_batch_together(self) -> None:
+        """Test that a batch occupies consecutive positions in order."""
+        ring: MpmcRing[int] = MpmcRing(8)
+        ring.put(0)
+        ring.put_many([1, 2, 3])
+        ring.put(4)
+
+        assert [ring.get() for _ in range(5)] == [0, 1, 2, 3, 4]
+
+    def test_put_many_larger_than_capacity(self) -> None:
+        """Test that a batch bigger than the ring waits for a consumer."""
+        ring: MpmcRing[int] = MpmcRing(2)
+        received: list[int | None] = []
+        consumer = threading.Thread(target=lambda: received.extend(ring.get() for _ in range(6)))
+        consumer.start()
+
+        ring.put_many(range(6))
+        consumer.join(timeout=5.0)
+
+        assert received == list(range(6))
+
+    def test_close_drains_then_returns_none(self) -> None:
+        """Test that queued items survive close and get then returns None."""
+        ring: MpmcRing[int] = MpmcRing(4)
+        ring.put(1)
+        ring.close()
+
+        assert ring.closed
+        assert ring.get() == 1
+        assert ring.get() is None
+        with pytest.raises(RuntimeError, match="ring is closed"):
+            ring.put(2)
+
+    def test_close_wakes_waiting_consumers(self) -> None:
+        """Test that close releases consumers blocked on an empty ring."""
+        ring: MpmcRing[int] = MpmcRing(4)
+        results: list[int | None] = []
+        consumers = [threading.Thread(target=lambda: results.append(ring.get())) for _ in range(3)]
+        for consumer in consumers:
+            consumer.start()
+
+        ring.close()
+        for consumer in consumers:
+            consumer.join(timeout=5.0)
+
+        assert results == [None, None, None]
+
+    def test_item_claimed_before_close_is_delivered(self) -> None:
+        """Test that a put claimed before close but filled after it still reaches a consumer."""
+        ring: MpmcRing[str] = MpmcRing(4)
+        fill = ring._fill
+        claimed = threading.Event()
+        release = threading.Event()
+
+        def slow_fill(pos: int, item: str) -> None:
+            claimed.set()
+            release.wait(timeout=5.0)
+            fill(pos, item)
+
+        ring._fill = slow_fill  # type: ignore[method-assign]
+        results: list[str | None] = []
+        producer = threading.Thread(target=ring.put, args=("late",))
+        consumer = threading.Thread(target=lambda: results.append(ring.get()))
+        producer.start()
+        claimed.wait(timeout=5.0)
+        consumer.start()
+        while ring._head == 0:
+            time.sleep(0.001)
+
+        ring.close()
+        time.sleep(0.05)
+        assert results == []
+        release.set()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+
+        assert results == ["late"]
+        assert ring.get() is None
+
+    def test_close_releases_blocked_producer(self) -> None:
+        """Test that a producer waiting on a full ring raises and consumers skip its positions."""
+        ring: MpmcRing[int] = MpmcRing(2)
+        ring.put_many([0, 1])
+        errors: list[Exception] = []
+
+        def produce() -> None:
+            try:
+                ring.put_many([2, 3])
+            except RuntimeError as e:
+                errors.append(e)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while ring._tail < 4:
+            time.sleep(0.001)
+
+        ring.close()
+        producer.join(timeout=5.0)
+
+        assert len(errors) == 1
+        assert [ring.get(), ring.get()] == [0, 1]
+        assert ring.get() is None
+
+    def test_many_producers_and_consumers(self) -> None:
+        """Test that every item is delivered exactly once across threads."""
+        ring: MpmcRing[int] = MpmcRing(8)
+        per_producer = 2000
+        producers = 4
+        received: list[list[int]] = [[] for _ in range(producers)]
+
+        def produce(offset: int) -> None:
+            for value in range(offset, offset + per_producer):
+                ring.put(value)
+
+        def consume(out: list[int]) -> None:
+            while (item := ring.get()) is not None:
+                out.append(item)
+
+        consumer_threads = [threading.Thread(target=consume, args=(out,)) for out in received]
+        producer_threads = [
+            threading.Thread(target=produce, args=(n * per_producer,)) for n in range(producers)
+        ]
+        for thread in consumer_threads + producer_threads:
+            thread.start()
+        for thread in producer_threads:
+            thread.join(timeout=10.0)
+        # Items queued before close are still handed out
+        ring.close()
+        for thread in consumer_threads:
+            thread.join(timeout=10.0)
+
+        items = [item for out in received for item in out]
+        assert sorted(items) == list(range(producers * per_producer))
+        # Each producer's items reach any one consumer in submission order
+        for out in received:
+            for n in range(producers):
+                own = [item for item in out if item // per_producer == n]
+                assert own == sorted(own)
@@ -1,7 +1,11 @@
 """Unit tests for the telemetryflow __init__.py module."""
 
+import subprocess
+import sys
 from unittest import mock
 
+import pytest
+
 from telemetryflow.domain.config import TelemetryConfig
 from telemetryflow.domain.credentials import Credentials
 
@@ -127,3 +131,39 @@ class TestExports:
         assert callable(new_from_env)
         assert callable(new_simple)
         assert callable(auto_instrument)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that names outside the lazy exports raise AttributeError."""
+        import telemetryflow
+
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            _ = telemetryflow.missing  # type: ignore[attr-defined]
+
+    def test_dir_lists_lazy_exports(self) -> None:
+        """Test that lazily exported names are listed before first access."""
+        import telemetryflow
+
+        assert {"TelemetryFlowClient", "TelemetryConfig", "new_client"} <= set(dir(telemetryflow))
+
+    def test_import_does_not_load_client(self) -> None:
+        """Test that importing the package defers loading the client."""
+        code = (
+            "import sys, telemetryflow; "
+            "assert 'telemetryflow.client' not in sys.modules; "
+            "telemetryflow.TelemetryFlowClient; "
+            "assert 'telemetryflow.client' in sys.modules"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_builder_import_does_not_load_opentelemetry(self) -> None:
+        """Test that the OpenTelemetry SDK is loaded when a client is created, not imported."""
+        code = (
+            "import sys; from telemetryflow import TelemetryFlowBuilder; "
+            "assert 'telemetryflow.infrastructure.handlers' not in sys.modules; "
+            "TelemetryFlowBuilder().with_api_key('tfk_a', 'tfs_b')"
+            ".with_endpoint('localhost:4317').with_service('svc').build(); "
+            "assert 'telemetryflow.infrastructure.handlers' in sys.modules"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)